@@ -2,20 +2,25 @@ import logging
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi.responses import Response
 
+from app.core.responses import PrevalidatedJSONResponse
 from app.core.token import get_current_user
+from app.domain.admin.schemas.dashboard_schemas import DashboardStatsResponseDTO
 from app.domain.admin.schemas.job_posting_schemas import (
     JobPostingResponseDTO,
     JobPostingUpdateSchema,
     RejectPostingCreateSchema,
     RejectPostingResponseDTO,
 )
+from app.domain.admin.schemas.monitoring_schemas import LoopOffenderResponseDTO
 from app.domain.admin.schemas.resume_schemas import ResumeResponseDTO
 from app.domain.admin.schemas.user_schemas import (
     UserResponseDTO,
     UserUnionResponseDTO,
     UserUpdateSchema,
 )
+from app.domain.admin.services.dashboard_services import get_dashboard_stats_service
 from app.domain.admin.services.job_posting_services import (
     create_reject_posting_by_id_service,
     delete_job_posting_by_id_service,
@@ -23,6 +28,10 @@ from app.domain.admin.services.job_posting_services import (
     get_job_posting_by_id_service,
     patch_job_posting_by_id_service,
 )
+from app.domain.admin.services.monitoring_services import (
+    get_loop_offenders_service,
+    get_profile_service,
+)
 from app.domain.admin.services.resume_services import (
     delete_resume_by_id_service,
     get_all_resumes_service,
@@ -48,6 +57,8 @@ logger = logging.getLogger(__name__)
     description="""
 `400` `code`: `search_too_long` 검색어는 100자 이하로 입력해야 합니다.\n
 `400` `code`: `invalid_query_params` seeker 또는 corp 중 하나는 true여야 합니다.\n
+`400` `code`: `invalid_offset` offset은 0 이상이어야 합니다.\n
+`400` `code`: `invalid_limit` limit는 1 이상 100 이하로 입력해주세요.\n
 `401` 인증이 필요합니다. (`auth_required`, `invalid_token`)\n
 `403` 권한이 없습니다. (`permission_denied`)
     """,
@@ -56,10 +67,17 @@ async def get_list_user(
     current_user: BaseUser = Depends(get_current_user),
     seeker: bool = Query(default=False),
     corp: bool = Query(default=False),
-    search: str = Query(default=None),
+    search: str = Query(default=None, description="이메일, 이름, 회사명, 담당자명 검색"),
+    offset: int = Query(0, description="페이지 번호 (0부터 시작)"),
+    limit: int = Query(10, description="페이지당 항목 수"),
 ):
-    logger.info(f"[API] 관리자 유저 조회 요청: seeker={seeker}, corp={corp}, search='{search}'")
-    return await get_user_all_service(current_user, seeker, corp, search)
+    logger.info(
+        f"[API] 관리자 유저 조회 요청: seeker={seeker}, corp={corp}, search='{search}', offset={offset}, limit={limit}"
+    )
+    users = await get_user_all_service(
+        current_user, seeker, corp, search, offset, limit
+    )
+    return PrevalidatedJSONResponse(users)
 
 
 @admin_router.get(
@@ -127,7 +145,8 @@ async def get_list_resumes(
     ),
 ):
     logger.info(f"[API] 관리자 이력서 전체 조회 요청")
-    return await get_all_resumes_service(current_user, user_id)
+    resumes = await get_all_resumes_service(current_user, user_id)
+    return PrevalidatedJSONResponse(resumes)
 
 
 @admin_router.get(
@@ -197,9 +216,10 @@ async def get_list_job_postings(
     logger.info(
         f"[API-LIST] 관리자 공고 조회, 검색 타입 : {search_type}, 검색 키워드 : {search_keyword}, 필터링 status : {status}"
     )
-    return await get_all_job_postings_service(
+    job_postings = await get_all_job_postings_service(
         current_user, search_type, search_keyword, status
     )
+    return PrevalidatedJSONResponse(job_postings)
 
 
 @admin_router.get(
@@ -299,3 +319,68 @@ async def create_reject_posting(
     return await create_reject_posting_by_id_service(
         id=id, reject_posting=reject_posting, current_user=current_user
     )
+
+
+@admin_router.get(
+    "/dashboard/",
+    response_model=DashboardStatsResponseDTO,
+    status_code=status.HTTP_200_OK,
+    summary="관리자 대시보드 통계 조회",
+    description="""
+유저 상태별, 공고 상태별, 최근 30일 일자별 지원자 수와 전체 이력서/지원자 수를 조회합니다.\n
+쓰기 시점에 갱신되는 redis 카운터를 읽으며, 주기 작업으로 DB 집계 값과 보정됩니다.\n
+`401` `code`:`auth_required` 인증이 필요합니다.\n
+`401` `code`:`invalid_token` 유효하지 않은 토큰입니다.\n
+`403` `code`:`permission_denied` 권한이 없습니다.
+""",
+)
+async def get_dashboard_stats(
+    current_user: BaseUser = Depends(get_current_user),
+):
+    logger.info(f"[API] 관리자 대시보드 통계 조회 요청 : 관리자_id={current_user.id}")
+    return await get_dashboard_stats_service(current_user)
+
+
+@admin_router.get(
+    "/monitoring/loop-offenders/",
+    response_model=List[LoopOffenderResponseDTO],
+    status_code=status.HTTP_200_OK,
+    summary="이벤트 루프 블로킹 위치 조회",
+    description="""
+이벤트 루프를 임계값 이상 블로킹한 코드 위치를 발생 횟수 순으로 조회합니다. (전체 워커 합산)\n
+`400` `code`:`invalid_limit` limit는 1 이상 100 이하로 입력해주세요.\n
+`401` `code`:`auth_required` 인증이 필요합니다.\n
+`401` `code`:`invalid_token` 유효하지 않은 토큰입니다.\n
+`403` `code`:`permission_denied` 권한이 없습니다.
+""",
+)
+async def get_loop_offenders(
+    current_user: BaseUser = Depends(get_current_user),
+    limit: int = Query(20, description="조회할 위치 수"),
+):
+    logger.info(f"[API] 이벤트 루프 블로킹 위치 조회 요청 : 관리자_id={current_user.id}")
+    return await get_loop_offenders_service(current_user, limit)
+
+
+@admin_router.get(
+    "/monitoring/profiles/{profile_id}/",
+    status_code=status.HTTP_200_OK,
+    summary="요청 프로파일 조회",
+    description="""
+관리자 토큰으로 `X-Profile: 1` 헤더 또는 `?profile=1` 을 붙여 보낸 요청의 프로파일을 조회합니다.\n
+프로파일 id 는 해당 요청의 응답 헤더 `X-Profile-Id` 로 전달되며, 1시간 보관됩니다.\n
+응답은 speedscope(https://www.speedscope.app) 에서 flame graph 로 열 수 있는 JSON 입니다.\n
+프로파일링은 전체 분당 횟수가 제한되며, 초과 시 프로파일 없이 처리됩니다.\n
+`401` `code`:`auth_required` 인증이 필요합니다.\n
+`401` `code`:`invalid_token` 유효하지 않은 토큰입니다.\n
+`403` `code`:`permission_denied` 권한이 없습니다.\n
+`404` `code`:`profile_not_found` 존재하지 않거나 만료된 프로파일입니다.
+""",
+)
+async def get_request_profile(
+    current_user: BaseUser = Depends(get_current_user),
+    profile_id: str = Path(..., pattern="^[0-9a-f]{32}$", description="프로파일 ID"),
+):
+    logger.info(f"[API] 요청 프로파일 조회 요청 : 관리자_id={current_user.id}")
+    profile = await get_profile_service(current_user, profile_id)
+    return Response(content=profile, media_type="application/json")
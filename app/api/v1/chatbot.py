@@ -1,11 +1,19 @@
 import logging
 from typing import List
 
-from fastapi import APIRouter, Depends, Path, status
+from fastapi import APIRouter, Depends, Path, Request, status
 
+from app.core.http_cache import (
+    PRIVATE_REVALIDATE,
+    conditional_get,
+    latest_updated_at,
+    resource_key,
+)
 from app.core.token import get_current_user
+from app.domain.chatbot.model import ChatBot
 from app.domain.chatbot.schemas import ChatBotCreateUpdate, ChatBotResponseDTO
 from app.domain.chatbot.services import (
+    check_chatbot_admin_service,
     create_chatbot_by_id_service,
     delete_chatbot_by_id_service,
     get_all_chatbots_service,
@@ -47,6 +55,7 @@ async def create_chatbot(
     summary="챗봇 프롬프트 조회",
     description=(
         """
+`304` If-None-Match / If-Modified-Since 가 현재 목록과 일치 (본문 없음).\n
 `400` `code`:`required_field` 필수 필드 누락\n
 `401` `code`:`auth_required` 인증이 필요합니다.\n
 `401` `code`:`invalid_token` 유효하지 않은 토큰입니다.\n
@@ -54,9 +63,21 @@ async def create_chatbot(
     """
     ),
 )
-async def get_list_chatbots(current_user: BaseUser = Depends(get_current_user)):
+async def get_list_chatbots(
+    request: Request, current_user: BaseUser = Depends(get_current_user)
+):
     logger.info(f"[API] 관리자 챗봇 프롬프트 전체 조회 요청: 관리자_id={current_user.id}")
-    return await get_all_chatbots_service(current_user)
+    return await conditional_get(
+        request,
+        resource_key(ChatBot),
+        load=lambda: get_all_chatbots_service(current_user),
+        serialize=lambda chatbots: [
+            ChatBotResponseDTO.model_validate(c) for c in chatbots
+        ],
+        policy=PRIVATE_REVALIDATE,
+        on_cache_hit=lambda: check_chatbot_admin_service(current_user),
+        last_modified=latest_updated_at,
+    )
 
 
 @chatbot_router.patch(
@@ -1,10 +1,13 @@
 import logging
-from typing import List
 
-from fastapi import APIRouter, Depends, Path, status
+from fastapi import APIRouter, Depends, Path, Query, status
 
 from app.core.token import get_current_user
-from app.domain.comment.schemas import CommentCreateUpdateSchema, CommentResponseDTO
+from app.domain.comment.schemas import (
+    CommentCreateUpdateSchema,
+    CommentListResponseDTO,
+    CommentResponseDTO,
+)
 from app.domain.comment.services import (
     create_comment_by_id_service,
     delete_comment_by_id_service,
@@ -45,10 +48,13 @@ async def create_comment(
 @comment_router.get(
     "/",
     status_code=status.HTTP_200_OK,
-    response_model=List[CommentResponseDTO],
-    summary="자유게시판 조회",
+    response_model=CommentListResponseDTO,
+    summary="자유게시판 댓글 목록 조회",
     description=(
         """
+최신순으로 조회하며, 다음 페이지는 응답의 `next_cursor` 를 `cursor` 로 전달해 조회합니다.\n
+`400` `code`:`invalid_cursor` 유효하지 않은 cursor 입니다.\n
+`400` `code`:`invalid_limit` limit는 1 이상 100 이하로 입력해주세요.\n
 `401` `code`:`auth_required` 인증이 필요합니다.\n
 `401` `code`:`invalid_token` 유효하지 않은 토큰입니다.\n
 `422` : Unprocessable Entity
@@ -58,9 +64,11 @@ async def create_comment(
 async def get_list_comments(
     current_user: BaseUser = Depends(get_current_user),
     id: int = Path(..., gt=0, le=2147483647, description="comment ID (1 ~ 2147483647)"),
+    cursor: str = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(20, description="페이지당 댓글 수"),
 ):
-    logger.info(f"[API] 댓글 전체 조회 요청: user_id={current_user.id}, board_id={id}")
-    return await get_all_comments_service(id=id)
+    logger.info(f"[API] 댓글 목록 조회 요청: user_id={current_user.id}, board_id={id}")
+    return await get_all_comments_service(id=id, cursor=cursor, limit=limit)
 
 
 @comment_router.patch(
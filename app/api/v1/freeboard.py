@@ -1,16 +1,26 @@
 import logging
 from typing import List
 
-from fastapi import APIRouter, Depends, Path, status
+from fastapi import APIRouter, Depends, Path, Query, Request, status
 
+from app.core.http_cache import PRIVATE_REVALIDATE, conditional_get, resource_key
 from app.core.token import get_current_user
-from app.domain.free_board.schemas import FreeBoardCreateUpdate, FreeBoardResponseDTO
+from app.domain.free_board.models import FreeBoard
+from app.domain.free_board.schemas import (
+    FreeBoardCreateUpdate,
+    FreeBoardFeedItemDTO,
+    FreeBoardFeedResponseDTO,
+    FreeBoardResponseDTO,
+)
 from app.domain.free_board.services import (
     create_free_board_by_id_service,
     delete_free_board_by_id_service,
     get_all_free_board_service,
     get_free_board_by_id_service,
+    get_free_board_feed_service,
+    get_popular_free_boards_service,
     patch_free_board_by_id_service,
+    record_free_board_view_service,
 )
 from app.domain.user.models import BaseUser
 
@@ -56,12 +66,56 @@ async def get_list_free_board(current_user: BaseUser = Depends(get_current_user)
     return await get_all_free_board_service()
 
 
+@free_board_router.get(
+    "/feed/",
+    response_model=FreeBoardFeedResponseDTO,
+    status_code=status.HTTP_200_OK,
+    summary="자유게시판 목록 피드 조회",
+    description="""
+본문을 제외한 제목, 작성자, 이미지, 조회수, 댓글 수만 최신순으로 조회합니다.\n
+다음 페이지는 응답의 `next_cursor` 를 `cursor` 로 전달해 조회합니다.\n
+`400` `code`:`invalid_cursor` 유효하지 않은 cursor 입니다.\n
+`400` `code`:`invalid_limit` limit는 1 이상 100 이하로 입력해주세요.\n
+`401` `code`:`auth_required` 인증이 필요합니다.\n
+`401` `code`:`invalid_token` 유효하지 않은 토큰입니다.\n
+    """,
+)
+async def get_free_board_feed(
+    current_user: BaseUser = Depends(get_current_user),
+    cursor: str = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(10, description="페이지당 항목 수"),
+):
+    logger.info(f"[API] 자유게시판 피드 조회 요청: user_id={current_user.id}, cursor={cursor}")
+    return await get_free_board_feed_service(cursor, limit)
+
+
+@free_board_router.get(
+    "/popular/",
+    response_model=List[FreeBoardFeedItemDTO],
+    status_code=status.HTTP_200_OK,
+    summary="자유게시판 인기글 조회",
+    description="""
+조회, 댓글 이벤트를 시간 감쇠(반감기 1일)로 합산한 인기순 상위 글을 조회합니다.\n
+`400` `code`:`invalid_limit` limit는 1 이상 100 이하로 입력해주세요.\n
+`401` `code`:`auth_required` 인증이 필요합니다.\n
+`401` `code`:`invalid_token` 유효하지 않은 토큰입니다.\n
+    """,
+)
+async def get_popular_free_boards(
+    current_user: BaseUser = Depends(get_current_user),
+    limit: int = Query(10, description="조회할 글 수"),
+):
+    logger.info(f"[API] 자유게시판 인기글 조회 요청: user_id={current_user.id}, limit={limit}")
+    return await get_popular_free_boards_service(limit)
+
+
 @free_board_router.get(
     "/{id}/",
     response_model=FreeBoardResponseDTO,
     status_code=status.HTTP_200_OK,
     summary="자유게시판 상세 조회",
     description="""
+`304` If-None-Match / If-Modified-Since 가 현재 게시글과 일치 (본문 없음).\n
 `401` `code`:`auth_required` 인증이 필요합니다.\n
 `401` `code`:`invalid_token` 유효하지 않은 토큰입니다.\n
 `404` `code`:`free_board_not_found` 존재하지 않는 자유게시판 입니다..\n
@@ -69,13 +123,21 @@ async def get_list_free_board(current_user: BaseUser = Depends(get_current_user)
     """,
 )
 async def get_detail_free_board(
+    request: Request,
     current_user: BaseUser = Depends(get_current_user),
     id: int = Path(
         ..., gt=0, le=2147483647, description="free_board ID (1 ~ 2147483647)"
     ),
 ):
     logger.info(f"[API] 자유게시판 상세 조회 요청: user_id={current_user.id}, board_id={id}")
-    return await get_free_board_by_id_service(id)
+    return await conditional_get(
+        request,
+        resource_key(FreeBoard, id),
+        load=lambda: get_free_board_by_id_service(id),
+        serialize=FreeBoardResponseDTO.model_validate,
+        policy=PRIVATE_REVALIDATE,
+        on_cache_hit=lambda: record_free_board_view_service(id),
+    )
 
 
 @free_board_router.patch(
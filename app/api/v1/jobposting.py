@@ -1,10 +1,16 @@
 import logging
+from typing import Optional
 
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query
 
+from app.core.responses import PrevalidatedJSONResponse
 from app.core.token import get_current_user
 from app.domain.job_posting.repository import get_corporate_user_by_base_user
-from app.domain.job_posting.schema import JobPostingCreateUpdate, JobPostingResponse
+from app.domain.job_posting.schema import (
+    JOB_POSTING_RESPONSE_FIELDS,
+    JobPostingCreateUpdate,
+    JobPostingResponse,
+)
 from app.domain.job_posting.services import (
     create_job_posting,
     delete_job_posting,
@@ -49,15 +55,19 @@ async def create_job_posting_endpoint(
     "/",
     response_model=list[JobPostingResponse],
     summary="내 회사의 전체 공고 조회",
+    description="`400` `code`: `invalid_fields` - 선택할 수 없는 응답 필드입니다.",
 )
 async def get_my_company_job_postings(
+    fields: Optional[str] = Query(
+        None, description=JOB_POSTING_RESPONSE_FIELDS.description
+    ),
     current_user: BaseUser = Depends(get_current_user),
 ):
     logger.info(f"[API] 내 회사 전체 공고 조회 요청 : BaseUser id={current_user.id}")
     corporate_user = await get_corporate_user_by_base_user(current_user)
-    result = await get_job_postings_by_company_user(corporate_user)
+    result = await get_job_postings_by_company_user(corporate_user, fields)
     logger.info(f"[API] 내 회사 전체 공고 조회 완료 : CorporateUser id={corporate_user.id}")
-    return result
+    return PrevalidatedJSONResponse(result)
 
 
 @job_posting_router.get(
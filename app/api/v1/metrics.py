@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from app.core.metrics import CONTENT_TYPE_LATEST, METRICS_PATH, render_metrics
+
+metrics_router = APIRouter(tags=["metrics"])
+
+
+@metrics_router.get(METRICS_PATH, include_in_schema=False)
+async def get_metrics():
+    # prometheus 스크래핑용, nginx 에서는 외부 노출을 막는다
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
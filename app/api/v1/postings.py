@@ -1,20 +1,30 @@
 import logging
+from datetime import date
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi import APIRouter, Depends, Path, Query, Request, status
 
+from app.core.http_cache import PUBLIC_REVALIDATE, conditional_get, resource_key
+from app.core.rate_limit import SEARCH_PER_CLIENT, limit_by_user_or_ip
+from app.core.responses import PrevalidatedJSONResponse, encode_json
+from app.core.single_flight import SingleFlight, request_key
 from app.core.token import get_current_user, get_optional_user
+from app.domain.job_posting.models import JobPosting
 from app.domain.posting.schemas import (
+    JOB_POSTING_FIELDS,
     ApplicantCreateUpdateSchema,
     ApplicantResponseDTO,
-    JobPostingResponseDTO,
+    JobPostingDetailResponseDTO,
     PaginatedJobPostingsResponseDTO,
+    RecommendedPostingsResponseDTO,
 )
 from app.domain.posting.services import (
     create_applicant_service,
     get_all_postings_service,
     get_posting_by_id_service,
+    get_recommended_postings_service,
     patch_posting_applicant_by_id_service,
+    record_posting_view_service,
 )
 from app.domain.user.models import BaseUser
 
@@ -25,9 +35,18 @@ posting_router = APIRouter(
 
 logger = logging.getLogger(__name__)
 
+# 같은 조건의 동시 목록 요청은 한 번만 조회/직렬화하고 응답 바이트를 나눠 쓴다
+posting_list_flight = SingleFlight("posting_list", distributed=True)
+
+
+def has_search(request: Request) -> bool:
+    # 검색어 LIKE 조회만 제한하고 일반 목록 탐색은 제한하지 않는다
+    return bool(request.query_params.get("search_keyword"))
+
 
 @posting_router.get(
     "/",
+    dependencies=[Depends(limit_by_user_or_ip(SEARCH_PER_CLIENT, when=has_search))],
     response_model=PaginatedJobPostingsResponseDTO,
     status_code=status.HTTP_200_OK,
     summary="공고 전체 조회",
@@ -40,10 +59,14 @@ logger = logging.getLogger(__name__)
 `400` `code`:``invalid_view_count` view_count는 0 이상이어야 합니다.\n
 `400` `code`:``invalid_offset` offset은 0 이상이어야 합니다.\n
 `400` `code`:``invalid_limit` limit는 1 이상 100 이하로 입력해주세요.\n
+`400` `code`:``invalid_fields` 선택할 수 없는 응답 필드입니다.\n
+`400` `code`:``invalid_query_params` sort 값 또는 마감일 범위가 올바르지 않습니다.\n
 `401` `code`:`invalid_token` 유효하지 않은 토큰입니다.\n
+`429` `code`:`too_many_requests` 검색 요청이 너무 많습니다 (Retry-After 초 후 재시도).\n
     """,
 )
 async def get_list_postings(
+    request: Request,
     search_keyword: str = Query("", description="검색 키워드 (제목, 회사, 요약, 위치 등)"),
     location: str = Query("", description="지역 필터"),
     employment_type: str = Query("", description="고용 형태: 공공, 일반(,로 구분하여 다중 가능)"),
@@ -56,44 +79,98 @@ async def get_list_postings(
     employ_method: str = Query(
         "", description="근로 형태: 정규직, 계약직, 일용직, 프리랜서, 파견직, (,로 구분하여 다중 가능)"
     ),
+    fields: Optional[str] = Query(None, description=JOB_POSTING_FIELDS.description),
+    deadline_after: Optional[date] = Query(
+        None, description="이 날짜 이후(포함) 마감 (YYYY-MM-DD)"
+    ),
+    deadline_before: Optional[date] = Query(
+        None, description="이 날짜 이전(포함) 마감 (YYYY-MM-DD)"
+    ),
+    sort: str = Query(
+        "latest", description="정렬: latest(최신순), closing_soon(마감 임박순, 지난 공고 제외)"
+    ),
     current_user: Optional[BaseUser] = Depends(get_optional_user),
 ):
     logger.info(
         f"[API] 공고 전체 조회 요청 (search={search_keyword}, location={location}, position={position})"
     )
-    return await get_all_postings_service(
-        search_keyword=search_keyword,
-        location=location,
-        employment_type=employment_type,
-        position=position,
-        career=career,
-        education=education,
-        view_count=view_count,
-        employ_method=employ_method,
-        offset=offset,
-        limit=limit,
-        current_user=current_user,
-    )
+
+    async def load() -> bytes:
+        postings = await get_all_postings_service(
+            search_keyword=search_keyword,
+            location=location,
+            employment_type=employment_type,
+            position=position,
+            career=career,
+            education=education,
+            view_count=view_count,
+            employ_method=employ_method,
+            offset=offset,
+            limit=limit,
+            current_user=current_user,
+            fields=fields,
+            deadline_after=deadline_after,
+            deadline_before=deadline_before,
+            sort=sort,
+        )
+        return encode_json(postings)
+
+    body = await posting_list_flight.do(request_key(request, current_user), load)
+    return PrevalidatedJSONResponse(body)
+
+
+@posting_router.get(
+    "/recommended/",
+    response_model=RecommendedPostingsResponseDTO,
+    status_code=status.HTTP_200_OK,
+    summary="맞춤 공고 추천",
+    description="""
+관심 분야, 이력서의 희망 지역, 북마크한 공고와 비슷한 모집 중인 공고를 유사도 순으로 반환합니다.
+북마크한 공고는 제외합니다.\n
+`400` `code`:``invalid_limit` limit는 1 이상 100 이하로 입력해주세요.\n
+`400` `code`:``invalid_fields` 선택할 수 없는 응답 필드입니다.\n
+`401` `code`:`invalid_token` 유효하지 않은 토큰입니다.\n
+`404` `code`:`user_not_found` 유저를 찾을 수 없습니다.\n
+    """,
+)
+async def get_recommended_postings(
+    limit: int = Query(10, description="추천 공고 수 (1 ~ 100)"),
+    fields: Optional[str] = Query(None, description=JOB_POSTING_FIELDS.description),
+    current_user: BaseUser = Depends(get_current_user),
+):
+    logger.info(f"[API] 맞춤 공고 추천 요청: user_id={current_user.id}, limit={limit}")
+    postings = await get_recommended_postings_service(current_user, limit, fields)
+    return PrevalidatedJSONResponse(postings)
 
 
 @posting_router.get(
     "/{id}/",
-    response_model=JobPostingResponseDTO,
+    response_model=JobPostingDetailResponseDTO,
     status_code=status.HTTP_200_OK,
     summary="공고 상세 조회",
     description="""
+similar_posting_ids: 포지션, 지역, 고용 형태, 경력, 제목이 비슷한 모집 중인 공고 id (유사도 순, 최대 10개).\n
+`304` If-None-Match / If-Modified-Since 가 현재 공고와 일치 (본문 없음).\n
 `401` `code`:`invalid_token` 유효하지 않은 토큰입니다.\n
 `404` `code`:`posting_not_found` 공고를 찾지 못했습니다..\n
 `422` : Unprocessable Entity
     """,
 )
 async def get_posting(
+    request: Request,
     id: int = Path(
         ..., gt=0, le=2147483647, description="job_posting ID (1 ~ 2147483647)"
     ),
 ):
     logger.info(f"[API] 공고 상세 조회 요청: job_posting_id={id}")
-    return await get_posting_by_id_service(id)
+    return await conditional_get(
+        request,
+        resource_key(JobPosting, id),
+        load=lambda: get_posting_by_id_service(id),
+        serialize=JobPostingDetailResponseDTO.model_validate,
+        policy=PUBLIC_REVALIDATE,
+        on_cache_hit=lambda: record_posting_view_service(id),
+    )
 
 
 @posting_router.post(
@@ -1,8 +1,10 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
 
+from app.core.http_cache import PRIVATE_REVALIDATE, conditional_get, resource_key
 from app.core.token import get_current_user
+from app.domain.success_review.models import SuccessReview
 from app.domain.success_review.schemas import (
     SuccessReviewCreateUpdateSchema,
     SuccessReviewResponseSchema,
@@ -11,8 +13,10 @@ from app.domain.success_review.services import (
     create_success_review_by_id,
     delete_success_review_by_id,
     get_all_success_reviews,
+    get_popular_success_reviews,
     get_success_review_by_id,
     patch_success_review_by_id,
+    record_success_review_view,
 )
 from app.domain.user.models import SeekerUser
 
@@ -53,22 +57,50 @@ async def get_list_success_reviews(
     return await get_all_success_reviews(current_user)
 
 
+@success_review_router.get(
+    "/popular/",
+    response_model=List[SuccessReviewResponseSchema],
+    summary="성공 후기 인기글 조회",
+    status_code=status.HTTP_200_OK,
+    description="""
+조회 이벤트를 시간 감쇠(반감기 1일)로 합산한 인기순 상위 글을 조회합니다.\n
+`400` `code`:`invalid_limit` limit는 1 이상 100 이하로 입력해주세요.\n
+`401` `code`:`auth_required` 인증이 필요합니다.\n
+`401` `code`:`invalid_token` 유효하지 않은 토큰입니다.\n
+    """,
+)
+async def get_list_popular_success_reviews(
+    limit: int = Query(10, description="조회할 글 수"),
+    current_user: SeekerUser = Depends(get_current_user),
+):
+    return await get_popular_success_reviews(limit, current_user)
+
+
 @success_review_router.get(
     "/{id}/",
     response_model=SuccessReviewResponseSchema,
     summary="자유게시판 글 상세 조회",
     status_code=status.HTTP_200_OK,
     description="""
+`304` If-None-Match / If-Modified-Since 가 현재 후기와 일치 (본문 없음).\n
 `401` `code`:`auth_required` 인증이 필요합니다.\n
 `401` `code`:`invalid_token` 유효하지 않은 토큰입니다.\n
 `404` `code`:`success_review_not_found` 존재하지 않는 성공 후기 입니다.\n
     """,
 )
 async def get_success_review(
+    request: Request,
     id: int,
     current_user: SeekerUser = Depends(get_current_user),
 ):
-    return await get_success_review_by_id(id, current_user)
+    return await conditional_get(
+        request,
+        resource_key(SuccessReview, id),
+        load=lambda: get_success_review_by_id(id, current_user),
+        serialize=SuccessReviewResponseSchema.model_validate,
+        policy=PRIVATE_REVALIDATE,
+        on_cache_hit=lambda: record_success_review_view(id),
+    )
 
 
 @success_review_router.patch(
@@ -5,6 +5,13 @@ from fastapi import APIRouter, Body, Depends, Query, Request, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, EmailStr
 
+from app.core.rate_limit import (
+    BUSINESS_VERIFY_PER_IP,
+    EMAIL_CODE_PER_IP,
+    LOGIN_PER_IP,
+    client_ip,
+    limit_by_ip,
+)
 from app.core.token import get_current_user
 from app.domain.services.business_verify import verify_business_number
 from app.domain.services.social_account import (
@@ -91,6 +98,7 @@ class EmailVerifyRequest(BaseModel):
 
 @router.post(
     "/register/",
+    dependencies=[Depends(limit_by_ip(EMAIL_CODE_PER_IP))],
     response_model=UserUnionResponseDTO,
     status_code=status.HTTP_201_CREATED,
     summary="회원가입(공통)",
@@ -99,6 +107,7 @@ class EmailVerifyRequest(BaseModel):
 `400` `code`:`invalid_password` : 비밀번호 형식이 올바르지 않습니다\n
 `400` `code`:`password_mismatch` : 비밀번호와 비밀번호 확인이 일치하지 않습니다\n
 `422` 'code': Unprocessable Entity : 입력값이 잘못되어 요청을 처리할 수 없습니다
+`429` `code`:`too_many_requests` : 요청이 너무 많습니다 (Retry-After 초 후 재시도)
 """,
 )
 async def register(request: UserRegisterRequest):
@@ -178,12 +187,14 @@ async def find_email_route(request: FindEmailRequest):
 
 @router.post(
     "/find-password/",
+    dependencies=[Depends(limit_by_ip(EMAIL_CODE_PER_IP))],
     response_model=FindPasswordResponseDTO,
     status_code=status.HTTP_200_OK,
     summary="비밀번호 찾기",
     description="""
 `404` `code`:`user_not_found` : 일치하는 사용자 정보가 없습니다\n
 `422` 'code': Unprocessable Entity : 입력값이 잘못되어 요청을 처리할 수 없습니다
+`429` `code`:`too_many_requests` : 요청이 너무 많습니다 (Retry-After 초 후 재시도)
 """,
 )
 async def find_password_route(request: FindPasswordRequest):
@@ -300,6 +311,7 @@ async def update_profile(
 
 @router.post(
     "/login/",
+    dependencies=[Depends(limit_by_ip(LOGIN_PER_IP))],
     response_model=LoginResponseDTO,
     status_code=status.HTTP_200_OK,
     summary="로그인",
@@ -308,12 +320,13 @@ async def update_profile(
 `403` `code`:`unverified_or_inactive_account` : 이메일 인증이 완료되지 않았거나 계정이 활성화되지 않았습니다\n
 `404` `code`:`user_not_found` : 유저를 찾을 수 없습니다\n
 `422` 'code': Unprocessable Entity : 입력값이 잘못되어 요청을 처리할 수 없습니다
+`429` `code`:`too_many_requests` : 요청이 너무 많습니다 (Retry-After 초 후 재시도)
 """,
 )
-async def login(request: LoginRequest):
+async def login(request: LoginRequest, http_request: Request):
     logger.info(f"[API] 사용자 로그인 요청")
     dto, access_token, refresh_token = await login_user(
-        email=request.email, password=request.password
+        email=request.email, password=request.password, ip=client_ip(http_request)
     )
     response = JSONResponse(content=dto.model_dump())
     set_token_cookies(response, access_token=access_token, refresh_token=refresh_token)
@@ -389,12 +402,14 @@ async def verify_email(request: EmailVerifyRequest):
 
 @router.post(
     "/resend-email-code/",
+    dependencies=[Depends(limit_by_ip(EMAIL_CODE_PER_IP))],
     response_model=ResendEmailResponseDTO,
     status_code=status.HTTP_200_OK,
     summary="재인증 코드 발송",
     description="""
 `400` `code`:`already_verified` : 이미 인증된 계정입니다.\n
 `404` `code`:`user_not_found` : 가입된 이메일이 아닙니다.\n
+`429` `code`:`too_many_requests` : 요청이 너무 많습니다 (Retry-After 초 후 재시도)
 """,
 )
 async def resend_email_code(request: ResendEmailRequest):
@@ -404,6 +419,7 @@ async def resend_email_code(request: ResendEmailRequest):
 
 @router.post(
     "/business-verify/",
+    dependencies=[Depends(limit_by_ip(BUSINESS_VERIFY_PER_IP))],
     response_model=BusinessVerifyResponse,
     status_code=status.HTTP_200_OK,
     summary="사업자 등록번호 검증",
@@ -413,6 +429,7 @@ async def resend_email_code(request: ResendEmailRequest):
 `400` `code`:`invalid_business_number` : 국세청에 등록되지 않은 사업자등록번호입니다.\n
 `500` `code`:`external_api_error` : 국세청 API 호출 실패\n
 `422` 'code': Unprocessable Entity : 입력값이 잘못되어 요청을 처리할 수 없습니다
+`429` `code`:`too_many_requests` : 요청이 너무 많습니다 (Retry-After 초 후 재시도)
 """,
 )
 async def business_verify(request: BusinessVerifyRequest):
@@ -0,0 +1,221 @@
+"""
+과부하 시 요청 수락 제어 (load shedding).
+
+워커마다 DB 커넥션 풀 대기 시간(감쇠 EWMA)과 라우트 등급별 처리 중 요청 수를 추적한다.
+과부하 단계가 올라가면 낮은 등급부터 라우터에 들어가기 전에 503 + Retry-After 로 돌려보내,
+풀이 찬 상태에서도 로그인/회원 인증과 지원하기 요청은 풀을 기다릴 자리를 얻게 한다.
+
+- 1단계 (풀 대기 >= 임계값 또는 처리 중 >= 상한): 비로그인 조회, 관리자 목록 거절
+- 2단계 (풀 대기 >= 임계값 x4 또는 처리 중 >= 상한 x2): 일반 요청도 거절
+- 인증(/api/user/)과 지원(/api/postings/{id}/applicant/)은 거절하지 않는다
+"""
+
+import functools
+import json
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import jwt
+from fastapi.security.utils import get_authorization_scheme_param
+from prometheus_client import Counter, Gauge, Histogram
+from starlette.requests import cookie_parser
+
+from app.core.metrics import METRICS_PATH
+from app.core.settings import settings
+from app.core.token import ALGORITHM, SECRET_KEY
+from app.exceptions.server_exceptions import ServerOverloadedException
+
+WAIT_HALF_LIFE = 1.0  # 초: 표본이 없으면 풀 대기 추정치가 이 주기로 반감
+WAIT_ALPHA = 0.2
+SEVERE_FACTOR = 4  # 풀 대기가 임계값의 이 배수를 넘으면 2단계
+IN_FLIGHT_SEVERE_FACTOR = 2
+
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "DB 커넥션 풀 획득 대기 시간",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+ADMISSION_IN_FLIGHT = Gauge(
+    "admission_in_flight",
+    "라우트 등급별 처리 중 요청 수",
+    ["route_class"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_SHED = Counter(
+    "admission_shed_total", "과부하로 거절한 요청 수", ["route_class", "level"]
+)
+
+
+@dataclass(frozen=True)
+class RouteClass:
+    name: str
+    shed_at: Optional[int]  # 이 과부하 단계부터 거절 (None 이면 거절하지 않음)
+
+
+CRITICAL = RouteClass("critical", None)
+NORMAL = RouteClass("normal", 2)
+ANONYMOUS_BROWSE = RouteClass("anonymous_browse", 1)
+ADMIN_LIST = RouteClass("admin_list", 1)
+
+
+def classify(method: str, path: str, authenticated: bool) -> RouteClass:
+    if path.startswith("/api/user/"):
+        return CRITICAL
+    if path.startswith("/api/postings/") and "/applicant/" in path:
+        return CRITICAL
+    if method == "GET":
+        if path.startswith("/api/admin/"):
+            return ADMIN_LIST
+        if not authenticated:
+            return ANONYMOUS_BROWSE
+    return NORMAL
+
+
+class AdmissionController:
+    def __init__(self, pool_wait_threshold: float, max_in_flight: int):
+        self.pool_wait_threshold = pool_wait_threshold
+        self.max_in_flight = max_in_flight
+        self.in_flight: Dict[str, int] = {}
+        self._wait_ewma = 0.0
+        self._wait_at = time.monotonic()
+
+    def record_pool_wait(self, seconds: float):
+        DB_POOL_WAIT.observe(seconds)
+        current = self.pool_wait()
+        self._wait_ewma = current + WAIT_ALPHA * (seconds - current)
+        self._wait_at = time.monotonic()
+
+    def pool_wait(self) -> float:
+        """최근 풀 대기 시간 추정치 (거절로 표본이 끊겨도 시간이 지나면 내려간다)"""
+        elapsed = time.monotonic() - self._wait_at
+        return self._wait_ewma * 0.5 ** (elapsed / WAIT_HALF_LIFE)
+
+    def overload_level(self) -> int:
+        wait = self.pool_wait()
+        in_flight = sum(self.in_flight.values())
+        if (
+            wait >= self.pool_wait_threshold * SEVERE_FACTOR
+            or in_flight >= self.max_in_flight * IN_FLIGHT_SEVERE_FACTOR
+        ):
+            return 2
+        if wait >= self.pool_wait_threshold or in_flight >= self.max_in_flight:
+            return 1
+        return 0
+
+    def should_shed(self, route_class: RouteClass) -> Optional[int]:
+        """거절해야 하면 현재 과부하 단계, 아니면 None"""
+        if route_class.shed_at is None:
+            return None
+        level = self.overload_level()
+        return level if level >= route_class.shed_at else None
+
+    def enter(self, route_class: RouteClass):
+        self.in_flight[route_class.name] = self.in_flight.get(route_class.name, 0) + 1
+        ADMISSION_IN_FLIGHT.labels(route_class.name).inc()
+
+    def leave(self, route_class: RouteClass):
+        self.in_flight[route_class.name] -= 1
+        ADMISSION_IN_FLIGHT.labels(route_class.name).dec()
+
+
+admission = AdmissionController(
+    pool_wait_threshold=settings.ADMISSION_POOL_WAIT_MS / 1000,
+    max_in_flight=settings.ADMISSION_MAX_IN_FLIGHT,
+)
+
+
+def instrument_db_pool():
+    """Tortoise 가 커넥션을 빌릴 때마다 풀 대기 시간을 기록"""
+    from tortoise.backends.base.client import PoolConnectionWrapper
+
+    func = PoolConnectionWrapper.__aenter__
+    if getattr(func, "_instrumented", False):
+        return
+
+    @functools.wraps(func)
+    async def wrapper(self):
+        start = time.perf_counter()
+        try:
+            return await func(self)
+        finally:
+            admission.record_pool_wait(time.perf_counter() - start)
+
+    wrapper._instrumented = True
+    PoolConnectionWrapper.__aenter__ = wrapper
+
+
+def is_authenticated(headers) -> bool:
+    """
+    서명과 만료가 유효한 access token (Authorization 헤더 또는 access_token 쿠키) 이 있으면 로그인 요청.
+    아무 값이나 보내 거절을 피하지 못하도록 검증하되, DB/Redis 조회(블랙리스트 등)는 하지 않는다.
+    """
+    token = None
+    for name, value in headers:
+        if name == b"authorization":
+            scheme, param = get_authorization_scheme_param(value.decode("latin-1"))
+            if scheme.lower() == "bearer":
+                token = param
+                break
+        elif name == b"cookie" and token is None:
+            token = cookie_parser(value.decode("latin-1")).get("access_token")
+    if not token:
+        return False
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except jwt.PyJWTError:
+        return False
+    # refresh/비밀번호 재설정 토큰은 같은 키로 서명되지만 user_type 이 없다
+    return payload.get("sub") is not None and "user_type" in payload
+
+
+class AdmissionMiddleware:
+    """라우터/의존성(토큰 조회 등)에 들어가기 전에 거절해 풀과 Redis 를 건드리지 않는다"""
+
+    def __init__(self, app, controller: AdmissionController = admission):
+        self.app = app
+        self.controller = controller
+        # custom_exception_handler 와 같은 본문 형식
+        exc = ServerOverloadedException()
+        self._status = exc.status_code
+        self._body = json.dumps(
+            {"message": {"error": exc.error, "code": exc.code}}, ensure_ascii=False
+        ).encode()
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["path"] == METRICS_PATH
+            or not settings.ADMISSION_ENABLED
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        authenticated = is_authenticated(scope["headers"])
+        route_class = classify(scope["method"], scope["path"], authenticated)
+        level = self.controller.should_shed(route_class)
+        if level is not None:
+            # 과부하 중 요청마다 로그를 남기지 않도록 메트릭으로만 기록
+            ADMISSION_SHED.labels(route_class.name, str(level)).inc()
+            await self._reject(send)
+            return
+
+        self.controller.enter(route_class)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.leave(route_class)
+
+    async def _reject(self, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self._status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(self._body)).encode()),
+                    (b"retry-after", str(settings.ADMISSION_RETRY_AFTER).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": self._body})
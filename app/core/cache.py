@@ -0,0 +1,292 @@
+"""
+2단 읽기 캐시 (프로세스 내 LRU -> Redis) 와 태그 기반 무효화.
+
+저장소의 단건 조회 함수에 @cached(family, tags) 를 붙이면
+L1(워커 메모리, 짧은 TTL) -> L2(Redis, pickle) -> DB 순으로 읽고 양쪽에 채운다.
+값은 pickle 바이트로 보관하고 꺼낼 때마다 새 객체로 복원하므로,
+호출자가 돌려받은 모델을 고쳐도(조회수 증가 등) 캐시된 값은 바뀌지 않는다.
+
+쓰기 경로는 invalidate_tags("posting:3") 처럼 태그로 무효화한다.
+- L2: 태그마다 버전 카운터를 두고 항목에 저장 시점 버전을 함께 기록한다.
+  조회 시 버전이 다르면 미스로 본다. 버전은 DB 조회 전에 읽으므로
+  조회 도중 무효화가 끼어들어도 옛 값이 살아남지 않는다.
+- L1: 같은 워커는 즉시 지우고, 다른 워커에는 Redis pub/sub 로 알린다
+  (메시지를 놓쳐도 L1 TTL 안에 갱신된다).
+
+같은 키의 동시 미스는 SingleFlight 로 한 번만 로드한다 (캐시 스탬피드 방지,
+SINGLE_FLIGHT_DISTRIBUTED 이면 워커 간에도).
+Redis 장애 시에는 L1 과 DB 만으로 동작한다.
+쓰기 직전 검증용 조회처럼 최신 값이 필요하면 fresh=True 로 캐시를 건너뛴다.
+"""
+
+import asyncio
+import functools
+import logging
+import pickle
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from prometheus_client import Counter
+
+from app.core.redis import get_redis
+from app.core.settings import settings
+from app.core.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+TTL_JITTER = 0.1  # 같은 시각에 채워진 항목이 한꺼번에 만료되지 않도록
+
+CACHE_REQUESTS = Counter(
+    "read_cache_requests_total",
+    "읽기 캐시 조회 수 (result: l1_hit, l2_hit, miss)",
+    ["family", "result"],
+)
+CACHE_INVALIDATIONS = Counter(
+    "read_cache_invalidations_total", "읽기 캐시 태그 무효화 수", ["family"]
+)
+
+
+def tag_family(tag: str) -> str:
+    return tag.split(":", 1)[0]
+
+
+def _value_key(key: str) -> str:
+    return f"cache:value:{key}"
+
+
+def _version_key(tag: str) -> str:
+    return f"cache:version:{tag}"
+
+
+class LocalLRU:
+    """워커 메모리 캐시: 항목 수 상한 + TTL, 태그 -> 키 역색인"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, bytes, Tuple[str, ...]]]" = (
+            OrderedDict()
+        )
+        self._keys_by_tag: Dict[str, Set[str]] = {}
+        self.generation = 0  # 무효화마다 증가: 로드 도중 무효화된 값은 채우지 않는다
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, blob, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return blob
+
+    def set(self, key: str, blob: bytes, tags: Tuple[str, ...]):
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl, blob, tags)
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate_tags(self, tags: Iterable[str]):
+        self.generation += 1
+        for tag in tags:
+            for key in self._keys_by_tag.pop(tag, ()):
+                self._remove(key)
+
+    def clear(self):
+        self.generation += 1
+        self._entries.clear()
+        self._keys_by_tag.clear()
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+class ReadThroughCache:
+    def __init__(self, l1_size: int, l1_ttl: float, ttl: int):
+        self.local = LocalLRU(l1_size, l1_ttl)
+        self.ttl = ttl
+        self._flight = SingleFlight("read_cache", distributed=True)
+
+    async def get_or_load(
+        self,
+        family: str,
+        key: str,
+        tags: Tuple[str, ...],
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+    ) -> Any:
+        blob = self.local.get(key)
+        if blob is not None:
+            CACHE_REQUESTS.labels(family, "l1_hit").inc()
+            return pickle.loads(blob)
+
+        blob = await self._flight.do(
+            key, lambda: self._load(family, key, tags, loader, ttl or self.ttl)
+        )
+        return None if blob is None else pickle.loads(blob)
+
+    async def _load(
+        self,
+        family: str,
+        key: str,
+        tags: Tuple[str, ...],
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+    ) -> Optional[bytes]:
+        generation = self.local.generation
+        versions = None
+        try:
+            cached, *raw_versions = await get_redis(decode_responses=False).mget(
+                _value_key(key), *map(_version_key, tags)
+            )
+            versions = tuple(int(v or 0) for v in raw_versions)
+            if cached:
+                stored_versions, blob = pickle.loads(cached)
+                if stored_versions == versions:
+                    CACHE_REQUESTS.labels(family, "l2_hit").inc()
+                    if generation == self.local.generation:
+                        self.local.set(key, blob, tags)
+                    return blob
+        except Exception as e:
+            logger.warning(f"[CACHE] Redis 조회 실패: {key}: {e}")
+
+        CACHE_REQUESTS.labels(family, "miss").inc()
+        result = await loader()
+        if result is None:
+            # 없는 항목은 캐시하지 않는다 (생성 직후 조회가 막히지 않도록)
+            return None
+
+        blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        if generation == self.local.generation:
+            self.local.set(key, blob, tags)
+        if versions is not None:
+            await self._store(key, blob, versions, ttl)
+        return blob
+
+    async def _store(self, key: str, blob: bytes, versions: Tuple[int, ...], ttl: int):
+        ttl = int(ttl * random.uniform(1 - TTL_JITTER, 1 + TTL_JITTER))
+        value = pickle.dumps((versions, blob), protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            await get_redis(decode_responses=False).set(_value_key(key), value, ex=ttl)
+        except Exception as e:
+            logger.warning(f"[CACHE] Redis 저장 실패: {key}: {e}")
+
+    async def invalidate_tags(self, *tags: str):
+        self.local.invalidate_tags(tags)
+        for tag in tags:
+            CACHE_INVALIDATIONS.labels(tag_family(tag)).inc()
+        try:
+            async with get_redis().pipeline(transaction=False) as pipe:
+                for tag in tags:
+                    pipe.incr(_version_key(tag))
+                pipe.publish(INVALIDATION_CHANNEL, ",".join(tags))
+                await pipe.execute()
+        except Exception as e:
+            # L2 항목은 TTL 이 지나야 갱신된다
+            logger.warning(f"[CACHE] 무효화 실패: {tags}: {e}")
+
+
+read_cache = ReadThroughCache(
+    l1_size=settings.READ_CACHE_L1_SIZE,
+    l1_ttl=settings.READ_CACHE_L1_TTL,
+    ttl=settings.READ_CACHE_TTL,
+)
+
+
+async def invalidate_tags(*tags: str):
+    """쓰기 후 호출: 태그가 붙은 캐시 항목을 모든 워커에서 무효화"""
+    if not settings.READ_CACHE_ENABLED:
+        return
+    await read_cache.invalidate_tags(*tags)
+
+
+def cached(family: str, tags: Callable[..., Iterable[str]], ttl: Optional[int] = None):
+    """
+    family: 메트릭 라벨 (태그 접두어와 같게), tags: 함수 인자 -> 태그 목록.
+    캐시 키는 함수 이름과 태그로 정하므로, 태그가 조회 대상을 유일하게 가리켜야 한다.
+    """
+
+    def decorator(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        async def wrapper(*args, fresh: bool = False, **kwargs):
+            if fresh or not settings.READ_CACHE_ENABLED:
+                return await func(*args, **kwargs)
+            tag_list = tuple(tags(*args, **kwargs))
+            return await read_cache.get_or_load(
+                family,
+                f"{name}:{','.join(tag_list)}",
+                tag_list,
+                lambda: func(*args, **kwargs),
+                ttl,
+            )
+
+        return wrapper
+
+    return decorator
+
+
+class InvalidationListener:
+    """다른 워커가 보낸 무효화 메시지를 받아 이 워커의 L1 을 비운다"""
+
+    RETRY_SECONDS = 5
+
+    def __init__(self, cache: ReadThroughCache):
+        self.cache = cache
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self):
+        while True:
+            try:
+                pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                try:
+                    async for message in pubsub.listen():
+                        self.cache.local.invalidate_tags(message["data"].split(","))
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 구독이 끊긴 동안 놓친 메시지에 대비해 L1 을 비운다
+                logger.warning(f"[CACHE] 무효화 구독 실패: {e}")
+                self.cache.local.clear()
+                await asyncio.sleep(self.RETRY_SECONDS)
+
+
+def start_invalidation_listener() -> Optional[InvalidationListener]:
+    """워커마다 lifespan 시작 시 호출"""
+    if not settings.READ_CACHE_ENABLED:
+        return None
+    listener = InvalidationListener(read_cache)
+    listener.start()
+    return listener
@@ -2,8 +2,39 @@ from app.core.settings import settings
 
 POSTGRES_URL = f"postgres://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
 
+
+def postgres_connection(host: str, port: str) -> dict:
+    return {
+        "engine": "tortoise.backends.asyncpg",
+        "credentials": {
+            "host": host,
+            "port": int(port),
+            "user": settings.POSTGRES_USER,
+            "password": settings.POSTGRES_PASSWORD,
+            "database": settings.POSTGRES_DB,
+            "minsize": settings.DB_POOL_MIN_SIZE,
+            "maxsize": settings.DB_POOL_MAX_SIZE,
+            "max_queries": settings.DB_POOL_MAX_QUERIES,
+            "max_inactive_connection_lifetime": settings.DB_POOL_MAX_INACTIVE_LIFETIME,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "server_settings": {
+                "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS),
+            },
+        },
+    }
+
+
+DB_CONNECTIONS = {
+    "default": postgres_connection(settings.POSTGRES_HOST, settings.POSTGRES_PORT),
+}
+if settings.POSTGRES_REPLICA_HOST:
+    DB_CONNECTIONS["replica"] = postgres_connection(
+        settings.POSTGRES_REPLICA_HOST,
+        settings.POSTGRES_REPLICA_PORT or settings.POSTGRES_PORT,
+    )
+
 TORTOISE_ORM = {
-    "connections": {"default": POSTGRES_URL},
+    "connections": DB_CONNECTIONS,
     "apps": {
         "models": {
             "models": [
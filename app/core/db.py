@@ -0,0 +1,57 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, TypeVar
+
+from tortoise import Tortoise
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.exceptions import ConfigurationError, DBConnectionError
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PRIMARY = "default"
+REPLICA = "replica"
+
+# replica 연결 실패 시 이 시각(monotonic)까지는 primary 로 우회
+_replica_down_until = 0.0
+
+
+def get_read_connection() -> BaseDBAsyncClient:
+    """replica 가 설정되어 있고 장애 상태가 아니면 replica, 아니면 primary 연결"""
+    if time.monotonic() >= _replica_down_until:
+        try:
+            return Tortoise.get_connection(REPLICA)
+        except (ConfigurationError, KeyError):
+            pass
+    return Tortoise.get_connection(PRIMARY)
+
+
+def mark_replica_down():
+    global _replica_down_until
+    _replica_down_until = time.monotonic() + settings.DB_REPLICA_RETRY_SECONDS
+    logger.warning(
+        f"[DB] replica 연결 실패, {settings.DB_REPLICA_RETRY_SECONDS}초간 primary 로 조회합니다."
+    )
+
+
+async def run_read(query: Callable[[BaseDBAsyncClient], Awaitable[T]]) -> T:
+    """
+    읽기 전용 쿼리를 replica 에서 실행한다. (repository 에서 명시적으로 사용)
+    replica 연결 자체가 실패하면 primary 로 다시 실행한다.
+
+    ex) await run_read(lambda db: FreeBoard.filter(...).using_db(db).values(...))
+    """
+    db = get_read_connection()
+    if db is Tortoise.get_connection(PRIMARY):
+        return await query(db)
+
+    try:
+        return await query(db)
+    except (DBConnectionError, OSError, asyncio.TimeoutError) as e:
+        logger.warning(f"[DB] replica 조회 실패: {e}")
+        mark_replica_down()
+        return await query(Tortoise.get_connection(PRIMARY))
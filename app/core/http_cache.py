@@ -0,0 +1,183 @@
+"""
+조건부 GET (ETag / Last-Modified) 지원.
+
+ETag 는 응답 대상의 updated_at 과 리소스별 버전 카운터로 만든 약한 검증자다
+(조회수처럼 updated_at 을 바꾸지 않는 카운터 변경은 같은 표현으로 본다).
+한 번 계산한 검증자는 Redis 에 버전과 함께 저장해 두고, 다음 조건부 요청이 이와 일치하면
+DB 조회와 직렬화 없이 304 를 돌려준다. 쓰기 경로는 invalidate_validator 로 버전을 올려
+저장된 검증자를 무효화한다. Redis 장애 시에는 매번 DB 에서 검증자를 계산한다.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from operator import attrgetter
+from typing import Any, Awaitable, Callable, Iterable, Optional, Tuple, Type
+
+from fastapi import Request, Response, status
+from tortoise.models import Model
+
+from app.core.redis import get_redis
+from app.core.responses import PrevalidatedJSONResponse
+
+logger = logging.getLogger(__name__)
+
+VALIDATOR_TTL = 600  # 무효화가 누락된 쓰기(일괄 update 등)가 있어도 이 시간 안에 갱신
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    public: bool = False
+    max_age: int = 0  # 0 이면 저장은 하되 매번 재검증 (no-cache)
+
+    @property
+    def header(self) -> str:
+        scope = "public" if self.public else "private"
+        if self.max_age <= 0:
+            return f"{scope}, no-cache"
+        return f"{scope}, max-age={self.max_age}, must-revalidate"
+
+
+PUBLIC_REVALIDATE = CachePolicy(public=True)
+PRIVATE_REVALIDATE = CachePolicy()
+
+
+@dataclass(frozen=True)
+class Validator:
+    etag: str
+    last_modified: datetime
+
+    def headers(self, policy: CachePolicy) -> dict:
+        return {
+            "ETag": self.etag,
+            "Last-Modified": format_datetime(
+                self.last_modified.astimezone(timezone.utc), usegmt=True
+            ),
+            "Cache-Control": policy.header,
+        }
+
+
+def resource_key(model: Type[Model], pk: Optional[int] = None) -> str:
+    """검증자 키: 단건은 `<테이블>:<id>`, 목록 전체는 `<테이블>`"""
+    table = model._meta.db_table
+    return table if pk is None else f"{table}:{pk}"
+
+
+def latest_updated_at(items: Iterable[Any]) -> datetime:
+    """목록 응답의 Last-Modified (삭제는 버전 카운터가 반영)"""
+    return max((item.updated_at for item in items), default=EPOCH)
+
+
+def make_validator(updated_at: datetime, version: int = 0) -> Validator:
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    stamp = int(updated_at.timestamp() * 1_000_000)
+    return Validator(etag=f'W/"{stamp:x}.{version}"', last_modified=updated_at)
+
+
+def _strip_weak(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(request: Request, validator: Validator) -> bool:
+    """If-None-Match 가 있으면 약한 비교로, 없을 때만 If-Modified-Since 로 판단"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        etag = _strip_weak(validator.etag)
+        return any(_strip_weak(tag.strip()) == etag for tag in if_none_match.split(","))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP 날짜는 초 단위
+        return validator.last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def has_conditional_headers(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def not_modified_response(validator: Validator, policy: CachePolicy) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers=validator.headers(policy)
+    )
+
+
+async def load_cached_validator(key: str) -> Tuple[Optional[Validator], int]:
+    """(현재 버전에서 저장된 검증자 또는 None, 현재 버전)"""
+    try:
+        version, cached = await get_redis().mget(
+            f"http:version:{key}", f"http:validator:{key}"
+        )
+    except Exception as e:
+        logger.warning(f"[HTTP-CACHE] 검증자 조회 실패: {key}: {e}")
+        return None, 0
+
+    version = int(version or 0)
+    if not cached:
+        return None, version
+    cached_version, etag, last_modified = cached.split("\t")
+    if int(cached_version) != version:
+        return None, version
+    return Validator(etag, datetime.fromisoformat(last_modified)), version
+
+
+async def store_validator(key: str, validator: Validator, version: int):
+    value = f"{version}\t{validator.etag}\t{validator.last_modified.isoformat()}"
+    try:
+        await get_redis().set(f"http:validator:{key}", value, ex=VALIDATOR_TTL)
+    except Exception as e:
+        logger.warning(f"[HTTP-CACHE] 검증자 저장 실패: {key}: {e}")
+
+
+async def invalidate_validator(*keys: str):
+    """쓰기 후 호출: 버전을 올려 이전 ETag 와 저장된 검증자를 모두 무효화"""
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.incr(f"http:version:{key}")
+                pipe.delete(f"http:validator:{key}")
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"[HTTP-CACHE] 검증자 무효화 실패: {keys}: {e}")
+
+
+async def conditional_get(
+    request: Request,
+    key: str,
+    load: Callable[[], Awaitable[Any]],
+    serialize: Callable[[Any], Any],
+    policy: CachePolicy,
+    on_cache_hit: Optional[Callable[[], Awaitable[None]]] = None,
+    last_modified: Callable[[Any], datetime] = attrgetter("updated_at"),
+) -> Response:
+    """
+    load: 서비스 조회 (권한/존재 확인 포함), serialize: 조회 결과 -> 응답 DTO
+    on_cache_hit: 저장된 검증자로 DB 조회 없이 304 를 줄 때 대신 실행할 부수 효과 (조회수 등)
+    """
+    cached, version = await load_cached_validator(key)
+    if cached and has_conditional_headers(request) and is_not_modified(request, cached):
+        if on_cache_hit:
+            await on_cache_hit()
+        return not_modified_response(cached, policy)
+
+    result = await load()
+    validator = make_validator(last_modified(result), version)
+    if cached != validator:
+        await store_validator(key, validator, version)
+    if is_not_modified(request, validator):
+        return not_modified_response(validator, policy)
+
+    return PrevalidatedJSONResponse(
+        serialize(result), headers=validator.headers(policy)
+    )
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import List, Optional, Tuple
+
+from prometheus_client import Counter, Histogram
+
+from app.core.redis import get_redis
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+OFFENDERS_KEY = "monitor:loop:offenders"  # 블로킹 위치별 발생 횟수
+STACK_DEPTH = 15
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "이벤트 루프 스케줄링 지연",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+LOOP_BLOCKS = Counter("event_loop_blocks_total", "임계값을 넘긴 이벤트 루프 블로킹 수")
+
+
+def blocking_location(stack: traceback.StackSummary) -> str:
+    """블로킹 시점 스택에서 가장 안쪽의 app 코드 위치 (없으면 가장 안쪽 프레임)"""
+    for frame in reversed(stack):
+        if frame.filename.startswith(APP_ROOT):
+            path = os.path.relpath(frame.filename, os.path.dirname(APP_ROOT))
+            return f"{path}:{frame.lineno} {frame.name}"
+    frame = stack[-1]
+    return f"{frame.filename}:{frame.lineno} {frame.name}"
+
+
+async def record_offender(location: str):
+    try:
+        await get_redis().zincrby(OFFENDERS_KEY, 1, location)
+    except Exception as e:
+        logger.warning(f"[LOOP-MONITOR] 블로킹 위치 기록 실패: {e}")
+
+
+async def get_top_offenders(limit: int) -> List[Tuple[str, int]]:
+    rows = await get_redis().zrevrange(OFFENDERS_KEY, 0, limit - 1, withscores=True)
+    return [(location, int(count)) for location, count in rows]
+
+
+class LoopMonitor:
+    """
+    이벤트 루프 지연 감시.
+    루프 안의 heartbeat 가 interval 마다 깨어나며 지연을 측정하고,
+    별도 watchdog 스레드가 heartbeat 가 threshold 이상 멈추면 루프 스레드의 스택을 캡처한다.
+    """
+
+    def __init__(self, interval: float, threshold: float):
+        self.interval = interval
+        self.threshold = threshold
+        self._last_beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._stall_captured = False
+        self._captured: deque = deque(maxlen=100)
+        self._stop = threading.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-monitor", daemon=True
+        )
+        self._thread.start()
+
+    async def stop(self):
+        self._stop.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _heartbeat(self):
+        while True:
+            start = time.perf_counter()
+            self._last_beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+            lag = max(time.perf_counter() - start - self.interval, 0.0)
+            LOOP_LAG.observe(lag)
+
+            self._last_beat = time.monotonic()
+            self._stall_captured = False
+            while self._captured:
+                await self._report(lag, *self._captured.popleft())
+
+    async def _report(self, lag: float, location: str, stack: str):
+        LOOP_BLOCKS.inc()
+        logger.warning(
+            f"[LOOP-MONITOR] 이벤트 루프 {lag * 1000:.0f}ms 블로킹: {location}\n{stack}"
+        )
+        await record_offender(location)
+
+    def _watch(self):
+        while not self._stop.wait(self.interval / 2):
+            blocked = time.monotonic() - self._last_beat - self.interval
+            if blocked < self.threshold or self._stall_captured:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            # 멈춘 구간마다 한 번만 캡처하고, 기록은 루프가 돌아온 뒤 heartbeat 에서 한다
+            self._stall_captured = True
+            stack = traceback.extract_stack(frame)[-STACK_DEPTH:]
+            self._captured.append(
+                (blocking_location(stack), "".join(traceback.format_list(stack)))
+            )
+
+
+def start_loop_monitor() -> Optional[LoopMonitor]:
+    """워커마다 lifespan 시작 시 호출"""
+    if not settings.LOOP_MONITOR_ENABLED:
+        return None
+    monitor = LoopMonitor(
+        interval=settings.LOOP_MONITOR_INTERVAL_MS / 1000,
+        threshold=settings.LOOP_BLOCK_THRESHOLD_MS / 1000,
+    )
+    monitor.start()
+    return monitor
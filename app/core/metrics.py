@@ -0,0 +1,243 @@
+import functools
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+METRICS_PATH = "/metrics"
+BACKGROUND_ROUTE = "background"  # 요청 밖(스케줄러, 시작 시점)에서 실행된 호출
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP 요청 수", ["method", "route", "status"]
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+HTTP_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "처리 중인 HTTP 요청 수",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+DB_QUERIES = Counter("db_queries_total", "DB 쿼리 수", ["route"])
+DB_QUERY_SECONDS = Counter("db_query_seconds_total", "DB 쿼리 누적 시간", ["route"])
+DB_ROWS = Counter("db_rows_total", "DB 쿼리 반환/변경 행 수", ["route"])
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "요청당 DB 쿼리 수",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+
+REDIS_CALLS = Counter("redis_calls_total", "Redis 호출(왕복) 수", ["route"])
+REDIS_SECONDS = Counter("redis_call_seconds_total", "Redis 호출 누적 시간", ["route"])
+
+
+@dataclass
+class RequestStats:
+    """요청 하나 동안의 DB / Redis 사용량"""
+
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    db_rows: int = 0
+    redis_calls: int = 0
+    redis_seconds: float = 0.0
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None
+)
+# execute_script -> execute_query 처럼 중첩 호출이 두 번 집계되지 않도록
+_in_db_call: ContextVar[bool] = ContextVar("in_db_call", default=False)
+
+
+# (method, query, values, elapsed) 를 받는 DB 쿼리 리스너 (query_trace 등)
+DBQueryListener = Callable[[str, str, Optional[list], float], None]
+_db_query_listeners: List[DBQueryListener] = []
+
+
+def add_db_query_listener(listener: DBQueryListener):
+    if listener not in _db_query_listeners:
+        _db_query_listeners.append(listener)
+
+
+def get_request_stats() -> Optional[RequestStats]:
+    return _request_stats.get()
+
+
+def _row_count(method: str, result, args) -> int:
+    if method == "execute_query":
+        return result[0]
+    if method == "execute_query_dict":
+        return len(result)
+    if method == "execute_insert":
+        return 1 if result is not None else 0
+    if method == "execute_many":
+        return len(args[1]) if len(args) > 1 else 0
+    return 0
+
+
+def record_db_query(elapsed: float, rows: int):
+    stats = _request_stats.get()
+    if stats is None:
+        DB_QUERIES.labels(BACKGROUND_ROUTE).inc()
+        DB_QUERY_SECONDS.labels(BACKGROUND_ROUTE).inc(elapsed)
+        DB_ROWS.labels(BACKGROUND_ROUTE).inc(rows)
+        return
+    stats.db_queries += 1
+    stats.db_seconds += elapsed
+    stats.db_rows += rows
+
+
+def record_redis_call(elapsed: float):
+    stats = _request_stats.get()
+    if stats is None:
+        REDIS_CALLS.labels(BACKGROUND_ROUTE).inc()
+        REDIS_SECONDS.labels(BACKGROUND_ROUTE).inc(elapsed)
+        return
+    stats.redis_calls += 1
+    stats.redis_seconds += elapsed
+
+
+def _wrap_db_method(name: str, func):
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        if _in_db_call.get():
+            return await func(self, *args, **kwargs)
+
+        token = _in_db_call.set(True)
+        start = time.perf_counter()
+        result = None
+        try:
+            result = await func(self, *args, **kwargs)
+            return result
+        finally:
+            _in_db_call.reset(token)
+            elapsed = time.perf_counter() - start
+            rows = _row_count(name, result, args) if result is not None else 0
+            record_db_query(elapsed, rows)
+            if _db_query_listeners and args:
+                values = args[1] if len(args) > 1 else kwargs.get("values")
+                for listener in _db_query_listeners:
+                    listener(name, args[0], values, elapsed)
+
+    wrapper._instrumented = True
+    return wrapper
+
+
+def _wrap_redis_method(func):
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            record_redis_call(time.perf_counter() - start)
+
+    wrapper._instrumented = True
+    return wrapper
+
+
+def instrument_tortoise():
+    from tortoise.backends.asyncpg.client import AsyncpgDBClient, TransactionWrapper
+    from tortoise.backends.base_postgres.client import BasePostgresClient
+
+    for cls in (BasePostgresClient, AsyncpgDBClient, TransactionWrapper):
+        for name in (
+            "execute_query",
+            "execute_query_dict",
+            "execute_insert",
+            "execute_many",
+            "execute_script",
+        ):
+            func = cls.__dict__.get(name)
+            if func is None or getattr(func, "_instrumented", False):
+                continue
+            if getattr(func, "__isabstractmethod__", False):
+                continue
+            setattr(cls, name, _wrap_db_method(name, func))
+
+
+def instrument_redis():
+    from redis.asyncio.client import Pipeline, Redis
+
+    # 파이프라인은 명령 수와 관계없이 왕복 1회로 집계
+    for cls, name in ((Redis, "execute_command"), (Pipeline, "execute")):
+        func = cls.__dict__[name]
+        if not getattr(func, "_instrumented", False):
+            setattr(cls, name, _wrap_redis_method(func))
+
+
+def _route_path(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", UNMATCHED_ROUTE)
+
+
+class MetricsMiddleware:
+    """라우트별 지연 시간, 상태 코드, 처리 중 요청 수, 요청당 DB / Redis 사용량 기록"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] == METRICS_PATH:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        HTTP_IN_PROGRESS.labels(method).inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_PROGRESS.labels(method).dec()
+            _request_stats.reset(token)
+
+            route = _route_path(scope)
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+            HTTP_LATENCY.labels(method, route).observe(elapsed)
+            DB_QUERIES_PER_REQUEST.labels(route).observe(stats.db_queries)
+            if stats.db_queries:
+                DB_QUERIES.labels(route).inc(stats.db_queries)
+                DB_QUERY_SECONDS.labels(route).inc(stats.db_seconds)
+                DB_ROWS.labels(route).inc(stats.db_rows)
+            if stats.redis_calls:
+                REDIS_CALLS.labels(route).inc(stats.redis_calls)
+                REDIS_SECONDS.labels(route).inc(stats.redis_seconds)
+
+
+def render_metrics() -> bytes:
+    """gunicorn 멀티 워커일 때는 PROMETHEUS_MULTIPROC_DIR 의 워커별 값을 합산해서 내보낸다"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
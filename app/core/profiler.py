@@ -0,0 +1,142 @@
+import logging
+import time
+import uuid
+from typing import Optional
+from urllib.parse import parse_qs
+
+from pyinstrument import Profiler
+from pyinstrument.renderers import SpeedscopeRenderer
+from starlette.requests import Request
+
+from app.core.redis import get_redis
+from app.core.settings import settings
+from app.core.token import get_current_user, oauth2_optional
+from app.domain.services.verification import check_superuser
+from app.exceptions.base_exceptions import CustomException
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+PROFILE_TTL_SECONDS = 60 * 60  # 저장된 프로파일 보관 시간
+
+
+def _profile_key(profile_id: str) -> str:
+    return f"profile:{profile_id}"
+
+
+def _rate_key(minute: int) -> str:
+    return f"profile:rate:{minute}"
+
+
+def is_profile_requested(scope) -> bool:
+    if dict(scope.get("headers") or []).get(PROFILE_HEADER) == b"1":
+        return True
+    query = parse_qs(scope.get("query_string", b"").decode())
+    return query.get("profile") == ["1"]
+
+
+async def is_superuser_request(scope) -> bool:
+    """Authorization 헤더/쿠키의 토큰이 관리자 토큰인지 확인"""
+    try:
+        token = await oauth2_optional(Request(scope))
+        if not token:
+            return False
+        check_superuser(await get_current_user(token))
+        return True
+    except CustomException:
+        return False
+    except Exception as e:
+        # DB/redis 장애로 요청 자체가 실패하지 않도록 프로파일링 없이 진행
+        logger.warning(f"[PROFILER] 관리자 확인 실패: {e}")
+        return False
+
+
+async def acquire_rate_slot() -> bool:
+    """전체 워커 합산 분당 PROFILER_MAX_PER_MINUTE 회로 제한 (redis 장애 시 프로파일링 안 함)"""
+    key = _rate_key(int(time.time() // 60))
+    try:
+        pipe = get_redis().pipeline(transaction=True)
+        pipe.incr(key)
+        pipe.expire(key, 60)
+        count, _ = await pipe.execute()
+    except Exception as e:
+        logger.warning(f"[PROFILER] 호출 제한 확인 실패: {e}")
+        return False
+    return count <= settings.PROFILER_MAX_PER_MINUTE
+
+
+async def save_profile(profile_id: str, profile: str):
+    try:
+        await get_redis().set(_profile_key(profile_id), profile, ex=PROFILE_TTL_SECONDS)
+    except Exception as e:
+        logger.warning(f"[PROFILER] 프로파일 저장 실패: {e}")
+
+
+async def get_profile(profile_id: str) -> Optional[str]:
+    return await get_redis().get(_profile_key(profile_id))
+
+
+class ProfilerMiddleware:
+    """
+    관리자가 X-Profile: 1 헤더나 ?profile=1 로 요청하면 해당 요청만 샘플링 프로파일링한다.
+    결과는 speedscope(flame graph) JSON 으로 redis 에 저장되고 응답 헤더 X-Profile-Id 로 id 를 돌려준다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        # 워커당 동시에 하나의 요청만 프로파일링 (이미 하고 있으면 기다리지 않고 그냥 처리)
+        self._profiling = False
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not is_profile_requested(scope)
+            or self._profiling
+            or not await is_superuser_request(scope)
+            # 관리자 확인을 기다리는 사이 다른 요청이 먼저 시작했을 수 있다
+            or self._profiling
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # await 없이 바로 차지하고, 호출 제한 슬롯은 실제로 프로파일링할 요청만 쓴다
+        self._profiling = True
+        try:
+            result = (
+                await self._profile(scope, receive, send)
+                if await acquire_rate_slot()
+                else None
+            )
+        finally:
+            self._profiling = False
+
+        if result is None:
+            await self.app(scope, receive, send)
+            return
+        profile_id, profile = result
+        logger.info(
+            f"[PROFILER] 요청 프로파일 저장: {scope['method']} {scope['path']} id={profile_id}"
+        )
+        await save_profile(profile_id, profile)
+
+    async def _profile(self, scope, receive, send):
+        """요청을 프로파일링하며 처리: (profile_id, speedscope JSON)"""
+        profile_id = uuid.uuid4().hex
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((PROFILE_ID_HEADER, profile_id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        profiler = Profiler(
+            interval=settings.PROFILER_INTERVAL_MS / 1000, async_mode="enabled"
+        )
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.stop()
+        return profile_id, profiler.output(SpeedscopeRenderer())
@@ -0,0 +1,154 @@
+import hmac
+import logging
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from tortoise import Tortoise
+
+from app.core.metrics import add_db_query_listener
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+TRACE_HEADER = b"x-query-trace"
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORE_DIR = os.path.join(APP_ROOT, "core")
+EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"\$\d+")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class TracedQuery:
+    sql: str
+    values: Optional[list]
+    elapsed: float
+    call_site: str
+
+
+@dataclass
+class QueryTrace:
+    path: str
+    queries: List[TracedQuery] = field(default_factory=list)
+
+
+_trace: ContextVar[Optional[QueryTrace]] = ContextVar("query_trace", default=None)
+
+
+def normalize_sql(sql: str) -> str:
+    """리터럴과 IN 목록 길이를 지워서 같은 형태의 쿼리를 하나로 묶는다"""
+    shape = _STRING_LITERAL.sub("?", sql)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def _call_site() -> str:
+    """쿼리를 발생시킨 app 코드 위치 (ORM, 추적 코드 프레임은 건너뜀)"""
+    frame = sys._getframe(2)
+    while frame:
+        filename = frame.f_code.co_filename
+        if filename.startswith(APP_ROOT) and not filename.startswith(CORE_DIR):
+            path = os.path.relpath(filename, os.path.dirname(APP_ROOT))
+            return f"{path}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+def _on_query(method: str, sql: str, values: Optional[list], elapsed: float):
+    trace = _trace.get()
+    if trace is None or method == "execute_many":
+        return
+    trace.queries.append(TracedQuery(sql, values, elapsed, _call_site()))
+
+
+def should_trace(header_value: Optional[str]) -> bool:
+    if header_value and settings.QUERY_TRACE_TOKEN:
+        return hmac.compare_digest(header_value, settings.QUERY_TRACE_TOKEN)
+    return random.random() < settings.QUERY_TRACE_SAMPLE_RATE
+
+
+async def explain(query: TracedQuery) -> str:
+    if not query.sql.lstrip().upper().startswith(EXPLAINABLE):
+        return "-"
+    # EXPLAIN 은 실행 계획만 조회하고 쿼리를 실행하지 않는다
+    token = _trace.set(None)
+    try:
+        conn = Tortoise.get_connection("default")
+        rows = await conn.execute_query_dict(f"EXPLAIN {query.sql}", query.values)
+        return "\n".join(row["QUERY PLAN"] for row in rows)
+    except Exception as e:
+        return f"EXPLAIN 실패: {e}"
+    finally:
+        _trace.reset(token)
+
+
+async def report(trace: QueryTrace):
+    slow_seconds = settings.QUERY_TRACE_SLOW_MS / 1000
+    total = sum(q.elapsed for q in trace.queries)
+    logger.info(
+        f"[QUERY-TRACE] {trace.path}: 쿼리 {len(trace.queries)}개, {total * 1000:.1f}ms"
+    )
+
+    for query in trace.queries:
+        if query.elapsed >= slow_seconds:
+            plan = await explain(query)
+            logger.warning(
+                f"[QUERY-TRACE] 느린 쿼리 {query.elapsed * 1000:.1f}ms ({query.call_site})\n"
+                f"{query.sql}\n{plan}"
+            )
+
+    shapes = Counter(normalize_sql(q.sql) for q in trace.queries)
+    for shape, count in shapes.items():
+        if count < settings.QUERY_TRACE_REPEAT_THRESHOLD:
+            continue
+        sites = Counter(
+            q.call_site for q in trace.queries if normalize_sql(q.sql) == shape
+        )
+        logger.warning(
+            f"[QUERY-TRACE] N+1 의심: {trace.path} 에서 같은 쿼리 {count}회 "
+            f"({', '.join(f'{s} x{c}' for s, c in sites.most_common(3))})\n{shape}"
+        )
+
+
+class QueryTraceMiddleware:
+    """X-Query-Trace 헤더(토큰) 또는 샘플링으로 선택된 요청의 쿼리를 수집해 분석 로그를 남긴다"""
+
+    def __init__(self, app):
+        self.app = app
+        add_db_query_listener(_on_query)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header = dict(scope.get("headers") or []).get(TRACE_HEADER)
+        if not should_trace(header.decode() if header else None):
+            await self.app(scope, receive, send)
+            return
+
+        trace = QueryTrace(path=f"{scope['method']} {scope['path']}")
+        token = _trace.set(trace)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _trace.reset(token)
+            logger.info(
+                f"[QUERY-TRACE] {trace.path} 응답 {(time.perf_counter() - start) * 1000:.1f}ms"
+            )
+            # 응답 전송 후 분석하므로 클라이언트 응답 시간에는 영향이 없다
+            await report(trace)
@@ -0,0 +1,173 @@
+"""
+Redis 토큰 버킷 요청 제한.
+
+버킷 하나는 `capacity` 개의 토큰을 갖고 `period` 초에 걸쳐 가득 찬다
+(ex. 5/300 = 5번까지 연속 허용, 이후 60초마다 1번).
+확인과 차감은 Lua 스크립트 한 번으로 원자적으로 처리하고 시각은 Redis TIME 을 쓰므로
+워커/서버가 여러 대여도 같은 버킷을 공유한다.
+
+- 라우트에서 IP / 사용자 기준: dependencies=[Depends(limit_by_ip(LOGIN_PER_IP))]
+- 서비스에서 이메일 등 요청 본문 기준: await check_rate_limit(EMAIL_CODE_PER_EMAIL, email)
+- 성공한 요청은 세지 않을 때: 먼저 check_rate_limit 로 차감하고 성공하면 refund_rate_limit
+
+한도는 settings.RATE_LIMITS 로 이름별로 바꿀 수 있다 (ex. {"login:ip": "50/60"}).
+Redis 장애 시에는 제한하지 않고 통과시킨다 (fail open).
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+from fastapi import Depends, Request
+from prometheus_client import Counter
+
+from app.core.redis import get_redis
+from app.core.settings import settings
+from app.core.token import get_optional_user
+from app.domain.user.models import BaseUser
+from app.exceptions.request_exceptions import TooManyRequestsException
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]: 버킷, ARGV: capacity, period(ms), cost -> {허용 여부, 재시도까지 ms}
+# cost 가 음수면 토큰을 돌려준다 (capacity 까지)
+TOKEN_BUCKET_SCRIPT = """
+redis.replicate_commands()
+local capacity = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * capacity / period)
+
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = math.min(capacity, tokens - cost)
+    allowed = 1
+else
+    retry_after = math.ceil((cost - tokens) * period / capacity)
+end
+
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", now)
+redis.call("PEXPIRE", KEYS[1], period)
+return {allowed, retry_after}
+"""
+
+RATE_LIMIT_CHECKS = Counter(
+    "rate_limit_checks_total",
+    "요청 제한 확인 수 (result: allowed, limited, error)",
+    ["limit", "result"],
+)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    name: str
+    capacity: int
+    period: int  # 초
+
+    def resolve(self) -> Tuple[int, int]:
+        """settings.RATE_LIMITS 의 "횟수/초" 설정이 있으면 그 값"""
+        override = settings.RATE_LIMITS.get(self.name)
+        if not override:
+            return self.capacity, self.period
+        capacity, period = override.split("/")
+        return int(capacity), int(period)
+
+
+# bcrypt 검증 비용 + 계정 대입 공격
+LOGIN_PER_IP = RateLimit("login:ip", capacity=20, period=60)
+# 비밀번호 실패만 센다. IP 별로 나눠 다른 사람이 계정을 잠그지 못하게 한다
+LOGIN_FAILURES_PER_IP_EMAIL = RateLimit("login:ip_email", capacity=5, period=300)
+# SMTP 발송 한도
+EMAIL_CODE_PER_IP = RateLimit("email_code:ip", capacity=10, period=600)
+EMAIL_CODE_PER_EMAIL = RateLimit("email_code:email", capacity=3, period=600)
+# 국세청 API 호출 한도 (전체 공유)
+BUSINESS_VERIFY_PER_IP = RateLimit("business_verify:ip", capacity=10, period=600)
+BUSINESS_VERIFY_TOTAL = RateLimit("business_verify:total", capacity=300, period=60)
+# 검색어 LIKE 조회
+SEARCH_PER_CLIENT = RateLimit("search:client", capacity=60, period=60)
+
+
+async def check_rate_limit(limit: RateLimit, key: str, cost: int = 1):
+    """한도를 넘으면 TooManyRequestsException (Retry-After 포함)"""
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    capacity, period = limit.resolve()
+    try:
+        redis = get_redis()
+        script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+        allowed, retry_after_ms = await script(
+            keys=[f"rate_limit:{limit.name}:{key}"],
+            args=[capacity, period * 1000, cost],
+        )
+    except Exception as e:
+        logger.warning(f"[RATE-LIMIT] 확인 실패, 제한 없이 통과: {limit.name}: {e}")
+        RATE_LIMIT_CHECKS.labels(limit.name, "error").inc()
+        return
+
+    if not allowed:
+        RATE_LIMIT_CHECKS.labels(limit.name, "limited").inc()
+        logger.warning(f"[RATE-LIMIT] 요청 제한: {limit.name}: {key}")
+        raise TooManyRequestsException(retry_after=-(-int(retry_after_ms) // 1000))
+    RATE_LIMIT_CHECKS.labels(limit.name, "allowed").inc()
+
+
+async def refund_rate_limit(limit: RateLimit, key: str, cost: int = 1):
+    """check_rate_limit 로 차감한 토큰을 돌려준다 (실패해도 예외 없음)"""
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    capacity, period = limit.resolve()
+    try:
+        redis = get_redis()
+        script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+        await script(
+            keys=[f"rate_limit:{limit.name}:{key}"],
+            args=[capacity, period * 1000, -cost],
+        )
+    except Exception as e:
+        logger.warning(f"[RATE-LIMIT] 토큰 반환 실패: {limit.name}: {e}")
+
+
+def client_ip(request: Request) -> str:
+    """
+    nginx 가 덮어쓰는 X-Real-IP($remote_addr) 기준.
+    request.client 는 ProxyHeadersMiddleware 가 X-Forwarded-For 의 맨 앞 값(클라이언트가 보낸 값)으로
+    바꾸므로 버킷 키로 쓰면 헤더를 바꿔 가며 제한을 피할 수 있다.
+    (nginx 를 거치지 않는 로컬 실행에서만 직접 연결 주소를 쓴다)
+    """
+    real_ip = request.headers.get("x-real-ip")
+    if real_ip:
+        return real_ip.strip()
+    return request.client.host if request.client else "unknown"
+
+
+def limit_by_ip(
+    limit: RateLimit, when: Optional[Callable[[Request], bool]] = None
+) -> Callable:
+    async def dependency(request: Request):
+        if when is None or when(request):
+            await check_rate_limit(limit, client_ip(request))
+
+    return dependency
+
+
+def limit_by_user_or_ip(
+    limit: RateLimit, when: Optional[Callable[[Request], bool]] = None
+) -> Callable:
+    """로그인 사용자는 사용자 id, 아니면 IP 기준"""
+
+    async def dependency(
+        request: Request, current_user: Optional[BaseUser] = Depends(get_optional_user)
+    ):
+        if when is not None and not when(request):
+            return
+        key = f"user:{current_user.id}" if current_user else f"ip:{client_ip(request)}"
+        await check_rate_limit(limit, key)
+
+    return dependency
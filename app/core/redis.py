@@ -1,12 +1,29 @@
+from typing import Dict
+
 import redis.asyncio as aioredis
 
 from app.core.settings import get_settings
 
+# 워커마다 decode_responses 별로 하나씩 (커넥션 풀 공유)
+_clients: Dict[bool, aioredis.Redis] = {}
+
+
+def get_redis(decode_responses: bool = True) -> aioredis.Redis:
+    """decode_responses=False 는 pickle 등 바이너리 값을 다룰 때"""
+    client = _clients.get(decode_responses)
+    if client is None:
+        settings = get_settings()
+        client = _clients[decode_responses] = aioredis.Redis(
+            host=settings.REDIS_HOST,
+            port=int(settings.REDIS_PORT),
+            decode_responses=decode_responses,
+        )
+    return client
+
 
-def get_redis():
-    settings = get_settings()
-    return aioredis.Redis(
-        host=settings.REDIS_HOST,
-        port=int(settings.REDIS_PORT),
-        decode_responses=True,
-    )
+async def close_redis():
+    """lifespan 종료 시 커넥션 풀 정리"""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
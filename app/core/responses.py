@@ -0,0 +1,52 @@
+"""
+JSON 응답 직렬화.
+
+앱 기본 응답은 ORJSONResponse 를 쓴다. 라우터가 값을 반환하면 FastAPI 가 response_model 로
+다시 검증한 뒤 인코딩하는데, 서비스에서 이미 DTO 로 검증을 마친 목록 응답에서는 이 재검증이
+직렬화 비용의 대부분을 차지한다. 이런 경우 PrevalidatedJSONResponse 로 감싸 반환하면
+Response 인스턴스이므로 재검증 없이 그대로 인코딩된다 (response_model 은 OpenAPI 문서용으로만 남는다).
+"""
+
+from functools import lru_cache
+from typing import Any, List, Type
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def _default(obj: Any):
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"JSON 으로 직렬화할 수 없는 타입입니다: {type(obj).__name__}")
+
+
+def encode_json(content: Any) -> bytes:
+    """
+    검증된 모델/모델 리스트는 pydantic 직렬화기로 바로 bytes 를 만들고,
+    이미 인코딩된 bytes 는 그대로, 나머지는 orjson 으로 인코딩한다.
+    """
+    if isinstance(content, bytes):
+        return content
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content)
+    if isinstance(content, list) and content and isinstance(content[0], BaseModel):
+        return _list_adapter(type(content[0])).dump_json(content)
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class PrevalidatedJSONResponse(ORJSONResponse):
+    """
+    서비스가 반환한 DTO(또는 DTO 리스트, 미리 인코딩한 bytes)를 response_model 재검증 없이 응답.
+    DTO 는 라우터의 response_model 과 같은 스키마여야 한다 (필드 필터링도 생략되므로).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
@@ -0,0 +1,319 @@
+"""
+주기 작업 스케줄러.
+
+워커마다 lifespan 에서 시작하지만 Redis 리더 락(SET NX PX)을 잡은 워커 하나만 작업을 실행한다.
+리더는 TTL 의 1/3 마다 락을 연장하고, 리더 워커가 죽으면 TTL 뒤 락이 풀려 다른 워커가 이어받는다.
+작업별 마지막 실행 시각과 결과는 Redis 해시(scheduler:job:{name})에 남기므로
+리더가 바뀌어도 주기가 처음부터 다시 시작되지 않는다.
+
+- 주기: scheduler.add_job("name", func, every=600)
+- cron: scheduler.add_job("name", func, cron="30 4 * * *")  (분 시 일 월 요일, 서버 시각)
+- 배포 직후 backfill 이 필요한 cron 작업: run_if_never_run=True (실행 기록이 없으면 바로 한 번 실행)
+
+리더 교체 직후에는 이전 리더의 작업이 아직 끝나지 않았을 수 있으므로 작업은 여러 번 실행돼도 안전해야 한다.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from prometheus_client import Counter, Histogram
+
+from app.core.redis import get_redis
+from app.core.settings import settings
+from app.core.single_flight import RELEASE_LOCK_SCRIPT
+
+logger = logging.getLogger(__name__)
+
+LEADER_KEY = "scheduler:leader"
+TICK_SECONDS = 1.0
+ERROR_MAX_LENGTH = 500
+
+# 내 토큰일 때만 연장 (이미 다른 워커가 리더면 0)
+RENEW_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("PEXPIRE", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+JOB_RUNS = Counter(
+    "scheduler_job_runs_total",
+    "주기 작업 실행 수 (outcome: success, error, timeout)",
+    ["job", "outcome"],
+)
+JOB_DURATION = Histogram(
+    "scheduler_job_duration_seconds",
+    "주기 작업 실행 시간",
+    ["job"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300),
+)
+LEADER_CHANGES = Counter("scheduler_leader_changes_total", "리더 획득/상실 수", ["event"])
+
+# 분, 시, 일, 월, 요일(0=일요일, 7 도 일요일)
+CRON_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+
+def _parse_cron_field(field: str, low: int, high: int) -> Set[int]:
+    values: Set[int] = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/")
+            step = int(step_text)
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start, end = (int(v) for v in part.split("-"))
+        else:
+            start = int(part)
+            end = high if step > 1 else start
+        if not low <= start <= end <= high or step < 1:
+            raise ValueError(f"cron 범위 오류: {field}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """5필드 cron 식 (*, a-b, a,b, */n 지원)"""
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 식은 5개 필드여야 합니다: {expression}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            _parse_cron_field(field, low, high)
+            for field, (low, high) in zip(fields, CRON_RANGES)
+        )
+        self.weekdays = {d % 7 for d in weekdays}
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def _day_matches(self, t: datetime) -> bool:
+        day = t.day in self.days
+        weekday = (t.weekday() + 1) % 7 in self.weekdays
+        # 일/요일이 둘 다 지정되면 둘 중 하나만 맞아도 실행 (표준 cron 과 같음)
+        if not self._any_day and not self._any_weekday:
+            return day or weekday
+        return day and weekday
+
+    def next_after(self, after: datetime) -> datetime:
+        t = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = t + timedelta(days=366 * 5)
+        while t < limit:
+            if t.month not in self.months:
+                t = datetime(t.year + t.month // 12, t.month % 12 + 1, 1)
+            elif not self._day_matches(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+            elif t.hour not in self.hours:
+                t = t.replace(minute=0) + timedelta(hours=1)
+            elif t.minute not in self.minutes:
+                t += timedelta(minutes=1)
+            else:
+                return t
+        raise ValueError(f"실행 시각이 없는 cron 식: {self.expression}")
+
+
+@dataclass
+class Job:
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    every: Optional[float] = None  # 초
+    cron: Optional[CronSchedule] = None
+    timeout: Optional[float] = None  # 초
+    run_if_never_run: bool = False
+
+    def next_run(self, last_run: Optional[float], now: float) -> float:
+        """다음 실행 시각 (epoch 초). 주기 작업은 처음이면 바로 실행"""
+        if last_run is None and (self.every is not None or self.run_if_never_run):
+            return now
+        if self.every is not None:
+            return last_run + self.every
+        after = datetime.fromtimestamp(last_run if last_run is not None else now)
+        return self.cron.next_after(after).timestamp()
+
+
+class Scheduler:
+    def __init__(self, leader_ttl: float, tick: float = TICK_SECONDS):
+        self.leader_ttl = leader_ttl
+        self.tick = tick
+        self.jobs: Dict[str, Job] = {}
+        self.is_leader = False
+        self._token = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._renewed_at = 0.0
+        self._next_runs: Dict[str, float] = {}
+        self._running: Dict[str, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        every: Optional[float] = None,
+        cron: Optional[str] = None,
+        timeout: Optional[float] = None,
+        run_if_never_run: bool = False,
+    ):
+        if (every is None) == (cron is None):
+            raise ValueError(f"every 와 cron 중 하나만 지정해야 합니다: {name}")
+        if name in self.jobs:
+            raise ValueError(f"이미 등록된 작업: {name}")
+        self.jobs[name] = Job(
+            name=name,
+            func=func,
+            every=every,
+            cron=CronSchedule(cron) if cron else None,
+            timeout=timeout,
+            run_if_never_run=run_if_never_run,
+        )
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        for task in list(self._running.values()):
+            task.cancel()
+        await asyncio.gather(*self._running.values(), return_exceptions=True)
+        if self.is_leader:
+            try:
+                await get_redis().eval(RELEASE_LOCK_SCRIPT, 1, LEADER_KEY, self._token)
+            except Exception as e:
+                logger.warning(f"[SCHEDULER] 리더 락 해제 실패: {e}")
+
+    async def _run(self):
+        while True:
+            try:
+                await self._elect()
+                if self.is_leader:
+                    self._dispatch(time.time())
+            except Exception as e:
+                logger.warning(f"[SCHEDULER] 스케줄러 루프 오류: {e}")
+            await asyncio.sleep(self.tick)
+
+    async def _elect(self):
+        ttl_ms = int(self.leader_ttl * 1000)
+        now = time.monotonic()
+        if not self.is_leader:
+            acquired = await get_redis().set(
+                LEADER_KEY, self._token, nx=True, px=ttl_ms
+            )
+            if acquired:
+                self._renewed_at = now
+                await self._become_leader()
+            return
+
+        if now - self._renewed_at < self.leader_ttl / 3:
+            return
+        try:
+            renewed = await get_redis().eval(
+                RENEW_LOCK_SCRIPT, 1, LEADER_KEY, self._token, ttl_ms
+            )
+        except Exception as e:
+            # 연장을 확인할 수 없으면 TTL 이 지날 때까지만 리더로 남는다
+            logger.warning(f"[SCHEDULER] 리더 락 연장 실패: {e}")
+            renewed = now - self._renewed_at < self.leader_ttl
+        else:
+            if renewed:
+                self._renewed_at = now
+        if not renewed:
+            self._step_down()
+
+    async def _become_leader(self):
+        # 마지막 실행 기록을 못 읽으면 리더가 되지 않는다 (락은 TTL 뒤 만료)
+        names = list(self.jobs)
+        pipe = get_redis().pipeline(transaction=False)
+        for name in names:
+            pipe.hget(f"scheduler:job:{name}", "last_run")
+        last_runs = await pipe.execute()
+        now = time.time()
+        self._next_runs = {
+            name: self.jobs[name].next_run(float(last) if last else None, now)
+            for name, last in zip(names, last_runs)
+        }
+        self.is_leader = True
+        LEADER_CHANGES.labels("acquired").inc()
+        logger.info(f"[SCHEDULER] 리더 획득: {self._token}")
+
+    def _step_down(self):
+        self.is_leader = False
+        self._next_runs = {}
+        LEADER_CHANGES.labels("lost").inc()
+        logger.warning(f"[SCHEDULER] 리더 상실: {self._token}")
+
+    def _dispatch(self, now: float):
+        for name, next_run in self._next_runs.items():
+            if name not in self._running and now >= next_run:
+                self._running[name] = asyncio.create_task(
+                    self._execute(self.jobs[name])
+                )
+
+    async def _execute(self, job: Job):
+        started_at = time.time()
+        try:
+            await self._record(job.name, {"last_run": started_at})
+            outcome, error = await self._call(job)
+        finally:
+            # 다음 실행 예약은 기록 실패와 상관없이 (같은 작업이 매 tick 다시 실행되지 않게)
+            if self.is_leader:
+                self._next_runs[job.name] = job.next_run(started_at, time.time())
+            self._running.pop(job.name, None)
+
+        await self._record(
+            job.name,
+            {
+                "finished_at": time.time(),
+                "duration_ms": int((time.time() - started_at) * 1000),
+                "outcome": outcome,
+                "error": error,
+            },
+        )
+
+    async def _call(self, job: Job):
+        """작업 실행: (outcome, error)"""
+        start = time.perf_counter()
+        outcome, error = "success", ""
+        try:
+            await asyncio.wait_for(job.func(), job.timeout)
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+            logger.error(f"[SCHEDULER] 작업 시간 초과: {job.name} ({job.timeout}s)")
+        except Exception as e:
+            outcome, error = "error", repr(e)[:ERROR_MAX_LENGTH]
+            logger.exception(f"[SCHEDULER] 작업 실패: {job.name}: {e}")
+
+        duration = time.perf_counter() - start
+        JOB_RUNS.labels(job.name, outcome).inc()
+        JOB_DURATION.labels(job.name).observe(duration)
+        logger.info(
+            f"[SCHEDULER] 작업 완료: {job.name} ({outcome}, {duration * 1000:.0f}ms)"
+        )
+        return outcome, error
+
+    async def _record(self, name: str, mapping: Dict[str, Any]):
+        try:
+            await get_redis().hset(f"scheduler:job:{name}", mapping=mapping)
+        except Exception as e:
+            logger.warning(f"[SCHEDULER] 작업 기록 실패: {name}: {e}")
+
+
+def start_scheduler(register: Callable[[Scheduler], None]) -> Optional[Scheduler]:
+    """워커마다 lifespan 시작 시 호출 (register 로 작업 등록)"""
+    if not settings.SCHEDULER_ENABLED:
+        return None
+    scheduler = Scheduler(leader_ttl=settings.SCHEDULER_LEADER_TTL_MS / 1000)
+    register(scheduler)
+    scheduler.start()
+    return scheduler
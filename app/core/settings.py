@@ -1,7 +1,7 @@
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -26,6 +26,59 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str
     POSTGRES_PORT: str
 
+    # DB 커넥션 풀 (gunicorn 워커마다 따로 생성되므로 워커 수 x MAX_SIZE 가 최대 연결 수)
+    DB_POOL_MIN_SIZE: int = 1
+    DB_POOL_MAX_SIZE: int = 5
+    DB_POOL_MAX_QUERIES: int = 50000  # 연결당 쿼리 수 초과 시 재연결
+    DB_POOL_MAX_INACTIVE_LIFETIME: float = 300.0  # 유휴 연결 유지 시간(초)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+
+    # 읽기 전용 replica (미설정 시 primary 사용)
+    POSTGRES_REPLICA_HOST: Optional[str] = None
+    POSTGRES_REPLICA_PORT: Optional[str] = None
+    DB_REPLICA_RETRY_SECONDS: int = 30  # replica 장애 시 primary 로 우회하는 시간
+
+    # 쿼리 추적 (X-Query-Trace 헤더 값이 토큰과 같거나 샘플링된 요청만)
+    QUERY_TRACE_TOKEN: Optional[str] = None
+    QUERY_TRACE_SAMPLE_RATE: float = 0.0
+    QUERY_TRACE_SLOW_MS: int = 200
+    QUERY_TRACE_REPEAT_THRESHOLD: int = 5  # 같은 형태 쿼리가 이 횟수 이상이면 N+1 의심
+
+    # 이벤트 루프 블로킹 감시
+    LOOP_MONITOR_ENABLED: bool = True
+    LOOP_MONITOR_INTERVAL_MS: int = 100
+    LOOP_BLOCK_THRESHOLD_MS: int = 100
+
+    # 관리자 요청 프로파일링
+    PROFILER_MAX_PER_MINUTE: int = 5  # 전체 워커 합산 분당 최대 프로파일링 수
+    PROFILER_INTERVAL_MS: float = 1.0  # 샘플링 간격
+
+    # 읽기 캐시 (프로세스 내 LRU -> Redis)
+    READ_CACHE_ENABLED: bool = True
+    READ_CACHE_L1_SIZE: int = 2048  # 워커당 항목 수
+    READ_CACHE_L1_TTL: int = 10  # 다른 워커의 무효화 메시지를 놓쳐도 이 시간 안에 갱신
+    READ_CACHE_TTL: int = 300
+
+    # 동일 요청 합치기: 워커 간에도 합칠지 (Redis 락), 락 보유 최대 시간
+    SINGLE_FLIGHT_DISTRIBUTED: bool = False
+    SINGLE_FLIGHT_LOCK_TTL_MS: int = 3000
+
+    # 과부하 시 요청 거절 (워커 단위)
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_POOL_WAIT_MS: int = 50  # DB 풀 대기 시간이 이 이상이면 과부하
+    ADMISSION_MAX_IN_FLIGHT: int = 100
+    ADMISSION_RETRY_AFTER: int = 2  # 거절 응답의 Retry-After (초)
+
+    # 요청 제한 (이름별 "횟수/초" 로 기본 한도 변경, ex. {"login:ip": "50/60"})
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMITS: Dict[str, str] = {}
+
+    # 주기 작업 (워커 중 리더 하나만 실행, 리더 락은 TTL 의 1/3 마다 연장)
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_LEADER_TTL_MS: int = 30000
+    PENDING_USER_RETENTION_DAYS: int = 7  # 이메일 미인증 가입자 보관 기간
+
     # 네이버 SMTP
     SMTP_USER: str
     SMTP_PASSWORD: str
@@ -77,6 +130,59 @@ class TestSettings(BaseSettings):
     POSTGRES_HOST: str = "localhost"
     POSTGRES_PORT: str = "5432"
 
+    # DB 커넥션 풀
+    DB_POOL_MIN_SIZE: int = 1
+    DB_POOL_MAX_SIZE: int = 5
+    DB_POOL_MAX_QUERIES: int = 50000
+    DB_POOL_MAX_INACTIVE_LIFETIME: float = 300.0
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+
+    # 읽기 전용 replica
+    POSTGRES_REPLICA_HOST: Optional[str] = None
+    POSTGRES_REPLICA_PORT: Optional[str] = None
+    DB_REPLICA_RETRY_SECONDS: int = 30
+
+    # 쿼리 추적
+    QUERY_TRACE_TOKEN: Optional[str] = None
+    QUERY_TRACE_SAMPLE_RATE: float = 0.0
+    QUERY_TRACE_SLOW_MS: int = 200
+    QUERY_TRACE_REPEAT_THRESHOLD: int = 5
+
+    # 이벤트 루프 블로킹 감시
+    LOOP_MONITOR_ENABLED: bool = False
+    LOOP_MONITOR_INTERVAL_MS: int = 100
+    LOOP_BLOCK_THRESHOLD_MS: int = 100
+
+    # 관리자 요청 프로파일링
+    PROFILER_MAX_PER_MINUTE: int = 5
+    PROFILER_INTERVAL_MS: float = 1.0
+
+    # 읽기 캐시
+    READ_CACHE_ENABLED: bool = False
+    READ_CACHE_L1_SIZE: int = 2048
+    READ_CACHE_L1_TTL: int = 10
+    READ_CACHE_TTL: int = 300
+
+    # 동일 요청 합치기
+    SINGLE_FLIGHT_DISTRIBUTED: bool = False
+    SINGLE_FLIGHT_LOCK_TTL_MS: int = 3000
+
+    # 과부하 시 요청 거절
+    ADMISSION_ENABLED: bool = False
+    ADMISSION_POOL_WAIT_MS: int = 50
+    ADMISSION_MAX_IN_FLIGHT: int = 100
+    ADMISSION_RETRY_AFTER: int = 2
+
+    # 요청 제한
+    RATE_LIMIT_ENABLED: bool = False
+    RATE_LIMITS: Dict[str, str] = {}
+
+    # 주기 작업
+    SCHEDULER_ENABLED: bool = False
+    SCHEDULER_LEADER_TTL_MS: int = 30000
+    PENDING_USER_RETENTION_DAYS: int = 7
+
     # 네이버 SMTP
     SMTP_USER: str = "test_smtp_user"
     SMTP_PASSWORD: str = "test_smtp_password"
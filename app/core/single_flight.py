@@ -0,0 +1,163 @@
+"""
+동일 요청 합치기 (single-flight).
+
+같은 키로 동시에 들어온 호출은 한 번만 실행하고 결과를 나눠 받는다.
+인기 공고가 공유되어 같은 상세/목록 요청이 몰릴 때 DB 조회가 요청 수만큼 늘지 않게 한다.
+돌려받은 결과는 여러 요청이 함께 쓰므로 호출자는 수정하지 않아야 한다
+(수정이 필요한 곳은 응답 바이트나 pickle 바이트를 합친다).
+
+distributed=True 이면 워커 간에도 합친다: Redis 에 SET NX 락을 잡은 워커만 실행하고
+결과를 pickle 로 잠시 올려 두며, 락을 못 잡은 워커는 그 결과를 기다렸다가 받는다.
+락 보유자가 결과 없이 끝나거나(예외) Redis 장애면 각자 실행한다.
+"""
+
+import asyncio
+import functools
+import logging
+import pickle
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict
+
+from fastapi import Request
+from prometheus_client import Counter
+
+from app.core.redis import get_redis
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 0.02
+RESULT_TTL_MS = 2000  # 기다리던 워커가 가져갈 만큼만
+
+# 내 토큰일 때만 락 해제 (만료 후 다른 워커가 잡은 락을 지우지 않도록)
+RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+SINGLE_FLIGHT_CALLS = Counter(
+    "single_flight_calls_total",
+    "동일 요청 합치기 호출 수 (role: leader, follower, remote, fallback)",
+    ["name", "role"],
+)
+
+
+def request_key(request: Request, user: Any = None) -> str:
+    """경로 + 정렬한 쿼리 + 사용자 (응답이 사용자에 따라 달라지는 목록용)"""
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    return f"{request.url.path}?{query}|{user.id if user else 'anon'}"
+
+
+class SingleFlight:
+    def __init__(self, name: str, distributed: bool = False):
+        self.name = name
+        self.distributed = distributed
+        self._calls: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        call = self._calls.get(key)
+        if call is not None:
+            SINGLE_FLIGHT_CALLS.labels(self.name, "follower").inc()
+        else:
+            # 실행은 호출자와 분리된 task 에서: 먼저 온 요청이 끊겨(취소) 도 나머지는 결과를 받는다
+            call = asyncio.create_task(self._run(key, fn))
+            self._calls[key] = call
+            call.add_done_callback(functools.partial(self._finish, key))
+        return await asyncio.shield(call)
+
+    async def _run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        if self.distributed and settings.SINGLE_FLIGHT_DISTRIBUTED:
+            return await self._do_across_workers(key, fn)
+        SINGLE_FLIGHT_CALLS.labels(self.name, "leader").inc()
+        return await fn()
+
+    def _finish(self, key: str, call: asyncio.Task):
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.cancelled():
+            call.exception()  # 기다리는 쪽이 모두 떠났을 때 "never retrieved" 경고 방지
+
+    async def _do_across_workers(self, key: str, fn: Callable[[], Awaitable[Any]]):
+        lock_key = f"single_flight:lock:{self.name}:{key}"
+        token = uuid.uuid4().hex.encode()
+        try:
+            redis = get_redis(decode_responses=False)
+            acquired = await redis.set(
+                lock_key, token, nx=True, px=settings.SINGLE_FLIGHT_LOCK_TTL_MS
+            )
+            holder = None if acquired else await redis.get(lock_key)
+        except Exception as e:
+            logger.warning(f"[SINGLE-FLIGHT] 락 획득 실패: {lock_key}: {e}")
+            SINGLE_FLIGHT_CALLS.labels(self.name, "fallback").inc()
+            return await fn()
+
+        if acquired:
+            SINGLE_FLIGHT_CALLS.labels(self.name, "leader").inc()
+            try:
+                result = await fn()
+                await self._publish(redis, lock_key, token, result)
+                return result
+            finally:
+                await self._release(redis, lock_key, token)
+
+        if holder:
+            found, result = await self._wait_for(redis, lock_key, holder)
+            if found:
+                SINGLE_FLIGHT_CALLS.labels(self.name, "remote").inc()
+                return result
+        SINGLE_FLIGHT_CALLS.labels(self.name, "fallback").inc()
+        return await fn()
+
+    async def _publish(self, redis, lock_key: str, token: bytes, result: Any):
+        try:
+            await redis.set(
+                f"{lock_key}:{token.decode()}",
+                pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL),
+                px=RESULT_TTL_MS,
+            )
+        except Exception as e:
+            logger.warning(f"[SINGLE-FLIGHT] 결과 공유 실패: {lock_key}: {e}")
+
+    async def _release(self, redis, lock_key: str, token: bytes):
+        try:
+            await redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except Exception as e:
+            logger.warning(f"[SINGLE-FLIGHT] 락 해제 실패: {lock_key}: {e}")
+
+    async def _wait_for(self, redis, lock_key: str, holder: bytes):
+        """락 보유자의 결과를 기다린다: (결과를 받았는지, 결과)"""
+        result_key = f"{lock_key}:{holder.decode()}"
+        deadline = time.monotonic() + settings.SINGLE_FLIGHT_LOCK_TTL_MS / 1000
+        try:
+            while time.monotonic() < deadline:
+                await asyncio.sleep(POLL_INTERVAL)
+                blob, current = await redis.mget(result_key, lock_key)
+                if blob is not None:
+                    return True, pickle.loads(blob)
+                if current != holder:
+                    # 결과 없이 락이 풀렸다 (보유자 예외 등)
+                    break
+        except Exception as e:
+            logger.warning(f"[SINGLE-FLIGHT] 결과 대기 실패: {lock_key}: {e}")
+        return False, None
+
+
+def single_flight(
+    name: str,
+    key: Callable[..., str] = lambda *args, **kwargs: repr((args, kwargs)),
+    distributed: bool = False,
+):
+    """key: 함수 인자 -> 합칠 키 (결과에 영향 없는 인자는 빼고 만든다)"""
+    flight = SingleFlight(name, distributed=distributed)
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await flight.do(key(*args, **kwargs), lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
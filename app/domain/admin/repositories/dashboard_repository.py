@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+from typing import Dict
+
+from tortoise import Tortoise
+from tortoise.functions import Count
+
+from app.domain.job_posting.models import Applicants, JobPosting
+from app.domain.resume.models import Resume
+from app.domain.user.models import BaseUser
+
+
+def _value(status) -> str:
+    return getattr(status, "value", status)
+
+
+async def count_users_by_status() -> Dict[str, int]:
+    rows = (
+        await BaseUser.annotate(count=Count("id"))
+        .group_by("status")
+        .values("status", "count")
+    )
+    return {_value(row["status"]): row["count"] for row in rows}
+
+
+async def count_postings_by_status() -> Dict[str, int]:
+    rows = (
+        await JobPosting.annotate(count=Count("id"))
+        .group_by("status")
+        .values("status", "count")
+    )
+    return {_value(row["status"]): row["count"] for row in rows}
+
+
+async def count_applicants_by_day(days: int) -> Dict[str, int]:
+    since = datetime.utcnow() - timedelta(days=days)
+    conn = Tortoise.get_connection("default")
+    rows = await conn.execute_query_dict(
+        """
+        SELECT DATE(created_at) AS day, COUNT(*) AS count
+        FROM applicants
+        WHERE created_at >= $1
+        GROUP BY DATE(created_at)
+        """,
+        [since],
+    )
+    return {row["day"].isoformat(): row["count"] for row in rows}
+
+
+async def count_applicants() -> int:
+    return await Applicants.all().count()
+
+
+async def count_resumes() -> int:
+    return await Resume.all().count()
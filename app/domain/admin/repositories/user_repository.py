@@ -1,36 +1,127 @@
-from app.domain.user.models import BaseUser, CorporateUser, SeekerUser
+from typing import List, Optional
 
+from tortoise import Tortoise
 
-async def get_seeker_users(search: str = ""):
-    if search:
-        return (
-            await SeekerUser.filter(user__email__icontains=search)
-            .select_related("user")
-            .all()
-        )
-    return await SeekerUser.all().select_related("user")
+from app.domain.user.models import BaseUser
+
+BASE_USER_COLUMNS = (
+    "id",
+    "email",
+    "user_type",
+    "signinMethod",
+    "status",
+    "email_verified",
+    "created_at",
+    "deleted_at",
+    "gender",
+    "leave_reason",
+)
+SEEKER_USER_COLUMNS = (
+    "id",
+    "name",
+    "phone_number",
+    "birth",
+    "interests",
+    "purposes",
+    "sources",
+    "applied_posting",
+    "applied_posting_count",
+    "status",
+    "profile_url",
+)
+CORP_USER_COLUMNS = (
+    "id",
+    "company_name",
+    "business_start_date",
+    "business_number",
+    "company_description",
+    "manager_name",
+    "manager_phone_number",
+    "manager_email",
+    "profile_url",
+)
+
+# base / seeker / corp 프로필을 한 번의 LEFT JOIN 으로 조회
+USER_UNION_SELECT = (
+    "SELECT "
+    + ", ".join(f'u."{c}" AS "base__{c}"' for c in BASE_USER_COLUMNS)
+    + ", "
+    + ", ".join(f's."{c}" AS "seeker__{c}"' for c in SEEKER_USER_COLUMNS)
+    + ", "
+    + ", ".join(f'c."{c}" AS "corp__{c}"' for c in CORP_USER_COLUMNS)
+    + " FROM base_users u"
+    " LEFT JOIN seeker_users s ON s.user_id = u.id"
+    " LEFT JOIN corporate_users c ON c.user_id = u.id"
+)
+
+# 각 테이블의 trigram 인덱스를 따로 타도록 UNION 으로 후보 유저 id 를 모은다
+USER_SEARCH_IDS = """
+    SELECT id FROM base_users WHERE email ILIKE $1
+    UNION SELECT user_id FROM seeker_users WHERE name ILIKE $1
+    UNION SELECT user_id FROM corporate_users
+        WHERE company_name ILIKE $1 OR manager_name ILIKE $1
+"""
+
+
+def _like_pattern(search: str) -> str:
+    escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def split_user_union_row(row: dict) -> dict:
+    """`base__`, `seeker__`, `corp__` 접두사 컬럼을 프로필별 dict 로 분리"""
+    result = {"base": {}, "seeker": {}, "corp": {}}
+    for key, value in row.items():
+        prefix, column = key.split("__", 1)
+        result[prefix][column] = value
 
+    for profile in ("seeker", "corp"):
+        if result[profile]["id"] is None:
+            result[profile] = None
+    return result
+
+
+async def get_user_unions(
+    seeker: bool = False,
+    corp: bool = False,
+    search: Optional[str] = None,
+    offset: int = 0,
+    limit: int = 10,
+) -> List[dict]:
+    conditions, params = [], []
+
+    if seeker and not corp:
+        conditions.append("s.id IS NOT NULL")
+    elif corp and not seeker:
+        conditions.append("c.id IS NOT NULL")
+    else:
+        conditions.append("(s.id IS NOT NULL OR c.id IS NOT NULL)")
 
-async def get_corp_users(search: str = ""):
     if search:
-        return (
-            await CorporateUser.filter(user__email__icontains=search)
-            .select_related("user")
-            .all()
-        )
-    return await CorporateUser.all().select_related("user")
+        params.append(_like_pattern(search))
+        conditions.append(f"u.id IN ({USER_SEARCH_IDS})")
 
+    params.extend([limit, offset * limit])
+    sql = (
+        f"{USER_UNION_SELECT} WHERE {' AND '.join(conditions)}"
+        f" ORDER BY u.id DESC LIMIT ${len(params) - 1} OFFSET ${len(params)}"
+    )
 
-async def get_user_by_id_query(user_id: int):
-    return await BaseUser.filter(id=user_id).first()
+    conn = Tortoise.get_connection("default")
+    rows = await conn.execute_query_dict(sql, params)
+    return [split_user_union_row(row) for row in rows]
 
 
-async def get_seeker_user_by_user_id(user_id: int):
-    return await SeekerUser.filter(user_id=user_id).first()
+async def get_user_union_by_id(user_id: int) -> Optional[dict]:
+    conn = Tortoise.get_connection("default")
+    rows = await conn.execute_query_dict(
+        f"{USER_UNION_SELECT} WHERE u.id = $1 LIMIT 1", [user_id]
+    )
+    return split_user_union_row(rows[0]) if rows else None
 
 
-async def get_corp_user_by_user_id(user_id: int):
-    return await CorporateUser.filter(user_id=user_id).first()
+async def get_user_by_id_query(user_id: int):
+    return await BaseUser.filter(id=user_id).first()
 
 
 async def patch_user_by_id(user, patch_user):
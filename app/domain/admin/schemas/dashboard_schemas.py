@@ -0,0 +1,11 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+
+class DashboardStatsResponseDTO(BaseModel):
+    users: Dict[str, int]  # 유저 상태별 수
+    postings: Dict[str, int]  # 공고 상태별 수
+    applicants_daily: Dict[str, int]  # 일자별(YYYY-MM-DD) 지원자 수
+    applicants_total: int
+    resumes_total: int
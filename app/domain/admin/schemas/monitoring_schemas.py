@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class LoopOffenderResponseDTO(BaseModel):
+    location: str  # 블로킹 시점 가장 안쪽 app 코드 위치 (파일:줄 함수)
+    count: int
@@ -0,0 +1,62 @@
+import logging
+from typing import Any, Dict
+
+from app.domain.admin.repositories.dashboard_repository import (
+    count_applicants,
+    count_applicants_by_day,
+    count_postings_by_status,
+    count_resumes,
+    count_users_by_status,
+)
+from app.domain.admin.schemas.dashboard_schemas import DashboardStatsResponseDTO
+from app.domain.services.dashboard_stats import (
+    get_dashboard_stats,
+    replace_dashboard_stats,
+)
+from app.domain.services.verification import check_superuser
+
+APPLICANT_DAILY_DAYS = 30  # 일자별 지원자 통계 보관 기간
+
+logger = logging.getLogger(__name__)
+
+
+async def aggregate_dashboard_stats() -> Dict[str, Dict[str, int]]:
+    """DB 기준 전체 집계 (COUNT / GROUP BY)"""
+    return {
+        "users": await count_users_by_status(),
+        "postings": await count_postings_by_status(),
+        "applicants_daily": await count_applicants_by_day(APPLICANT_DAILY_DAYS),
+        "totals": {
+            "applicants": await count_applicants(),
+            "resumes": await count_resumes(),
+        },
+    }
+
+
+async def reconcile_dashboard_stats() -> Dict[str, Dict[str, int]]:
+    """주기 작업: 쓰기 경로에서 증감된 redis 카운터를 DB 집계 값으로 보정"""
+    snapshot = await aggregate_dashboard_stats()
+    await replace_dashboard_stats(snapshot)
+    logger.info(f"[STATS] 대시보드 통계 보정 완료: {snapshot['totals']}")
+    return snapshot
+
+
+async def get_dashboard_stats_service(current_user: Any) -> DashboardStatsResponseDTO:
+    check_superuser(current_user)
+
+    try:
+        stats = await get_dashboard_stats()
+        if stats is None:
+            logger.info("[STATS] 집계된 대시보드 통계 없음, DB 집계 후 저장")
+            stats = await reconcile_dashboard_stats()
+    except Exception as e:
+        logger.warning(f"[STATS] redis 통계 조회 실패, DB 직접 집계: {e}")
+        stats = await aggregate_dashboard_stats()
+
+    return DashboardStatsResponseDTO(
+        users=stats["users"],
+        postings=stats["postings"],
+        applicants_daily=stats["applicants_daily"],
+        applicants_total=stats["totals"].get("applicants", 0),
+        resumes_total=stats["totals"].get("resumes", 0),
+    )
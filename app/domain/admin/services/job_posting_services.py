@@ -1,6 +1,8 @@
 import logging
 from typing import List
 
+from app.core.cache import invalidate_tags
+from app.core.http_cache import invalidate_validator, resource_key
 from app.domain.admin.repositories.job_posting_repository import (
     create_reject_posting_by_id,
     delete_job_posting_by_id,
@@ -15,6 +17,9 @@ from app.domain.admin.schemas.job_posting_schemas import (
     RejectPostingResponseDTO,
     StatusEnum,
 )
+from app.domain.job_posting.models import JobPosting
+from app.domain.services.dashboard_stats import incr_posting_status, move_posting_status
+from app.domain.services.posting_changes import record_posting_changes
 from app.domain.services.verification import check_existing, check_superuser
 from app.domain.user.models import BaseUser
 from app.exceptions.job_posting_exceptions import JobPostingNotFoundException
@@ -71,7 +76,7 @@ async def get_all_job_postings_service(
         search_keyword=search_keyword,
         status=status,
     )
-    return [JobPostingResponseDTO.from_orm(p) for p in job_postings]
+    return [JobPostingResponseDTO.model_validate(p) for p in job_postings]
 
 
 async def get_job_posting_by_id_service(
@@ -93,7 +98,13 @@ async def patch_job_posting_by_id_service(
     check_superuser(current_user)
     posting = await get_job_posting_by_id_query(id)
     check_existing(posting, JobPostingNotFoundException)
-    return await patch_job_posting_by_id(posting, patch_job_posting)
+    old_status = posting.status
+    posting = await patch_job_posting_by_id(posting, patch_job_posting)
+    await move_posting_status(old_status, posting.status)
+    await invalidate_validator(resource_key(JobPosting, id))
+    await invalidate_tags(f"posting:{id}")
+    await record_posting_changes([id])
+    return posting
 
 
 async def delete_job_posting_by_id_service(
@@ -104,6 +115,10 @@ async def delete_job_posting_by_id_service(
     posting = await get_job_posting_by_id_query(id)
     check_existing(posting, JobPostingNotFoundException)
     await delete_job_posting_by_id(posting)
+    await incr_posting_status(posting.status, -1)
+    await invalidate_validator(resource_key(JobPosting, id))
+    await invalidate_tags(f"posting:{id}")
+    await record_posting_changes([id])
 
 
 async def create_reject_posting_by_id_service(
@@ -0,0 +1,34 @@
+import logging
+from typing import Any, List
+
+from app.core.loop_monitor import get_top_offenders
+from app.core.profiler import get_profile
+from app.domain.admin.schemas.monitoring_schemas import LoopOffenderResponseDTO
+from app.domain.services.verification import check_existing, check_superuser
+from app.exceptions.monitoring_exceptions import ProfileNotFoundException
+from app.exceptions.search_exceptions import InvalidLimitException
+
+logger = logging.getLogger(__name__)
+
+
+async def get_loop_offenders_service(
+    current_user: Any, limit: int = 20
+) -> List[LoopOffenderResponseDTO]:
+    check_superuser(current_user)
+    if not (1 <= limit <= 100):
+        logger.warning(f"[MONITOR] limit 1이상 100 이하 이어야 합니다 : {limit}")
+        raise InvalidLimitException()
+
+    offenders = await get_top_offenders(limit)
+    return [
+        LoopOffenderResponseDTO(location=location, count=count)
+        for location, count in offenders
+    ]
+
+
+async def get_profile_service(current_user: Any, profile_id: str) -> str:
+    """speedscope 형식 프로파일 JSON 문자열"""
+    check_superuser(current_user)
+    profile = await get_profile(profile_id)
+    check_existing(profile, ProfileNotFoundException)
+    return profile
@@ -8,6 +8,7 @@ from app.domain.admin.repositories.resume_repository import (
     get_user_by_id,
 )
 from app.domain.admin.schemas.resume_schemas import ResumeResponseDTO
+from app.domain.services.dashboard_stats import incr_resume
 from app.domain.services.verification import check_existing, check_superuser
 from app.exceptions.resume_exceptions import ResumeNotFoundException
 from app.exceptions.user_exceptions import UserNotFoundException
@@ -20,7 +21,8 @@ async def get_all_resumes_service(
     user = await get_user_by_id(user_id)
     check_existing(user, UserNotFoundException)
 
-    return await get_all_resumes_query(user_id)
+    resumes = await get_all_resumes_query(user_id)
+    return [ResumeResponseDTO.model_validate(r) for r in resumes]
 
 
 async def get_resume_by_id_service(current_user: Any, id: int) -> ResumeResponseDTO:
@@ -37,3 +39,4 @@ async def delete_resume_by_id_service(current_user: Any, id: int):
     resume = await get_resume_by_id(id)
     check_existing(resume, ResumeNotFoundException)
     await delete_resume_by_id(id)
+    await incr_resume(-1)
@@ -2,11 +2,9 @@ import logging
 from typing import Any, List
 
 from app.domain.admin.repositories.user_repository import (
-    get_corp_user_by_user_id,
-    get_corp_users,
-    get_seeker_user_by_user_id,
-    get_seeker_users,
     get_user_by_id_query,
+    get_user_union_by_id,
+    get_user_unions,
     patch_user_by_id,
 )
 from app.domain.admin.schemas.user_schemas import (
@@ -16,45 +14,52 @@ from app.domain.admin.schemas.user_schemas import (
     UserUnionResponseDTO,
     UserUpdateSchema,
 )
+from app.domain.services.dashboard_stats import move_user_status
 from app.domain.services.verification import check_existing, check_superuser
-from app.exceptions.search_exceptions import SearchKeywordTooLongException
+from app.exceptions.search_exceptions import (
+    InvalidLimitException,
+    InvalidOffsetException,
+    SearchKeywordTooLongException,
+)
 from app.exceptions.user_exceptions import UserNotFoundException
 
 logger = logging.getLogger(__name__)
 
 
+def format_user_union(row: dict) -> UserUnionResponseDTO:
+    return UserUnionResponseDTO(
+        base=UserResponseDTO.model_validate(row["base"]),
+        seeker=SeekerUserResponseSchema.model_validate(row["seeker"])
+        if row["seeker"]
+        else None,
+        corp=CorpUserResponseSchema.model_validate(row["corp"])
+        if row["corp"]
+        else None,
+    )
+
+
 async def get_user_all_service(
-    current_user: Any, seeker: bool, corp: bool, search: str
+    current_user: Any,
+    seeker: bool,
+    corp: bool,
+    search: str,
+    offset: int = 0,
+    limit: int = 10,
 ) -> List[UserUnionResponseDTO]:
     check_superuser(current_user)
 
-    result: List[UserUnionResponseDTO] = []
-
     if search and len(search) > 100:
         logger.warning(f"[USER-LIST] 검색어 길이 초과: {len(search)}")
         raise SearchKeywordTooLongException(100)
+    if offset < 0:
+        logger.warning(f"[USER-LIST] offset는 0이상 이어야 합니다 : {offset}")
+        raise InvalidOffsetException()
+    if not (1 <= limit <= 100):
+        logger.warning(f"[USER-LIST] limit 1이상 100 이하 이어야 합니다 : {limit}")
+        raise InvalidLimitException()
 
-    if seeker or (not seeker and not corp):
-        seeker_users = await get_seeker_users(search)
-        for s in seeker_users:
-            result.append(
-                UserUnionResponseDTO(
-                    base=UserResponseDTO.from_orm(s.user),
-                    seeker=SeekerUserResponseSchema.from_orm(s),
-                )
-            )
-
-    if corp or (not seeker and not corp):
-        corp_users = await get_corp_users(search)
-        for c in corp_users:
-            result.append(
-                UserUnionResponseDTO(
-                    base=UserResponseDTO.from_orm(c.user),
-                    corp=CorpUserResponseSchema.from_orm(c),
-                )
-            )
-
-    return result
+    rows = await get_user_unions(seeker, corp, search, offset, limit)
+    return [format_user_union(row) for row in rows]
 
 
 async def get_user_by_id_service(
@@ -63,17 +68,10 @@ async def get_user_by_id_service(
 ) -> UserUnionResponseDTO:
     check_superuser(current_user)
 
-    user = await get_user_by_id_query(id)
-    check_existing(user, UserNotFoundException)
-
-    seeker_user = await get_seeker_user_by_user_id(id)
-    corp_user = await get_corp_user_by_user_id(id)
+    row = await get_user_union_by_id(id)
+    check_existing(row, UserNotFoundException)
 
-    return UserUnionResponseDTO(
-        base=UserResponseDTO.from_orm(user),
-        seeker=SeekerUserResponseSchema.from_orm(seeker_user) if seeker_user else None,
-        corp=CorpUserResponseSchema.from_orm(corp_user) if corp_user else None,
-    )
+    return format_user_union(row)
 
 
 async def patch_user_by_id_service(
@@ -85,6 +83,8 @@ async def patch_user_by_id_service(
     user = await get_user_by_id_query(id)
     check_existing(user, UserNotFoundException)
 
+    old_status = user.status
     user = await patch_user_by_id(user, patch_user)
+    await move_user_status(old_status, user.status)
 
     return user
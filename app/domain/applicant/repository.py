@@ -1,37 +1,55 @@
-from typing import List, Optional
-
-from app.domain.job_posting.models import Applicants, JobPosting
-
-
-async def get_applicants_by_job_posting(job_posting_id: int) -> List[Applicants]:
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.domain.job_posting.models import Applicants
+
+RESUME_COLUMNS = ("id", "title", "name", "email")
+JOB_POSTING_COLUMNS = (
+    "title",
+    "company",
+    "position",
+    "deadline",
+    "location",
+    "image_url",
+)
+
+
+def applicant_projection(fields: Tuple[str, ...]) -> Dict[str, str]:
+    """응답 필드 -> values() 별칭/컬럼 경로 (이력서/공고 필드는 JOIN 으로 한 번에 조회)"""
+    projection = {}
+    for name in fields:
+        if name == "resume":
+            projection.update({f"resume_{c}": f"resume__{c}" for c in RESUME_COLUMNS})
+        elif name in JOB_POSTING_COLUMNS:
+            projection[name] = f"job_posting__{name}"
+        else:
+            projection[name] = name
+    return projection
+
+
+async def get_applicants_by_job_posting(
+    job_posting_id: int, fields: Tuple[str, ...]
+) -> List[Dict[str, Any]]:
     """특정 공고에 지원한 모든 지원자 조회 - 조회 결과가 없으면 빈 리스트 반환"""
-    return (
-        await Applicants.filter(job_posting_id=job_posting_id)
-        .prefetch_related("resume", "user")
-        .all()
+    return await Applicants.filter(job_posting_id=job_posting_id).values(
+        **applicant_projection(fields)
     )
 
 
 async def repo_get_applicants_by_corporate_user(
-    corporate_user_id: int,
-) -> List[Applicants]:
+    corporate_user_id: int, fields: Tuple[str, ...]
+) -> List[Dict[str, Any]]:
     """기업 사용자가 올린 모든 공고에 대한 지원자 조회 - 공고가 없으면 빈 리스트 반환"""
-    if not await JobPosting.filter(user_id=corporate_user_id).exists():
-        return []  # 예외 대신 빈 리스트 반환
-    job_posting_ids = await JobPosting.filter(user_id=corporate_user_id).values_list(
-        "id", flat=True
-    )
-    return (
-        await Applicants.filter(job_posting_id__in=job_posting_ids)
-        .prefetch_related("resume", "user", "job_posting")
-        .all()
+    return await Applicants.filter(job_posting__user_id=corporate_user_id).values(
+        **applicant_projection(fields)
     )
 
 
-async def get_applicants_by_seeker_user(user_id: int) -> List[Applicants]:
+async def get_applicants_by_seeker_user(
+    user_id: int, fields: Tuple[str, ...]
+) -> List[Dict[str, Any]]:
     """사용자가 지원한 모든 지원서를 조회 - 조회 결과가 없으면 빈 리스트 반환"""
-    return (
-        await Applicants.filter(user_id=user_id).prefetch_related("job_posting").all()
+    return await Applicants.filter(user_id=user_id).values(
+        **applicant_projection(fields)
     )
 
 
@@ -4,6 +4,8 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, field_validator, root_validator
 
+from app.utils.fieldsets import FieldSet
+
 
 class ApplicantEnum(str, Enum):
     Applied = "지원 중"
@@ -54,3 +56,19 @@ class ApplicantResponse(BaseModel):
     image_url: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+APPLICANT_FIELDS = FieldSet(
+    ApplicantResponse,
+    presets={
+        "card": (
+            "job_posting_id",
+            "resume",
+            "status",
+            "created_at",
+            "title",
+            "company",
+            "deadline",
+        ),
+    },
+)
@@ -1,5 +1,5 @@
 import logging
-from typing import List
+from typing import List, Optional
 
 from app.domain.applicant.repository import (
     get_applicant_by_id,
@@ -7,8 +7,8 @@ from app.domain.applicant.repository import (
     get_applicants_by_seeker_user,
     repo_get_applicants_by_corporate_user,
 )
-from app.domain.applicant.schema import ApplicantResponse
-from app.domain.applicant.utils import format_applicant_response
+from app.domain.applicant.schema import APPLICANT_FIELDS, ApplicantResponse
+from app.domain.applicant.utils import format_applicant_response, format_applicant_rows
 from app.domain.job_posting.repository import (
     get_corporate_user_by_base_user,
     rep_get_job_posting_by_id,
@@ -22,21 +22,23 @@ logger = logging.getLogger(__name__)
 
 
 async def get_applicants_by_job_posting_service(
-    user: BaseUser, job_posting_id: int
+    user: BaseUser, job_posting_id: int, fields: Optional[str] = None
 ) -> List[ApplicantResponse]:
     """기업 사용자용: 특정 공고에 대한 모든 지원자 조회"""
+    selected_fields = APPLICANT_FIELDS.resolve(fields)
     job_posting = await rep_get_job_posting_by_id(job_posting_id)
     # BaseUser를 CorporateUser로 변환
     corporate_user = await get_corporate_user_by_base_user(user)
     await validate_user_permissions(corporate_user, job_posting)
 
-    applicants = await get_applicants_by_job_posting(job_posting_id)
-    return [await format_applicant_response(app) for app in applicants]
+    rows = await get_applicants_by_job_posting(job_posting_id, selected_fields)
+    return format_applicant_rows(rows, selected_fields)
 
 
 async def get_all_applicants_by_corporate_user_service(
-    current_user_id: int,
+    current_user_id: int, fields: Optional[str] = None
 ) -> List[ApplicantResponse]:
+    selected_fields = APPLICANT_FIELDS.resolve(fields)
     corporate_user: CorporateUser = await CorporateUser.get_or_none(
         user_id=current_user_id
     )
@@ -46,18 +48,23 @@ async def get_all_applicants_by_corporate_user_service(
         )
         raise PermissionDeniedException()
 
-    applicants = await repo_get_applicants_by_corporate_user(corporate_user.id)
-    if not applicants:
+    rows = await repo_get_applicants_by_corporate_user(
+        corporate_user.id, selected_fields
+    )
+    if not rows:
         logger.warning(
             f"[APPLICANT-SERVICE] CorporateUser ID {corporate_user.id}에 등록된 공고에 지원한 지원자가 없습니다."
         )
         raise NotificationNotFoundException()
-    return [await format_applicant_response(app) for app in applicants]
+    return format_applicant_rows(rows, selected_fields)
 
 
-async def get_applicants_by_seeker_user_service(user_id=int) -> List[ApplicantResponse]:
-    applicants = await get_applicants_by_seeker_user(user_id)
-    return [await format_applicant_response(app) for app in applicants]
+async def get_applicants_by_seeker_user_service(
+    user_id: int, fields: Optional[str] = None
+) -> List[ApplicantResponse]:
+    selected_fields = APPLICANT_FIELDS.resolve(fields)
+    rows = await get_applicants_by_seeker_user(user_id, selected_fields)
+    return format_applicant_rows(rows, selected_fields)
 
 
 async def get_applicant_detail_service(
@@ -1,4 +1,7 @@
-from app.domain.applicant.schema import ApplicantResponse
+from typing import Any, Dict, Iterable, List, Tuple
+
+from app.domain.applicant.repository import RESUME_COLUMNS
+from app.domain.applicant.schema import APPLICANT_FIELDS, ApplicantResponse
 from app.domain.job_posting.models import JobPosting
 from app.domain.resume.models import Resume
 
@@ -32,3 +35,13 @@ async def format_applicant_response(applicant) -> ApplicantResponse:
         location=job_posting.location if job_posting else "",
         image_url=job_posting.image_url if job_posting else "",
     )
+
+
+def format_applicant_rows(
+    rows: Iterable[Dict[str, Any]], fields: Tuple[str, ...]
+) -> List[ApplicantResponse]:
+    """applicant_projection 으로 조회한 행을 선택된 필드의 응답으로 변환"""
+    for row in rows:
+        if "resume" in fields:
+            row["resume"] = {c: row.pop(f"resume_{c}") for c in RESUME_COLUMNS}
+    return APPLICANT_FIELDS.validate_rows(fields, rows)
@@ -1,6 +1,8 @@
+from app.core.cache import cached
 from app.domain.chatbot.model import ChatBot
 
 
+@cached("chatbot", tags=lambda: ("chatbot:all",))
 async def get_all_chatbots():
     return await ChatBot.all()
 
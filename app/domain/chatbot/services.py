@@ -1,5 +1,8 @@
 from typing import Any, List
 
+from app.core.cache import invalidate_tags
+from app.core.http_cache import invalidate_validator, resource_key
+from app.domain.chatbot.model import ChatBot
 from app.domain.chatbot.repository import (
     create_chatbot,
     delete_chatbot_by_id,
@@ -17,11 +20,19 @@ async def get_all_chatbots_service(current_user: Any) -> List[ChatBotResponseDTO
     return await get_all_chatbots()
 
 
+async def check_chatbot_admin_service(current_user: Any):
+    """저장된 검증자로 304 를 줄 때도 관리자 확인은 거친다"""
+    check_superuser(current_user)
+
+
 async def create_chatbot_by_id_service(
     current_user: Any, chatbot: ChatBotCreateUpdate
 ) -> ChatBotResponseDTO:
     check_superuser(current_user)
-    return await create_chatbot(chatbot)
+    created = await create_chatbot(chatbot)
+    await invalidate_validator(resource_key(ChatBot))
+    await invalidate_tags("chatbot:all")
+    return created
 
 
 async def patch_chatbot_by_id_service(
@@ -32,6 +43,8 @@ async def patch_chatbot_by_id_service(
     check_existing(chatbot, ChatBotNotFoundException)
 
     chatbot = await patch_chatbot_by_id(chatbot, update_chatbot)
+    await invalidate_validator(resource_key(ChatBot))
+    await invalidate_tags("chatbot:all")
 
     return chatbot
 
@@ -44,3 +57,5 @@ async def delete_chatbot_by_id_service(
     chatbot = await get_chatbot_by_id(id)
     check_existing(chatbot, ChatBotNotFoundException)
     await delete_chatbot_by_id(chatbot)
+    await invalidate_validator(resource_key(ChatBot))
+    await invalidate_tags("chatbot:all")
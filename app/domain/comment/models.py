@@ -25,3 +25,5 @@ class Comment(TimestampMixin):
     class Meta:
         ordering = ["-created_at"]
         table = "comments"
+        # 게시글별 댓글 커서 페이지네이션 (free_board_id, created_at) 조회용
+        indexes = (("free_board_id", "created_at"),)
@@ -1,14 +1,37 @@
-from typing import Any
+from typing import Any, List, Optional
 
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+
+from app.core.db import run_read
 from app.domain.comment.models import Comment
+from app.domain.free_board.models import FreeBoard
+from app.utils.pagination import keyset_before
 
 
 async def create_comment_by_id(comment: Any, id, current_user):
-    return await Comment.create(**comment.dict(), free_board_id=id, user=current_user)
-
-
-async def get_comments_query(id):
-    return await Comment.filter(free_board_id=id).select_related("user").all()
+    async with in_transaction() as conn:
+        created = await Comment.create(
+            **comment.dict(), free_board_id=id, user=current_user, using_db=conn
+        )
+        await (
+            FreeBoard.filter(id=id)
+            .using_db(conn)
+            .update(comment_count=F("comment_count") + 1)
+        )
+    return created
+
+
+async def get_comments_query(
+    id: int, cursor: Optional[str] = None, limit: int = 20
+) -> List[Comment]:
+    # 다음 페이지 존재 여부 확인을 위해 limit + 1 개 조회
+    query = (
+        Comment.filter(keyset_before(cursor), free_board_id=id)
+        .order_by("-created_at", "-id")
+        .limit(limit + 1)
+    )
+    return await run_read(lambda db: query.using_db(db))
 
 
 async def get_comment_query(id):
@@ -22,4 +45,11 @@ async def patch_comment_by_id(comment, patch_comment):
 
 
 async def delete_comment_by_id(comment):
-    await comment.delete()
+    async with in_transaction() as conn:
+        await comment.delete(using_db=conn)
+        if comment.free_board_id:
+            await (
+                FreeBoard.filter(id=comment.free_board_id, comment_count__gt=0)
+                .using_db(conn)
+                .update(comment_count=F("comment_count") - 1)
+            )
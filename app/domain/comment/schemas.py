@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -16,3 +16,8 @@ class CommentResponseDTO(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class CommentListResponseDTO(BaseModel):
+    data: List[CommentResponseDTO]
+    next_cursor: Optional[str] = None  # 마지막 페이지면 None
@@ -1,4 +1,5 @@
-from typing import Any, List
+import logging
+from typing import Any, Optional
 
 from app.domain.comment.repository import (
     create_comment_by_id,
@@ -7,10 +8,15 @@ from app.domain.comment.repository import (
     get_comments_query,
     patch_comment_by_id,
 )
-from app.domain.comment.schemas import CommentResponseDTO
+from app.domain.comment.schemas import CommentListResponseDTO, CommentResponseDTO
 from app.domain.services.permission import check_author
+from app.domain.services.popularity import FREE_BOARD, record_event
 from app.domain.services.verification import check_existing
 from app.exceptions.comment_exceptions import CommentNotFoundException
+from app.exceptions.search_exceptions import InvalidLimitException
+from app.utils.pagination import encode_cursor
+
+logger = logging.getLogger(__name__)
 
 
 async def create_comment_by_id_service(
@@ -18,13 +24,31 @@ async def create_comment_by_id_service(
     id: int,
     current_user: Any,
 ) -> CommentResponseDTO:
-    return await create_comment_by_id(comment_data, id, current_user)
+    comment = await create_comment_by_id(comment_data, id, current_user)
+    await record_event(FREE_BOARD, id, "comment")
+    return comment
 
 
 async def get_all_comments_service(
     id: int,
-) -> List[CommentResponseDTO]:
-    return await get_comments_query(id)
+    cursor: Optional[str] = None,
+    limit: int = 20,
+) -> CommentListResponseDTO:
+    if not (1 <= limit <= 100):
+        logger.warning(f"[COMMENT] limit 1이상 100 이하 이어야 합니다 : {limit}")
+        raise InvalidLimitException()
+
+    comments = await get_comments_query(id, cursor, limit)
+    has_next = len(comments) > limit
+    comments = comments[:limit]
+
+    next_cursor = (
+        encode_cursor(comments[-1].created_at, comments[-1].id) if has_next else None
+    )
+    return CommentListResponseDTO(
+        data=[CommentResponseDTO.model_validate(c) for c in comments],
+        next_cursor=next_cursor,
+    )
 
 
 async def patch_comment_by_id_service(
@@ -12,7 +12,13 @@ class FreeBoard(TimestampMixin):
     content = fields.TextField(default="")
     image_url = fields.CharField(max_length=255, null=True)
     view_count = fields.IntField(default=0)
+    # 댓글 생성/삭제 시 같은 트랜잭션에서 갱신되는 비정규화 카운터
+    comment_count = fields.IntField(default=0)
+    # redis 인기 랭킹 점수 스냅샷 (복구용)
+    popularity_score = fields.FloatField(default=0)
 
     class Meta:
         table = "free_boards"
         ordering = ["-created_at"]
+        # 인기 랭킹 복구/장애 시 스냅샷 조회 (ORDER BY popularity_score DESC LIMIT)
+        indexes = (("popularity_score",),)
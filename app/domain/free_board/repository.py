@@ -1,6 +1,21 @@
-from typing import Any
+from typing import Any, List, Optional
 
+from tortoise import Tortoise
+
+from app.core.cache import cached
+from app.core.db import run_read
 from app.domain.free_board.models import FreeBoard
+from app.utils.pagination import keyset_before
+
+SYNC_COMMENT_COUNT_SQL = (
+    "UPDATE free_boards f SET comment_count = COALESCE(c.cnt, 0)"
+    " FROM free_boards b"
+    " LEFT JOIN ("
+    "   SELECT free_board_id, COUNT(*) AS cnt FROM comments"
+    "   WHERE free_board_id IS NOT NULL GROUP BY free_board_id"
+    " ) c ON c.free_board_id = b.id"
+    " WHERE f.id = b.id AND f.comment_count IS DISTINCT FROM COALESCE(c.cnt, 0)"
+)
 
 
 async def create_free_board_by_id(free_board: Any, current_user):
@@ -8,11 +23,59 @@ async def create_free_board_by_id(free_board: Any, current_user):
 
 
 async def get_free_boards_query():
-    return await FreeBoard.all().select_related("user")
+    return await run_read(
+        lambda db: FreeBoard.all().using_db(db).select_related("user")
+    )
+
+
+FEED_COLUMNS = (
+    "id",
+    "title",
+    "image_url",
+    "view_count",
+    "comment_count",
+    "created_at",
+)
+
+
+async def get_free_board_feed_query(cursor: Optional[str], limit: int):
+    """목록 카드에 필요한 컬럼만 조회, 다음 페이지 확인을 위해 limit + 1 개 조회"""
+    query = (
+        FreeBoard.filter(keyset_before(cursor))
+        .order_by("-created_at", "-id")
+        .limit(limit + 1)
+    )
+    return await run_read(
+        lambda db: query.using_db(db).values(
+            *FEED_COLUMNS, user_id="user_id", user_email="user__email"
+        )
+    )
+
+
+async def get_free_board_cards_by_ids_query(ids: List[int]) -> List[dict]:
+    """주어진 id 순서대로 목록 카드 컬럼 조회"""
+    rows = await run_read(
+        lambda db: FreeBoard.filter(id__in=ids)
+        .using_db(db)
+        .values(*FEED_COLUMNS, user_id="user_id", user_email="user__email")
+    )
+    by_id = {row["id"]: row for row in rows}
+    return [by_id[i] for i in ids if i in by_id]
+
+
+async def sync_free_board_comment_counts() -> int:
+    """comment_count 를 실제 댓글 수로 다시 맞춘다 (컬럼 추가 후 backfill, 주기 보정용)"""
+    conn = Tortoise.get_connection("default")
+    count, _ = await conn.execute_query(SYNC_COMMENT_COUNT_SQL)
+    return count
 
 
-async def get_free_board_query(id: int):
-    return await FreeBoard.filter(pk=id).select_related("user").first()
+@cached("free_board", tags=lambda id, **_: (f"free_board:{id}",))
+async def get_free_board_query(id: int, use_replica: bool = False):
+    query = FreeBoard.filter(pk=id).select_related("user")
+    if use_replica:
+        return await run_read(lambda db: query.using_db(db).first())
+    return await query.first()
 
 
 async def patch_free_board_by_id(board, patch_free_board):
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, EmailStr, Field, model_validator
 
@@ -39,3 +39,18 @@ class FreeBoardResponseDTO(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class FreeBoardFeedItemDTO(BaseModel):
+    id: int
+    user: UserSchema
+    title: str
+    image_url: Optional[str] = None
+    view_count: int
+    comment_count: int
+    created_at: datetime
+
+
+class FreeBoardFeedResponseDTO(BaseModel):
+    data: List[FreeBoardFeedItemDTO]
+    next_cursor: Optional[str] = None  # 마지막 페이지면 None
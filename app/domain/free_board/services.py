@@ -1,16 +1,38 @@
-from typing import Any, List
+import logging
+from typing import Any, List, Optional
 
+from app.core.cache import invalidate_tags
+from app.core.http_cache import invalidate_validator, resource_key
+from app.core.single_flight import single_flight
+from app.domain.free_board.models import FreeBoard
 from app.domain.free_board.repository import (
     create_free_board_by_id,
     delete_free_board_by_id,
+    get_free_board_cards_by_ids_query,
+    get_free_board_feed_query,
     get_free_board_query,
     get_free_boards_query,
     patch_free_board_by_id,
 )
-from app.domain.free_board.schemas import FreeBoardResponseDTO
+from app.domain.free_board.schemas import (
+    FreeBoardFeedItemDTO,
+    FreeBoardFeedResponseDTO,
+    FreeBoardResponseDTO,
+    UserSchema,
+)
 from app.domain.services.permission import check_author
+from app.domain.services.popularity import (
+    FREE_BOARD,
+    get_top_ids,
+    record_event,
+    remove_target,
+)
 from app.domain.services.verification import check_existing
 from app.exceptions.free_board_exceptions import FreeBoardNotFoundException
+from app.exceptions.search_exceptions import InvalidLimitException
+from app.utils.pagination import encode_cursor
+
+logger = logging.getLogger(__name__)
 
 
 async def create_free_board_by_id_service(
@@ -19,33 +41,92 @@ async def create_free_board_by_id_service(
     return await create_free_board_by_id(free_board, current_user)
 
 
+@single_flight("free_board_list", distributed=True)
 async def get_all_free_board_service() -> List[FreeBoardResponseDTO]:
     """전체조회"""
     return await get_free_boards_query()
 
 
+def _to_feed_item(row: dict) -> FreeBoardFeedItemDTO:
+    return FreeBoardFeedItemDTO(
+        id=row["id"],
+        user=UserSchema(id=row["user_id"], email=row["user_email"]),
+        title=row["title"],
+        image_url=row["image_url"],
+        view_count=row["view_count"],
+        comment_count=row["comment_count"],
+        created_at=row["created_at"],
+    )
+
+
+@single_flight("free_board_feed", distributed=True)
+async def get_free_board_feed_service(
+    cursor: Optional[str] = None, limit: int = 10
+) -> FreeBoardFeedResponseDTO:
+    """목록 피드 - (created_at, id) 커서 페이지네이션"""
+    if not (1 <= limit <= 100):
+        logger.warning(f"[FREE-BOARD] limit 1이상 100 이하 이어야 합니다 : {limit}")
+        raise InvalidLimitException()
+
+    rows = await get_free_board_feed_query(cursor, limit)
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    data = [_to_feed_item(r) for r in rows]
+    next_cursor = (
+        encode_cursor(rows[-1]["created_at"], rows[-1]["id"]) if has_next else None
+    )
+    return FreeBoardFeedResponseDTO(data=data, next_cursor=next_cursor)
+
+
+@single_flight("free_board_popular", distributed=True)
+async def get_popular_free_boards_service(
+    limit: int = 10,
+) -> List[FreeBoardFeedItemDTO]:
+    """시간 감쇠 인기순 상위 limit 개"""
+    if not (1 <= limit <= 100):
+        logger.warning(f"[FREE-BOARD] limit 1이상 100 이하 이어야 합니다 : {limit}")
+        raise InvalidLimitException()
+
+    ids = await get_top_ids(FREE_BOARD, limit)
+    if not ids:
+        return []
+    rows = await get_free_board_cards_by_ids_query(ids)
+    return [_to_feed_item(r) for r in rows]
+
+
 async def get_free_board_by_id_service(id: int) -> FreeBoardResponseDTO:
     """상세조회"""
-    board = await get_free_board_query(id)
+    board = await get_free_board_query(id, use_replica=True)
     check_existing(board, FreeBoardNotFoundException)
+    await record_free_board_view_service(id)
     return board
 
 
+async def record_free_board_view_service(id: int):
+    await record_event(FREE_BOARD, id, "view")
+
+
 async def patch_free_board_by_id_service(
     id: int, free_board: Any, current_user: Any
 ) -> FreeBoardResponseDTO:
     """업데이트"""
-    board = await get_free_board_query(id)
+    board = await get_free_board_query(id, fresh=True)
     check_existing(board, FreeBoardNotFoundException)
     await check_author(board, current_user)
     board = await patch_free_board_by_id(board, free_board)
+    await invalidate_validator(resource_key(FreeBoard, id))
+    await invalidate_tags(f"free_board:{id}")
 
     return board
 
 
 async def delete_free_board_by_id_service(id: int, current_user):
     """삭제"""
-    board = await get_free_board_query(id)
+    board = await get_free_board_query(id, fresh=True)
     check_existing(board, FreeBoardNotFoundException)
     await check_author(board, current_user)
     await delete_free_board_by_id(board)
+    await remove_target(FREE_BOARD, id)
+    await invalidate_validator(resource_key(FreeBoard, id))
+    await invalidate_tags(f"free_board:{id}")
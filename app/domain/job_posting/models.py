@@ -3,6 +3,7 @@ from enum import Enum
 from tortoise import fields
 from tortoise.models import Model
 
+from app.domain.job_posting.utils import parse_deadline
 from app.utils.model import TimestampMixin
 
 
@@ -52,6 +53,8 @@ class JobPosting(TimestampMixin, Model):
     recruitment_count = fields.IntField(default=0)
     education = fields.CharField(max_length=20)
     deadline = fields.CharField(max_length=20)
+    # deadline 을 파싱한 날짜 (저장 시 자동 갱신, 날짜가 아닌 값이면 null)
+    deadline_date = fields.DateField(null=True)
     salary = fields.CharField(max_length=20)
     summary = fields.TextField(null=True)
     description = fields.TextField()
@@ -66,6 +69,20 @@ class JobPosting(TimestampMixin, Model):
     class Meta:
         table = "job_postings"
         ordering = ["-created_at"]
+        indexes = (("status", "deadline_date"),)
+
+    async def save(
+        self, using_db=None, update_fields=None, force_create=False, force_update=False
+    ):
+        self.deadline_date = parse_deadline(self.deadline)
+        if update_fields is not None and "deadline" in update_fields:
+            update_fields = [*update_fields, "deadline_date"]
+        await super().save(
+            using_db=using_db,
+            update_fields=update_fields,
+            force_create=force_create,
+            force_update=force_update,
+        )
 
 
 class RejectPosting(Model):
@@ -1,26 +1,55 @@
-from typing import List, Optional
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
 
+from tortoise import Tortoise
+
+from app.core.cache import cached
 from app.domain.job_posting.models import JobPosting
 from app.domain.user.models import BaseUser, CorporateUser
 from app.exceptions.job_posting_exceptions import NotCorpUserException
 
+# (id, 마감일) 배열을 한 번에 반영
+SET_DEADLINE_DATES_SQL = (
+    "UPDATE job_postings p SET deadline_date = v.deadline_date"
+    " FROM unnest($1::int[], $2::date[]) AS v(id, deadline_date)"
+    " WHERE p.id = v.id"
+)
+
+# 마감일 범위 [$3, $4) 에 든 $2 상태 공고를 id 순으로 $5 건씩 $1 상태로 변경
+# (SKIP LOCKED: 같은 공고를 수정 중인 요청을 기다리지 않고 다음 배치로 넘긴다)
+TRANSITION_STATUS_SQL = (
+    "WITH target AS ("
+    "   SELECT id, status FROM job_postings"
+    "   WHERE status = ANY($2::text[]) AND deadline_date >= $3 AND deadline_date < $4"
+    "   ORDER BY id LIMIT $5 FOR UPDATE SKIP LOCKED"
+    " )"
+    " UPDATE job_postings p SET status = $1, updated_at = now()"
+    " FROM target t WHERE p.id = t.id"
+    " RETURNING p.id, t.status AS old_status"
+)
+
 
 async def get_corporate_user_by_base_user(user: BaseUser) -> CorporateUser:
     if "business" not in user.user_type:
         raise NotCorpUserException()
-    corporate_user = await CorporateUser.get_or_none(user=user)
-    return corporate_user
+    return await get_corporate_user_by_user_id(user.id)
+
 
+@cached("user", tags=lambda user_id: (f"user:{user_id}",))
+async def get_corporate_user_by_user_id(user_id: int) -> Optional[CorporateUser]:
+    return await CorporateUser.get_or_none(user_id=user_id)
 
+
+@cached("posting", tags=lambda job_posting_id: (f"posting:{job_posting_id}",))
 async def rep_get_job_posting_by_id(job_posting_id: int) -> Optional[JobPosting]:
     return await JobPosting.filter(id=job_posting_id).select_related("user").first()
 
 
 async def rep_get_job_postings_by_user(
-    corporate_user: CorporateUser,
-) -> List[JobPosting]:
-    # 특정 CorporateUser가 올린 모든 공고 조회 (없으면 빈 리스트 반환)
-    return await JobPosting.filter(user=corporate_user).all()
+    corporate_user: CorporateUser, columns: Tuple[str, ...]
+) -> List[Dict[str, Any]]:
+    # 특정 CorporateUser가 올린 모든 공고의 선택된 컬럼만 조회 (없으면 빈 리스트 반환)
+    return await JobPosting.filter(user=corporate_user).values(*columns)
 
 
 async def rep_get_job_posting_by_company_and_id(
@@ -62,3 +91,31 @@ async def toggle_job_posting_bookmark(seeker_user, posting):
     else:
         await seeker_user.interests_posting.add(posting)
         return True
+
+
+async def rep_get_postings_without_deadline_date(
+    after_id: int, limit: int
+) -> List[Tuple[int, str]]:
+    """deadline_date 가 비어 있는 공고 (id, deadline) 를 id 순으로"""
+    return (
+        await JobPosting.filter(deadline_date__isnull=True, id__gt=after_id)
+        .order_by("id")
+        .limit(limit)
+        .values_list("id", "deadline")
+    )
+
+
+async def rep_set_deadline_dates(ids: List[int], dates: List[date]) -> int:
+    conn = Tortoise.get_connection("default")
+    count, _ = await conn.execute_query(SET_DEADLINE_DATES_SQL, [ids, dates])
+    return count
+
+
+async def rep_transition_postings_by_deadline(
+    from_statuses: List[str], to_status: str, start: date, end: date, limit: int
+) -> List[Dict[str, Any]]:
+    """한 배치 상태 변경: [{"id", "old_status"}, ...]"""
+    conn = Tortoise.get_connection("default")
+    return await conn.execute_query_dict(
+        TRANSITION_STATUS_SQL, [to_status, from_statuses, start, end, limit]
+    )
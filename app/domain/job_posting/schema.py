@@ -10,6 +10,7 @@ from app.domain.job_posting.models import (
     MethodEnum,
     StatusEnum,
 )
+from app.utils.fieldsets import FieldSet
 
 
 class ApplicantEnum(str, Enum):
@@ -93,3 +94,20 @@ class JobPostingResponse(BaseModel):
     @field_serializer("deadline")
     def serialize_deadline(self, value: str, _info) -> str:
         return datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+
+
+JOB_POSTING_RESPONSE_FIELDS = FieldSet(
+    JobPostingResponse,
+    presets={
+        "card": (
+            "title",
+            "company",
+            "location",
+            "salary",
+            "deadline",
+            "status",
+            "view_count",
+            "created_at",
+        ),
+    },
+)
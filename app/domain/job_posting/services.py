@@ -1,7 +1,11 @@
 import logging
-from typing import List
+from collections import Counter
+from datetime import date, timedelta
+from typing import Dict, List, Optional
 
-from app.domain.job_posting.models import JobPosting
+from app.core.cache import invalidate_tags
+from app.core.http_cache import invalidate_validator, resource_key
+from app.domain.job_posting.models import JobPosting, StatusEnum
 from app.domain.job_posting.repository import (
     get_corporate_user_by_base_user,
     rep_create_job_posting,
@@ -9,11 +13,21 @@ from app.domain.job_posting.repository import (
     rep_get_job_posting_by_company_and_id,
     rep_get_job_posting_by_id,
     rep_get_job_postings_by_user,
+    rep_get_postings_without_deadline_date,
+    rep_set_deadline_dates,
+    rep_transition_postings_by_deadline,
     rep_update_job_posting,
     toggle_job_posting_bookmark,
 )
-from app.domain.job_posting.schema import JobPostingCreateUpdate, JobPostingResponse
+from app.domain.job_posting.schema import (
+    JOB_POSTING_RESPONSE_FIELDS,
+    JobPostingCreateUpdate,
+    JobPostingResponse,
+)
+from app.domain.job_posting.utils import parse_deadline
 from app.domain.resume.repository import get_seeker_user
+from app.domain.services.dashboard_stats import incr_posting_status, move_posting_status
+from app.domain.services.posting_changes import record_posting_changes
 from app.domain.services.verification import check_existing
 from app.domain.user.models import BaseUser, CorporateUser
 from app.exceptions.auth_exceptions import PermissionDeniedException
@@ -25,6 +39,8 @@ from app.exceptions.user_exceptions import UserNotFoundException
 
 logger = logging.getLogger(__name__)
 
+CLOSING_SOON_DAYS = 3  # 오늘부터 이 일수 안에 마감하면 마감 임박
+
 
 def format_job_posting_response(job_posting: JobPosting) -> JobPostingResponse:
     return JobPostingResponse.from_orm(job_posting)
@@ -50,6 +66,8 @@ async def create_job_posting(
     job_posting = await rep_create_job_posting(
         corporate_user=corporate_user, data=data.model_dump()
     )
+    await incr_posting_status(job_posting.status)
+    await record_posting_changes([job_posting.id])
     return format_job_posting_response(job_posting)
 
 
@@ -58,7 +76,7 @@ async def patch_job_posting(
     job_posting_id: int,
     updated_data: JobPostingCreateUpdate,
 ) -> JobPostingResponse:
-    job_posting = await rep_get_job_posting_by_id(job_posting_id)
+    job_posting = await rep_get_job_posting_by_id(job_posting_id, fresh=True)
     if not job_posting:
         logger.warning(
             f"[JOBPOSTING-SERVICE] patch_job_posting 실패: JobPosting id {job_posting_id} not found."
@@ -70,7 +88,12 @@ async def patch_job_posting(
         await _check_title_duplication(
             updated_fields["title"], exclude_id=job_posting.id
         )
+    old_status = job_posting.status
     updated_job_posting = await rep_update_job_posting(job_posting, updated_fields)
+    await move_posting_status(old_status, updated_job_posting.status)
+    await invalidate_validator(resource_key(JobPosting, job_posting.id))
+    await invalidate_tags(f"posting:{job_posting.id}")
+    await record_posting_changes([job_posting.id])
     return format_job_posting_response(updated_job_posting)
 
 
@@ -86,10 +109,11 @@ async def _check_title_duplication(title: str, exclude_id: int = None):
 
 
 async def get_job_postings_by_company_user(
-    user: CorporateUser,
+    user: CorporateUser, fields: Optional[str] = None
 ) -> List[JobPostingResponse]:
-    job_postings = await rep_get_job_postings_by_user(user)
-    return [JobPostingResponse.from_orm(posting) for posting in job_postings]
+    selected_fields = JOB_POSTING_RESPONSE_FIELDS.resolve(fields)
+    rows = await rep_get_job_postings_by_user(user, selected_fields)
+    return JOB_POSTING_RESPONSE_FIELDS.validate_rows(selected_fields, rows)
 
 
 async def get_specific_job_posting(
@@ -109,7 +133,7 @@ async def get_specific_job_posting(
 async def delete_job_posting(
     corporate_user: CorporateUser, job_posting_id: int
 ) -> dict:
-    job_posting = await rep_get_job_posting_by_id(job_posting_id)
+    job_posting = await rep_get_job_posting_by_id(job_posting_id, fresh=True)
     if not job_posting:
         logger.warning(
             f"[JOBPOSTING-SERVICE] delete_job_posting 실패: JobPosting id {job_posting_id} not found."
@@ -117,6 +141,10 @@ async def delete_job_posting(
         raise NotificationNotFoundException()
     await validate_user_permissions(corporate_user, job_posting)
     await rep_delete_job_posting(job_posting)
+    await incr_posting_status(job_posting.status, -1)
+    await invalidate_validator(resource_key(JobPosting, job_posting_id))
+    await invalidate_tags(f"posting:{job_posting_id}")
+    await record_posting_changes([job_posting_id])
     return {"message": "구인 공고 삭제가 완료되었습니다.", "data": job_posting_id}
 
 
@@ -129,3 +157,83 @@ async def toggle_bookmark(current_user: BaseUser, id: int):
         raise NotificationNotFoundException()
     seeker_user = await get_seeker_user(current_user)
     return await toggle_job_posting_bookmark(seeker_user, job_posting)
+
+
+async def backfill_deadline_dates(batch_size: int = 1000) -> int:
+    """
+    주기 작업: deadline_date 가 비어 있는 공고를 배치로 채운다 (컬럼 추가 후 backfill,
+    save() 를 거치지 않고 들어온 행 보정). 날짜가 아닌 deadline 은 null 로 남는다.
+    """
+    after_id, updated, skipped = 0, 0, 0
+    while True:
+        rows = await rep_get_postings_without_deadline_date(after_id, batch_size)
+        if not rows:
+            break
+        after_id = rows[-1][0]
+        parsed = [(id, parse_deadline(deadline)) for id, deadline in rows]
+        parsed = [(id, deadline) for id, deadline in parsed if deadline]
+        skipped += len(rows) - len(parsed)
+        if parsed:
+            ids, dates = zip(*parsed)
+            updated += await rep_set_deadline_dates(list(ids), list(dates))
+
+    logger.info(f"[JOB_POSTING] 마감일 backfill: {updated}건 갱신, 날짜 아님 {skipped}건")
+    return updated
+
+
+async def transition_postings_by_deadline(batch_size: int = 1000) -> Dict[str, int]:
+    """
+    주기 작업: 마감일이 지난 모집중/마감 임박 공고는 모집 종료로,
+    CLOSING_SOON_DAYS 안에 마감하는 모집중 공고는 마감 임박으로 바꾼다.
+    공고를 불러오지 않고 배치 UPDATE 로 바꾸고, 캐시 무효화와 통계 반영은 배치마다 한 번씩 한다.
+    """
+    today = date.today()
+    closed = await _transition_in_batches(
+        [StatusEnum.Open, StatusEnum.Closing_soon],
+        StatusEnum.Closed,
+        date.min,
+        today,
+        batch_size,
+    )
+    closing_soon = await _transition_in_batches(
+        [StatusEnum.Open],
+        StatusEnum.Closing_soon,
+        today,
+        today + timedelta(days=CLOSING_SOON_DAYS + 1),
+        batch_size,
+    )
+    logger.info(f"[JOB_POSTING] 마감일 상태 변경: 모집 종료 {closed}건, 마감 임박 {closing_soon}건")
+    return {
+        StatusEnum.Closed.value: closed,
+        StatusEnum.Closing_soon.value: closing_soon,
+    }
+
+
+async def _transition_in_batches(
+    from_statuses: List[StatusEnum],
+    to_status: StatusEnum,
+    start: date,
+    end: date,
+    batch_size: int,
+) -> int:
+    total = 0
+    while True:
+        rows = await rep_transition_postings_by_deadline(
+            [s.value for s in from_statuses], to_status.value, start, end, batch_size
+        )
+        if not rows:
+            break
+        total += len(rows)
+
+        ids = [row["id"] for row in rows]
+        for old_status, count in Counter(row["old_status"] for row in rows).items():
+            await move_posting_status(old_status, to_status, count)
+        await invalidate_validator(*(resource_key(JobPosting, id) for id in ids))
+        # 태그 무효화 메시지 하나가 배치 전체의 변경 알림이 된다
+        await invalidate_tags(*(f"posting:{id}" for id in ids))
+        await record_posting_changes(ids)
+
+        # 잠겨 있어 건너뛴 공고는 다음 실행에서 처리
+        if len(rows) < batch_size:
+            break
+    return total
@@ -0,0 +1,25 @@
+import re
+from datetime import date
+from typing import Optional
+
+# 2025-06-30, 2025.06.30, 2025/6/30, 2025. 6. 30., 20250630, 2025년 6월 30일 (뒤의 "까지" 등은 무시)
+DEADLINE_PATTERNS = (
+    re.compile(r"^(\d{4})\s*[-./]\s*(\d{1,2})\s*[-./]\s*(\d{1,2})"),
+    re.compile(r"^(\d{4})(\d{2})(\d{2})(?!\d)"),
+    re.compile(r"^(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일"),
+)
+
+
+def parse_deadline(value: Optional[str]) -> Optional[date]:
+    """deadline 문자열 -> 날짜 (상시채용, 채용시 마감 등 날짜가 아니면 None)"""
+    if not value:
+        return None
+    text = value.strip()
+    for pattern in DEADLINE_PATTERNS:
+        match = pattern.match(text)
+        if match:
+            try:
+                return date(*(int(part) for part in match.groups()))
+            except ValueError:
+                return None
+    return None
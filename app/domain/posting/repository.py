@@ -1,14 +1,20 @@
-from typing import Any, Optional
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from tortoise.expressions import Q
+from tortoise.expressions import F, Q
 
+from app.core.cache import cached
+from app.core.db import run_read
 from app.domain.job_posting.models import ApplicantEnum, Applicants, JobPosting
 from app.domain.posting.schemas import (
+    JOB_POSTING_FIELDS,
     JobPostingResponseDTO,
     PaginatedJobPostingsResponseDTO,
+    RecommendedPostingsResponseDTO,
 )
 from app.domain.resume.models import Resume
 from app.domain.user.models import SeekerUser
+from app.utils.fieldsets import partial_page_schema
 
 
 async def get_postings_query(
@@ -23,9 +29,14 @@ async def get_postings_query(
     current_user: Optional[Any] = None,
     offset: Optional[int] = 0,
     limit: Optional[int] = 100,
+    fields: Optional[Tuple[str, ...]] = None,
+    deadline_after: Optional[date] = None,
+    deadline_before: Optional[date] = None,
+    sort: str = "latest",
 ):
+    fields = fields or JOB_POSTING_FIELDS.resolve(None)
     bookmarked_ids = []
-    if current_user:
+    if current_user and "is_bookmarked" in fields:
         seeker = await SeekerUser.get_or_none(user=current_user).prefetch_related(
             "interests_posting"
         )
@@ -33,11 +44,7 @@ async def get_postings_query(
             bookmarked_ids = await seeker.interests_posting.all().values_list(
                 "id", flat=True
             )
-    query = (
-        JobPosting.filter(status__in=["모집중", "마감 임박", "모집 종료"])
-        .select_related("user")
-        .all()
-    )
+    query = JobPosting.filter(status__in=["모집중", "마감 임박", "모집 종료"])
 
     # 검색 키워드 (제목, 회사, 요약, 포지션, 위치, 고용 형태)
     if search_keyword:
@@ -99,33 +106,156 @@ async def get_postings_query(
             employ_method__in=[m for m in methods if m in allowed_methods]
         )
 
-    total = await query.count()
+    # (status, deadline_date) 인덱스 범위 조회
+    if deadline_after:
+        query = query.filter(deadline_date__gte=deadline_after)
+    if deadline_before:
+        query = query.filter(deadline_date__lte=deadline_before)
+    if sort == "closing_soon":
+        query = query.filter(
+            status__in=["모집중", "마감 임박"], deadline_date__gte=date.today()
+        ).order_by("deadline_date", "id")
+
+    total = await run_read(lambda db: query.using_db(db).count())
     start = offset * limit
-    postings = await query.offset(start).limit(limit)
-    result = []
-    for post in postings:
-        dto = JobPostingResponseDTO.from_orm(post)
-        dto.is_bookmarked = post.id in bookmarked_ids
-        result.append(dto.model_dump())
-
-    return PaginatedJobPostingsResponseDTO(
+    columns = posting_columns(fields)
+    rows = await run_read(
+        lambda db: query.using_db(db).offset(start).limit(limit).values(*columns)
+    )
+
+    # data 는 이미 검증된 DTO 이므로 페이지 래퍼는 재검증 없이 조립
+    page = partial_page_schema(
+        PaginatedJobPostingsResponseDTO, JobPostingResponseDTO, fields
+    )
+    return page.model_construct(
         total=total,
         offset=offset,
         limit=limit,
-        data=result,
+        data=to_posting_dtos(rows, bookmarked_ids, fields),
+    )
+
+
+def posting_columns(fields: Tuple[str, ...]) -> List[str]:
+    """응답 필드 -> SELECT 컬럼 (user 는 FK 컬럼만, is_bookmarked 는 계산 필드)"""
+    columns = []
+    for name in fields:
+        if name == "user":
+            columns.append("user_id")
+        elif name != "is_bookmarked":
+            columns.append(name)
+    return columns
+
+
+def to_posting_dtos(
+    rows: Iterable[Dict[str, Any]],
+    bookmarked_ids: Iterable[int],
+    fields: Optional[Tuple[str, ...]] = None,
+) -> List[JobPostingResponseDTO]:
+    fields = fields or JOB_POSTING_FIELDS.resolve(None)
+    bookmarked = set(bookmarked_ids)
+    for row in rows:
+        if "user_id" in row:
+            row["user"] = {"id": row.pop("user_id")}
+        if "is_bookmarked" in fields:
+            row["is_bookmarked"] = row["id"] in bookmarked
+    return JOB_POSTING_FIELDS.validate_rows(fields, rows)
+
+
+RECOMMEND_STATUSES = ["모집중", "마감 임박"]
+RECOMMEND_TEXT_COLUMNS = ("id", "title", "position", "location")
+SIMILAR_POSTING_COLUMNS = (*RECOMMEND_TEXT_COLUMNS, "employment_type", "career")
+MAX_RECOMMEND_BOOKMARKS = 50
+
+
+async def get_active_posting_texts_query(
+    ids: Optional[List[int]] = None,
+    columns: Tuple[str, ...] = RECOMMEND_TEXT_COLUMNS,
+) -> List[Tuple]:
+    """
+    추천/비슷한 공고 인덱스용 (id, 제목, 포지션, 지역[, 고용 형태, 경력]).
+    전체 구성은 replica, 변경분은 primary 에서 읽는다.
+    """
+    query = JobPosting.filter(status__in=RECOMMEND_STATUSES)
+    if ids is not None:
+        return await query.filter(id__in=ids).values_list(*columns)
+    return await run_read(
+        lambda db: query.using_db(db).order_by("id").values_list(*columns)
+    )
+
+
+async def get_seeker_signals_query(seeker: SeekerUser):
+    """
+    추천에 쓰는 구직자 정보:
+    (관심 분야 목록, 희망 지역 목록, 최근 북마크 공고 텍스트, 북마크한 공고 id 전체)
+    """
+    resumes = await run_read(
+        lambda db: Resume.filter(user_id=seeker.id)
+        .using_db(db)
+        .values_list("interests", "desired_area")
+    )
+    bookmark_query = JobPosting.filter(seekers__id=seeker.id)
+    bookmarked_ids = await run_read(
+        lambda db: bookmark_query.using_db(db).values_list("id", flat=True)
+    )
+    bookmarks = await run_read(
+        lambda db: bookmark_query.using_db(db)
+        .order_by("-id")
+        .limit(MAX_RECOMMEND_BOOKMARKS)
+        .values_list(*RECOMMEND_TEXT_COLUMNS)
+    )
+    interests = [seeker.interests, *(interest for interest, _ in resumes)]
+    areas = [area for _, area in resumes]
+    return (
+        [i for i in interests if i],
+        [a for a in areas if a],
+        bookmarks,
+        bookmarked_ids,
+    )
+
+
+async def get_recommended_postings_query(
+    ids: List[int],
+    bookmarked_ids: Iterable[int],
+    fields: Tuple[str, ...],
+):
+    """추천 순위(ids) 그대로 공고를 조립"""
+    columns = posting_columns(fields)
+    rows = await run_read(
+        lambda db: JobPosting.filter(id__in=ids).using_db(db).values(*columns)
+    )
+    by_id = {row["id"]: row for row in rows}
+    page = partial_page_schema(
+        RecommendedPostingsResponseDTO, JobPostingResponseDTO, fields
+    )
+    return page.model_construct(
+        data=to_posting_dtos(
+            [by_id[id] for id in ids if id in by_id], bookmarked_ids, fields
+        )
+    )
+
+
+@cached("posting", tags=lambda id: (f"posting:{id}",))
+async def get_posting_by_id_query(id):
+    return await run_read(
+        lambda db: JobPosting.filter(pk=id).using_db(db).select_related("user").first()
     )
 
 
 async def get_posting_query(id):
-    posting = await JobPosting.filter(pk=id).select_related("user").first()
+    posting = await get_posting_by_id_query(id)
 
     if posting:
+        # 조회는 replica, 조회수 증가는 primary 에 원자적으로 반영
+        await increment_posting_view(id)
         posting.view_count += 1
-        await posting.save()
 
     return posting
 
 
+async def increment_posting_view(id) -> int:
+    return await JobPosting.filter(pk=id).update(view_count=F("view_count") + 1)
+
+
 async def get_resume_query(resume_id):
     return await Resume.filter(id=resume_id).select_related("user").first()
 
@@ -4,6 +4,7 @@ from typing import List, Optional
 from pydantic import BaseModel
 
 from app.domain.job_posting.models import ApplicantEnum
+from app.utils.fieldsets import FieldSet
 
 
 class UserSchema(BaseModel):
@@ -56,6 +57,23 @@ class JobPostingResponseDTO(BaseModel):
         from_attributes = True
 
 
+JOB_POSTING_FIELDS = FieldSet(
+    JobPostingResponseDTO,
+    presets={
+        "card": (
+            "company",
+            "title",
+            "location",
+            "salary",
+            "deadline",
+            "status",
+            "image_url",
+            "is_bookmarked",
+        ),
+    },
+)
+
+
 class ApplicantCreateUpdateSchema(BaseModel):
     resume: Optional[int]
     status: ApplicantEnum
@@ -85,3 +103,14 @@ class PaginatedJobPostingsResponseDTO(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class JobPostingDetailResponseDTO(JobPostingResponseDTO):
+    similar_posting_ids: List[int] = []
+
+
+class RecommendedPostingsResponseDTO(BaseModel):
+    data: List[JobPostingResponseDTO]
+
+    class Config:
+        from_attributes = True
@@ -1,22 +1,34 @@
 import logging
+from datetime import date
 from typing import Any, Optional
 
+from app.domain.job_posting.models import ApplicantEnum
 from app.domain.posting.repository import (
     create_posting_applicant,
     get_applicant_query,
     get_posting_query,
     get_postings_query,
+    get_recommended_postings_query,
     get_resume_id_by_applicant_id,
     get_resume_query,
+    get_seeker_signals_query,
+    increment_posting_view,
     patch_posting_applicant_by_id,
 )
 from app.domain.posting.schemas import (
+    JOB_POSTING_FIELDS,
     ApplicantCreateUpdateSchema,
     ApplicantResponseDTO,
+    JobPostingDetailResponseDTO,
     JobPostingResponseDTO,
     PaginatedJobPostingsResponseDTO,
+    RecommendedPostingsResponseDTO,
 )
+from app.domain.resume.repository import get_seeker_user
+from app.domain.services.dashboard_stats import incr_applicant
 from app.domain.services.permission import check_author
+from app.domain.services.recommendation import recommender
+from app.domain.services.similar_postings import get_similar_posting_ids
 from app.domain.services.verification import check_existing
 from app.exceptions.applicant_exceptions import ApplicantNotFoundException
 from app.exceptions.job_posting_exceptions import (
@@ -30,13 +42,16 @@ from app.exceptions.resume_exceptions import ResumeNotFoundException
 from app.exceptions.search_exceptions import (
     InvalidLimitException,
     InvalidOffsetException,
+    InvalidQueryParamsException,
     InvalidViewCountException,
     SearchKeywordTooLongException,
 )
+from app.exceptions.user_exceptions import UserNotFoundException
 
 VALID_EMPLOYMENT_TYPES = {"공공", "일반"}
 VALID_CAREER_TYPES = {"신입", "경력직", "경력무관"}
 VALID_EMPLOY_METHODS = {"정규직", "계약직", "일용직", "프리랜서", "파견직"}
+VALID_SORTS = {"latest", "closing_soon"}
 
 MAX_POSITION_COUNT = 10
 MAX_SEARCH_KEYWORD_LENGTH = 100
@@ -58,6 +73,10 @@ async def get_all_postings_service(
     limit: int = 10,
     employ_method: Optional[str] = "",
     current_user: Optional[Any] = None,
+    fields: Optional[str] = None,
+    deadline_after: Optional[date] = None,
+    deadline_before: Optional[date] = None,
+    sort: str = "latest",
 ) -> PaginatedJobPostingsResponseDTO:
     # 문자열 길이 검증
     if len(search_keyword) > MAX_SEARCH_KEYWORD_LENGTH:
@@ -108,12 +127,25 @@ async def get_all_postings_service(
         logger.warning(f"[SEARCH-TYPE] limit 1이상 100 이하 이어야 합니다 : {limit}")
         raise InvalidLimitException()
 
+    if sort not in VALID_SORTS:
+        logger.warning(f"[SEARCH-TYPE] 허용되지 않는 sort : {sort}")
+        raise InvalidQueryParamsException("sort는 latest, closing_soon 중 하나여야 합니다.")
+    if deadline_after and deadline_before and deadline_after > deadline_before:
+        logger.warning(
+            f"[SEARCH-TYPE] 마감일 범위 오류 : {deadline_after} > {deadline_before}"
+        )
+        raise InvalidQueryParamsException(
+            "deadline_after는 deadline_before보다 늦을 수 없습니다."
+        )
+
     # position 다중 값 파싱 및 개수 제한
     position_list = [p.strip() for p in position.split(",") if p.strip()]
     if len(position_list) > MAX_POSITION_COUNT:
         logger.warning(f"[SEARCH-TYPE] position 10개 이하 여야 합니다 : {len(position_list)}")
         raise TooManyPositionsException(MAX_POSITION_COUNT)
 
+    selected_fields = JOB_POSTING_FIELDS.resolve(fields)
+
     return await get_postings_query(
         search_keyword,
         location,
@@ -126,15 +158,48 @@ async def get_all_postings_service(
         current_user,
         offset,
         limit,
+        selected_fields,
+        deadline_after=deadline_after,
+        deadline_before=deadline_before,
+        sort=sort,
     )
 
 
-async def get_posting_by_id_service(id: int) -> JobPostingResponseDTO:
+async def get_recommended_postings_service(
+    current_user: Any,
+    limit: int = 10,
+    fields: Optional[str] = None,
+) -> RecommendedPostingsResponseDTO:
+    if not (1 <= limit <= 100):
+        logger.warning(f"[RECOMMEND] limit 1이상 100 이하 이어야 합니다 : {limit}")
+        raise InvalidLimitException()
+    selected_fields = JOB_POSTING_FIELDS.resolve(fields)
+
+    seeker = await get_seeker_user(current_user)
+    check_existing(seeker, UserNotFoundException)
+
+    interests, areas, bookmarks, bookmarked_ids = await get_seeker_signals_query(seeker)
+    ranked = await recommender.recommend(
+        interests, areas, bookmarks, limit, exclude=bookmarked_ids
+    )
+    return await get_recommended_postings_query(
+        [id for id, _ in ranked], bookmarked_ids, selected_fields
+    )
+
+
+async def get_posting_by_id_service(id: int) -> JobPostingDetailResponseDTO:
     posting = await get_posting_query(id)
     check_existing(posting, JobPostingNotFoundException)
+    # 미리 계산한 비슷한 공고 (목록이 바뀌면 상세 검증자도 무효화된다)
+    posting.similar_posting_ids = await get_similar_posting_ids(id)
     return posting
 
 
+async def record_posting_view_service(id: int):
+    """304 응답(본문 재사용)일 때도 조회수는 올린다"""
+    await increment_posting_view(id)
+
+
 async def create_applicant_service(
     id: int, current_user: Any, applicant: ApplicantCreateUpdateSchema
 ) -> ApplicantResponseDTO:
@@ -146,6 +211,7 @@ async def create_applicant_service(
     created_applicant = await create_posting_applicant(
         applicant, current_user, resume, posting
     )
+    await incr_applicant(created_applicant.created_at)
 
     return created_applicant
 
@@ -168,8 +234,11 @@ async def patch_posting_applicant_by_id_service(
 
     await check_author(applicant, current_user)
 
+    cancelled = patch_applicant.status == ApplicantEnum.Cancelled
     patch_applicant = await patch_posting_applicant_by_id(
         applicant, resume, patch_applicant
     )
+    if cancelled:
+        await incr_applicant(applicant.created_at, -1)
 
     return patch_applicant
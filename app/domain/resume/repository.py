@@ -1,9 +1,11 @@
 from typing import List, Optional
 
+from app.core.cache import cached
 from app.domain.resume.models import Resume, WorkExp
 from app.domain.user.models import BaseUser, SeekerUser
 
 
+@cached("user", tags=lambda current_user: (f"user:{current_user.id}",))
 async def get_seeker_user(current_user: BaseUser) -> SeekerUser:
     seeker_user = await SeekerUser.get_or_none(user=current_user)
     return seeker_user
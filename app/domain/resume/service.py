@@ -13,6 +13,7 @@ from app.domain.resume.repository import (
     update_resume,
 )
 from app.domain.resume.schema import ResumeResponseSchema
+from app.domain.services.dashboard_stats import incr_resume
 from app.domain.services.permission import check_author, check_permission
 from app.domain.services.verification import check_existing
 from app.domain.user.models import BaseUser, SeekerUser
@@ -30,6 +31,7 @@ async def create_resume_service(data: dict) -> ResumeResponseSchema:
     work_experiences = data.pop("work_experiences", [])
     await _check_title_duplication(data.get("title"))
     resume = await create_resume(data)
+    await incr_resume()
 
     if work_experiences:
         work_exp_objects = []
@@ -146,3 +148,4 @@ async def delete_resume_service(resume_id: int, current_user: Any) -> None:
     if not deleted:
         logger.warning(f"[RESUME] 이력서 id {resume_id} 삭제에 실패했습니다.")
         raise ResumeDeleteFailedException()
+    await incr_resume(-1)
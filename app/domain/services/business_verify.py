@@ -1,5 +1,6 @@
 import httpx
 
+from app.core.rate_limit import BUSINESS_VERIFY_TOTAL, check_rate_limit
 from app.core.settings import settings
 from app.exceptions.server_exceptions import ExternalApiErrorException
 from app.exceptions.user_exceptions import InvalidBusinessNumberException
@@ -9,6 +10,9 @@ BIZINFO_API_KEY = settings.BIZINFO_API_KEY
 
 async def verify_business_number(business_number: str):
     url = f"https://api.odcloud.kr/api/nts-businessman/v1/status?serviceKey={BIZINFO_API_KEY}"
+    # 국세청 API 일일/분당 호출 한도는 서비스 전체가 함께 쓴다
+    await check_rate_limit(BUSINESS_VERIFY_TOTAL, "all")
+
     headers = {"Content-Type": "application/json"}
     body = {"b_no": [business_number]}
 
@@ -0,0 +1,129 @@
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+USER_STATS_KEY = "stats:users"  # 유저 상태별 수
+POSTING_STATS_KEY = "stats:postings"  # 공고 상태별 수
+APPLICANT_DAILY_STATS_KEY = "stats:applicants:daily"  # 일자별 지원자 수
+TOTAL_STATS_KEY = "stats:totals"  # resumes, applicants 전체 수
+# DB 집계로 한 번이라도 채워졌는지 (증감만으로 생긴 해시를 초기화된 값으로 보지 않도록)
+STATS_INITIALIZED_KEY = "stats:initialized"
+
+STATS_KEYS = (
+    USER_STATS_KEY,
+    POSTING_STATS_KEY,
+    APPLICANT_DAILY_STATS_KEY,
+    TOTAL_STATS_KEY,
+)
+
+
+# 집계 전에는 증감하지 않는다 (첫 집계가 DB 기준 전체 값을 넣는다)
+INCR_IF_INITIALIZED_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return 0
+end
+for i = 2, #KEYS do
+    redis.call("HINCRBY", KEYS[i], ARGV[i * 2 - 3], ARGV[i * 2 - 2])
+end
+return 1
+"""
+
+
+def _value(status) -> str:
+    # Enum, str 모두 허용
+    return getattr(status, "value", status)
+
+
+async def _hincrby(changes: Dict[str, Dict[str, int]]):
+    """
+    대시보드 카운터 증감.
+    통계용 카운터이므로 redis 장애가 쓰기 요청을 실패시키지 않도록 로그만 남긴다.
+    (어긋난 값은 reconcile 작업이 DB 기준으로 다시 맞춘다)
+    """
+    keys, args = [STATS_INITIALIZED_KEY], []
+    for key, fields in changes.items():
+        for field, amount in fields.items():
+            if amount:
+                keys.append(key)
+                args.extend([field, amount])
+    if len(keys) == 1:
+        return
+    try:
+        await get_redis().eval(INCR_IF_INITIALIZED_SCRIPT, len(keys), *keys, *args)
+    except Exception as e:
+        logger.warning(f"[STATS] 대시보드 카운터 갱신 실패: {e}")
+
+
+async def incr_user_status(status, amount: int = 1):
+    await _hincrby({USER_STATS_KEY: {_value(status): amount}})
+
+
+async def move_user_status(old_status, new_status):
+    old, new = _value(old_status), _value(new_status)
+    if old == new:
+        return
+    await _hincrby({USER_STATS_KEY: {old: -1, new: 1}})
+
+
+async def incr_posting_status(status, amount: int = 1):
+    await _hincrby({POSTING_STATS_KEY: {_value(status): amount}})
+
+
+async def move_posting_status(old_status, new_status, amount: int = 1):
+    old, new = _value(old_status), _value(new_status)
+    if old == new:
+        return
+    await _hincrby({POSTING_STATS_KEY: {old: -amount, new: amount}})
+
+
+async def incr_applicant(created_at: Optional[datetime] = None, amount: int = 1):
+    day = (created_at or datetime.utcnow()).date().isoformat()
+    await _hincrby(
+        {
+            APPLICANT_DAILY_STATS_KEY: {day: amount},
+            TOTAL_STATS_KEY: {"applicants": amount},
+        }
+    )
+
+
+async def incr_resume(amount: int = 1):
+    await _hincrby({TOTAL_STATS_KEY: {"resumes": amount}})
+
+
+async def get_dashboard_stats() -> Optional[Dict[str, Dict[str, int]]]:
+    """redis 에 저장된 카운터 조회, 아직 집계된 적이 없으면 None"""
+    pipe = get_redis().pipeline(transaction=False)
+    pipe.exists(STATS_INITIALIZED_KEY)
+    for key in STATS_KEYS:
+        pipe.hgetall(key)
+    initialized, users, postings, applicants_daily, totals = await pipe.execute()
+
+    if not initialized:
+        return None
+
+    def to_int(d: dict) -> Dict[str, int]:
+        return {k: int(v) for k, v in d.items()}
+
+    return {
+        "users": to_int(users),
+        "postings": to_int(postings),
+        "applicants_daily": to_int(applicants_daily),
+        "totals": to_int(totals),
+    }
+
+
+async def replace_dashboard_stats(snapshot: Dict[str, Dict[str, int]]):
+    """DB 집계 결과로 카운터 전체를 원자적으로 교체"""
+    pipe = get_redis().pipeline(transaction=True)
+    for key, name in zip(
+        STATS_KEYS, ("users", "postings", "applicants_daily", "totals")
+    ):
+        pipe.delete(key)
+        if snapshot[name]:
+            pipe.hset(key, mapping=snapshot[name])
+    pipe.set(STATS_INITIALIZED_KEY, 1)
+    await pipe.execute()
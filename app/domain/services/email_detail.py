@@ -3,6 +3,7 @@ import random
 import smtplib
 from email.mime.text import MIMEText
 
+from app.core.rate_limit import EMAIL_CODE_PER_EMAIL, check_rate_limit
 from app.core.redis import get_redis
 from app.core.settings import settings
 
@@ -36,6 +37,8 @@ async def generate_email_code(email: str) -> str:
 
 
 async def send_email_code(email: str, purpose: str) -> str:
+    # 같은 주소로 인증 메일이 연달아 나가지 않도록
+    await check_rate_limit(EMAIL_CODE_PER_EMAIL, email)
     code = await generate_email_code(email)
     subject = f"[{purpose}] 인증코드 안내"
 
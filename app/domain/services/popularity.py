@@ -0,0 +1,168 @@
+import logging
+import math
+import time
+from typing import Dict, List, Optional, Tuple
+
+from tortoise import Tortoise
+
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+FREE_BOARD = "free_board"
+SUCCESS_REVIEW = "success_review"
+
+# 랭킹 대상 게시판 -> 스냅샷을 저장할 테이블
+BOARD_TABLES = {
+    FREE_BOARD: "free_boards",
+    SUCCESS_REVIEW: "success_reviews",
+}
+
+# 이벤트별 가중치
+EVENT_WEIGHTS = {
+    "view": 1.0,
+    "comment": 3.0,
+    "bookmark": 5.0,
+}
+
+HALF_LIFE_SECONDS = 24 * 60 * 60  # 하루 지나면 점수가 절반
+MIN_SCORE = 0.01  # 감쇠 후 이 점수 미만은 랭킹에서 제거
+MAX_MEMBERS = 10000  # 게시판별 랭킹에 유지할 최대 글 수
+RESTORE_RETRY_SECONDS = 60  # 랭킹이 비어 있을 때 스냅샷 복구를 다시 시도하는 간격
+
+
+def _key(board: str) -> str:
+    return f"popular:{board}"
+
+
+def _decayed_at_key(board: str) -> str:
+    return f"popular:{board}:decayed_at"
+
+
+def _restore_checked_key(board: str) -> str:
+    return f"popular:{board}:restore_checked"
+
+
+def decay_factor(elapsed_seconds: float) -> float:
+    return math.pow(0.5, max(elapsed_seconds, 0) / HALF_LIFE_SECONDS)
+
+
+async def record_event(board: str, target_id: int, event: str):
+    """
+    조회/댓글/북마크 이벤트를 랭킹 점수에 반영 (ZINCRBY, O(log n)).
+    랭킹 갱신 실패가 본 요청을 실패시키지 않도록 로그만 남긴다.
+    """
+    try:
+        await get_redis().zincrby(_key(board), EVENT_WEIGHTS[event], target_id)
+    except Exception as e:
+        logger.warning(f"[POPULAR] 랭킹 이벤트 반영 실패: {board}/{target_id} {event}: {e}")
+
+
+async def remove_target(board: str, target_id: int):
+    try:
+        await get_redis().zrem(_key(board), target_id)
+    except Exception as e:
+        logger.warning(f"[POPULAR] 랭킹 삭제 실패: {board}/{target_id}: {e}")
+
+
+async def get_top_ids(board: str, limit: int) -> List[int]:
+    """점수 상위 limit 개 글 id (ZREVRANGE, O(log n + limit))"""
+    try:
+        redis = get_redis()
+        ids = await redis.zrevrange(_key(board), 0, limit - 1)
+        # 스냅샷도 비어 있으면 매 요청 복구하지 않도록 워커 전체에서 간격당 한 번만
+        if (
+            not ids
+            and await redis.set(
+                _restore_checked_key(board), 1, nx=True, ex=RESTORE_RETRY_SECONDS
+            )
+            and await restore_popularity(board)
+        ):
+            ids = await redis.zrevrange(_key(board), 0, limit - 1)
+        return [int(i) for i in ids]
+    except Exception as e:
+        # redis 장애 시 마지막 스냅샷 기준으로 응답
+        logger.warning(f"[POPULAR] 랭킹 조회 실패, 스냅샷으로 대체: {board}: {e}")
+        rows = await _snapshot_rows(board, limit)
+        return [row["id"] for row in rows]
+
+
+async def decay_popularity(board: str, now: Optional[float] = None):
+    """
+    지난 감쇠 이후 경과 시간만큼 전체 점수에 지수 감쇠를 적용한다 (주기 작업).
+    ZUNIONSTORE 의 WEIGHTS 로 redis 안에서 한 번에 곱하고, 낮은 점수와 초과분은 정리한다.
+    """
+    now = now or time.time()
+    redis = get_redis()
+    last = await redis.get(_decayed_at_key(board))
+    await redis.set(_decayed_at_key(board), now)
+    if last is None:
+        # 처음 실행이거나 redis 데이터가 유실된 경우, 스냅샷을 덮어쓰기 전에 먼저 복구
+        await restore_popularity(board)
+        return
+
+    key = _key(board)
+    pipe = redis.pipeline(transaction=True)
+    pipe.zunionstore(key, {key: decay_factor(now - float(last))})
+    pipe.zremrangebyscore(key, "-inf", f"({MIN_SCORE}")
+    pipe.zremrangebyrank(key, 0, -(MAX_MEMBERS + 1))
+    await pipe.execute()
+
+
+async def snapshot_popularity(board: str) -> int:
+    """redis 랭킹 점수를 Postgres popularity_score 컬럼에 저장 (복구용, 주기 작업)"""
+    members: List[Tuple[str, float]] = await get_redis().zrange(
+        _key(board), 0, -1, withscores=True
+    )
+    ids = [int(member) for member, _ in members]
+    scores = [score for _, score in members]
+
+    table = BOARD_TABLES[board]
+    conn = Tortoise.get_connection("default")
+    await conn.execute_query(
+        f"UPDATE {table} t SET popularity_score = v.score"
+        " FROM unnest($1::int[], $2::float8[]) AS v(id, score)"
+        " WHERE t.id = v.id",
+        [ids, scores],
+    )
+    # 랭킹에서 빠진 글은 0 으로 정리
+    await conn.execute_query(
+        f"UPDATE {table} SET popularity_score = 0"
+        " WHERE popularity_score > 0 AND NOT (id = ANY($1::int[]))",
+        [ids],
+    )
+    return len(ids)
+
+
+async def _snapshot_rows(board: str, limit: int) -> List[dict]:
+    conn = Tortoise.get_connection("default")
+    return await conn.execute_query_dict(
+        f"SELECT id, popularity_score FROM {BOARD_TABLES[board]}"
+        " WHERE popularity_score > 0 ORDER BY popularity_score DESC LIMIT $1",
+        [limit],
+    )
+
+
+async def restore_popularity(board: str) -> int:
+    """redis 랭킹이 비어 있을 때 마지막 스냅샷으로 복구"""
+    rows = await _snapshot_rows(board, MAX_MEMBERS)
+    if not rows:
+        return 0
+
+    mapping: Dict[str, float] = {
+        str(row["id"]): row["popularity_score"] for row in rows
+    }
+    await get_redis().zadd(_key(board), mapping)
+    logger.info(f"[POPULAR] 스냅샷에서 랭킹 복구: {board}, {len(mapping)}건")
+    return len(mapping)
+
+
+async def run_popularity_maintenance():
+    """주기 작업 진입점: 게시판별 감쇠 적용 후 스냅샷 저장"""
+    for board in BOARD_TABLES:
+        try:
+            await decay_popularity(board)
+            count = await snapshot_popularity(board)
+            logger.info(f"[POPULAR] 랭킹 스냅샷 저장: {board}, {count}건")
+        except Exception as e:
+            logger.error(f"[POPULAR] 랭킹 유지 작업 실패: {board}: {e}")
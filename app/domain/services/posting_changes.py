@@ -0,0 +1,74 @@
+"""
+공고 변경 기록.
+
+공고를 만들거나 수정/삭제/상태 변경하면 id 를 Redis sorted set 에 변경 시각과 함께 남긴다.
+워커마다 메모리에 들고 있는 공고 인덱스(추천 등)는 마지막으로 반영한 시각 이후의 id 만 다시 읽어
+증분 갱신한다. pub/sub 와 달리 잠시 끊겼던 워커도 놓친 변경을 이어서 받는다.
+
+변경 시각은 기록하는 워커의 time.time() 이라, 늦게 도착한 기록이 이미 반영한 시각보다 앞설 수 있다.
+그래서 반영한 시각보다 CHANGE_SKEW_SECONDS 앞에서부터 다시 읽고, 이미 반영한 기록은 건너뛴다.
+"""
+
+import logging
+import time
+from typing import Iterable, List, Set, Tuple
+
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+CHANGES_KEY = "postings:changed"
+RETENTION_SECONDS = 24 * 60 * 60  # 이보다 오래 반영하지 못한 워커는 전체 재구성
+CHANGE_SKEW_SECONDS = 5.0  # 워커 간 시계 차이 + 기록 지연 허용치
+
+
+async def record_posting_changes(ids: Iterable[int]):
+    ids = list(ids)
+    if not ids:
+        return
+    now = time.time()
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            pipe.zadd(CHANGES_KEY, {str(id): now for id in ids})
+            pipe.zremrangebyscore(CHANGES_KEY, "-inf", now - RETENTION_SECONDS)
+            await pipe.execute()
+    except Exception as e:
+        # 인덱스 전체 재구성 주기 안에 반영된다
+        logger.warning(f"[POSTING-CHANGES] 변경 기록 실패: {len(ids)}건: {e}")
+
+
+async def get_posting_changes(since: float) -> List[Tuple[int, float]]:
+    """since 이후(since 시각 제외) 변경된 (공고 id, 변경 시각) 목록"""
+    rows = await get_redis().zrangebyscore(
+        CHANGES_KEY, f"({since}", "+inf", withscores=True
+    )
+    return [(int(id), score) for id, score in rows]
+
+
+class PostingChangeCursor:
+    """인덱스 하나가 어디까지 변경 기록을 반영했는지"""
+
+    def __init__(self):
+        self.synced_at = 0.0  # 마지막으로 반영한 변경 기록 시각
+        self._applied: Set[Tuple[int, float]] = set()
+
+    def reset(self, at: float):
+        """전체 재구성: at 이후의 변경만 반영하면 된다"""
+        self.synced_at = at
+        self._applied = set()
+
+    async def fetch(self) -> List[Tuple[int, float]]:
+        """아직 반영하지 않은 (공고 id, 변경 시각) 목록"""
+        changes = await get_posting_changes(self.synced_at - CHANGE_SKEW_SECONDS)
+        return [change for change in changes if change not in self._applied]
+
+    def advance(self, changes: List[Tuple[int, float]]):
+        """fetch 로 받은 변경을 반영한 뒤 호출"""
+        if not changes:
+            return
+        self.synced_at = max(self.synced_at, max(at for _, at in changes))
+        floor = self.synced_at - CHANGE_SKEW_SECONDS
+        # 다시 읽는 구간을 벗어난 기록은 더 이상 조회되지 않는다
+        self._applied = {
+            change for change in self._applied | set(changes) if change[1] > floor
+        }
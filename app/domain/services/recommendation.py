@@ -0,0 +1,363 @@
+"""
+구직자 맞춤 공고 추천.
+
+공고(포지션, 지역, 제목)를 해시 특징(feature hashing) TF-IDF 벡터로 만들어 워커 메모리에 둔다.
+특징별 공고 목록(역색인) 형태로 저장하므로 요청마다 구직자 벡터의 특징 수만큼만 NumPy 연산을 한다.
+
+- 구직자 벡터: 관심 분야(SeekerUser.interests, Resume.interests), 희망 지역(Resume.desired_area),
+  북마크한 공고 벡터의 평균
+- 인덱스에는 모집중/마감 임박 공고만 담는다. 첫 요청 때 만들고 posting_changes 기록으로 증분 갱신한다:
+  바뀐 공고는 기존 자리를 지우고 delta 에 다시 넣으며, delta 가 커지거나 오래되면 백그라운드에서 재구성한다.
+"""
+
+import asyncio
+import logging
+import re
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from app.domain.posting.repository import get_active_posting_texts_query
+from app.domain.services.posting_changes import PostingChangeCursor
+
+logger = logging.getLogger(__name__)
+
+N_FEATURES = 1 << 18
+FIELD_WEIGHTS = {"pos": 3.0, "loc": 1.0, "title": 1.0, "type": 0.5, "career": 0.5}
+BOOKMARK_WEIGHT = 0.5  # 북마크 공고 벡터 평균의 비중 (관심 분야/지역 벡터 대비)
+REBUILD_SECONDS = 60 * 60  # 재구성 주기 (IDF 갱신, 삭제된 자리 정리)
+MAX_DELTA = 1000  # delta 가 이보다 커지면 재구성
+SYNC_INTERVAL = 1.0  # 변경 기록 확인 간격 (초)
+
+WORD_RE = re.compile(r"\w+")
+
+# (공고 id, 제목, 포지션, 지역[, 고용 형태, 경력])
+PostingText = Tuple
+Vector = Tuple[np.ndarray, np.ndarray]
+
+
+def _words(text: Optional[str]) -> List[str]:
+    return [
+        w
+        for w in WORD_RE.findall((text or "").lower())
+        if len(w) > 1 and not w.isdigit()
+    ]
+
+
+def _position_tokens(text: Optional[str]) -> List[str]:
+    """ "요양보호사, 경비/청소" -> 항목 전체와 (여러 단어면) 단어"""
+    tokens = []
+    for part in re.split(r"[,/]", text or ""):
+        part = part.strip().lower()
+        if not part:
+            continue
+        tokens.append(part)
+        words = _words(part)
+        if len(words) > 1:
+            tokens.extend(words)
+    return tokens
+
+
+def _location_tokens(text: Optional[str]) -> List[str]:
+    """ "서울특별시 강남구" -> 시/도, 시/군/구, 시/도 + 시/군/구"""
+    words = (text or "").split()
+    tokens = list(words)
+    if len(words) > 1:
+        tokens.append(" ".join(words[:2]))
+    return tokens
+
+
+def _add(tf: Dict[int, float], field: str, tokens: Iterable[str], weight: float = 1.0):
+    weight *= FIELD_WEIGHTS[field]
+    for token in tokens:
+        feature = zlib.crc32(f"{field}:{token}".encode()) & (N_FEATURES - 1)
+        tf[feature] = tf.get(feature, 0.0) + weight
+
+
+def posting_features(
+    title: str,
+    position: str,
+    location: str,
+    employment_type: Optional[str] = None,
+    career: Optional[str] = None,
+) -> Dict[int, float]:
+    tf: Dict[int, float] = {}
+    _add(tf, "pos", _position_tokens(position))
+    _add(tf, "loc", _location_tokens(location))
+    _add(tf, "title", _words(title))
+    # DB 에서 읽으면 Enum, 요청/테스트 값은 문자열
+    if employment_type:
+        _add(tf, "type", [getattr(employment_type, "value", employment_type)])
+    if career:
+        _add(tf, "career", [getattr(career, "value", career)])
+    return tf
+
+
+def seeker_features(interests: Iterable[str], areas: Iterable[str]) -> Dict[int, float]:
+    tf: Dict[int, float] = {}
+    for text in interests:
+        _add(tf, "pos", _position_tokens(text))
+        _add(tf, "title", _words(text))
+    for text in areas:
+        _add(tf, "loc", _location_tokens(text))
+    return tf
+
+
+class PostingIndex:
+    """
+    모집 중인 공고의 TF-IDF 벡터 (행마다 L2 정규화).
+    feat_ptr[f]:feat_ptr[f + 1] 구간이 특징 f 를 가진 공고 행(feat_rows)과 가중치(feat_vals),
+    row_ptr[r]:row_ptr[r + 1] 구간이 공고 행 r 의 특징(row_feats)과 가중치(row_vals).
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        idf: np.ndarray,
+        feat_ptr: np.ndarray,
+        feat_rows: np.ndarray,
+        feat_vals: np.ndarray,
+        row_ptr: np.ndarray,
+        row_feats: np.ndarray,
+        row_vals: np.ndarray,
+    ):
+        self.ids = ids
+        self.idf = idf
+        self.feat_ptr = feat_ptr
+        self.feat_rows = feat_rows
+        self.feat_vals = feat_vals
+        self.row_ptr = row_ptr
+        self.row_feats = row_feats
+        self.row_vals = row_vals
+        self.alive = np.ones(len(ids), dtype=bool)
+        self.row_of = {int(id): row for row, id in enumerate(ids)}
+        self.delta: Dict[int, Vector] = {}
+        self._delta_arrays: Optional[Tuple[np.ndarray, ...]] = None
+        self.built_at = time.monotonic()
+
+    @classmethod
+    def build(cls, rows: Sequence[PostingText]) -> "PostingIndex":
+        n = len(rows)
+        features = [posting_features(*row[1:]) for row in rows]
+        lengths = np.fromiter((len(f) for f in features), dtype=np.int64, count=n)
+        nnz = int(lengths.sum())
+        cols = np.fromiter((k for f in features for k in f), dtype=np.int64, count=nnz)
+        tf = np.fromiter(
+            (v for f in features for v in f.values()), dtype=np.float32, count=nnz
+        )
+        rows_of_nnz = np.repeat(np.arange(n, dtype=np.int32), lengths)
+
+        df = np.bincount(cols, minlength=N_FEATURES)
+        idf = (np.log((n + 1) / (df + 1)) + 1).astype(np.float32)
+        vals = tf * idf[cols]
+        norms = np.sqrt(np.bincount(rows_of_nnz, weights=vals**2, minlength=n))
+        vals /= norms[rows_of_nnz].astype(np.float32)
+
+        order = np.argsort(cols, kind="stable")
+        feat_ptr = np.zeros(N_FEATURES + 1, dtype=np.int64)
+        np.cumsum(df, out=feat_ptr[1:])
+        row_ptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(lengths, out=row_ptr[1:])
+        return cls(
+            ids=np.fromiter((r[0] for r in rows), dtype=np.int64, count=n),
+            idf=idf,
+            feat_ptr=feat_ptr,
+            feat_rows=rows_of_nnz[order],
+            feat_vals=vals[order],
+            row_ptr=row_ptr,
+            row_feats=cols,
+            row_vals=vals,
+        )
+
+    def vectorize(self, tf: Dict[int, float]) -> Vector:
+        idx = np.fromiter(tf.keys(), dtype=np.int64, count=len(tf))
+        vals = np.fromiter(tf.values(), dtype=np.float32, count=len(tf)) * self.idf[idx]
+        norm = np.linalg.norm(vals)
+        return idx, vals / norm if norm else vals
+
+    def row_vector(self, row: int) -> Vector:
+        start, end = self.row_ptr[row], self.row_ptr[row + 1]
+        return self.row_feats[start:end], self.row_vals[start:end]
+
+    def apply_changes(self, changed_ids: Iterable[int], rows: Sequence[PostingText]):
+        """바뀐 공고의 기존 벡터를 지우고, 아직 모집 중인 공고(rows)는 delta 에 다시 넣는다"""
+        for id in changed_ids:
+            row = self.row_of.get(id)
+            if row is not None:
+                self.alive[row] = False
+            self.delta.pop(id, None)
+        for row in rows:
+            self.delta[row[0]] = self.vectorize(posting_features(*row[1:]))
+        self._delta_arrays = None
+
+    def stale(self) -> bool:
+        return (
+            len(self.delta) > MAX_DELTA
+            or time.monotonic() - self.built_at > REBUILD_SECONDS
+        )
+
+    def top_k(
+        self, query: Vector, k: int, exclude: Set[int]
+    ) -> List[Tuple[int, float]]:
+        """(공고 id, 코사인 유사도) 내림차순 k 개"""
+        scores = self.score_batch([query])[0]
+
+        candidates: Dict[int, float] = {}
+        m = min(len(scores), k + len(exclude))
+        if m:
+            for row in np.argpartition(-scores, m - 1)[:m]:
+                if scores[row] > 0:
+                    candidates[int(self.ids[row])] = float(scores[row])
+        candidates.update(self.score_delta(query))
+
+        ranked = sorted(
+            ((id, s) for id, s in candidates.items() if s > 0 and id not in exclude),
+            key=lambda item: (-item[1], -item[0]),
+        )
+        return ranked[:k]
+
+    def score_batch(self, queries: Sequence[Vector]) -> np.ndarray:
+        """질의마다 색인된 모든 공고 행과의 유사도 (len(queries) x 행 수, 지워진 행은 0)"""
+        scores = np.zeros((len(queries), len(self.ids)), dtype=np.float32)
+        if not queries:
+            return scores
+        # 같은 특징을 가진 질의끼리 모아 특징마다 한 번씩 더한다
+        q_of = np.repeat(np.arange(len(queries)), [len(idx) for idx, _ in queries])
+        q_idx = np.concatenate([idx for idx, _ in queries])
+        q_vals = np.concatenate([vals for _, vals in queries])
+        order = np.argsort(q_idx, kind="stable")
+        q_of, q_idx, q_vals = q_of[order], q_idx[order], q_vals[order]
+        features, starts = np.unique(q_idx, return_index=True)
+        bounds = np.append(starts, len(q_idx))
+        for i, feature in enumerate(features.tolist()):
+            start, end = self.feat_ptr[feature], self.feat_ptr[feature + 1]
+            if start == end:
+                continue
+            members = slice(bounds[i], bounds[i + 1])
+            scores[np.ix_(q_of[members], self.feat_rows[start:end])] += np.outer(
+                q_vals[members], self.feat_vals[start:end]
+            )
+        scores[:, ~self.alive] = 0
+        return scores
+
+    def score_delta(self, query: Vector) -> Dict[int, float]:
+        if not self.delta:
+            return {}
+        if self._delta_arrays is None:
+            ids = list(self.delta)
+            vectors = [self.delta[id] for id in ids]
+            lengths = [len(idx) for idx, _ in vectors]
+            self._delta_arrays = (
+                np.array(ids, dtype=np.int64),
+                np.repeat(np.arange(len(ids)), lengths),
+                np.concatenate([idx for idx, _ in vectors]),
+                np.concatenate([vals for _, vals in vectors]),
+            )
+        ids, rows, idx, vals = self._delta_arrays
+        dense = np.zeros(N_FEATURES, dtype=np.float32)
+        dense[query[0]] = query[1]
+        scores = np.bincount(rows, weights=dense[idx] * vals, minlength=len(ids))
+        return dict(zip(ids.tolist(), scores.tolist()))
+
+
+def seeker_vector(
+    index: PostingIndex,
+    interests: Iterable[str],
+    areas: Iterable[str],
+    bookmarks: Sequence[PostingText],
+) -> Vector:
+    combined: Dict[int, float] = {}
+    vectors = [(index.vectorize(seeker_features(interests, areas)), 1.0)]
+    vectors += [
+        (index.vectorize(posting_features(*row[1:])), BOOKMARK_WEIGHT / len(bookmarks))
+        for row in bookmarks
+    ]
+    for (idx, vals), weight in vectors:
+        for feature, value in zip(idx.tolist(), vals.tolist()):
+            combined[feature] = combined.get(feature, 0.0) + weight * value
+    return (
+        np.fromiter(combined.keys(), dtype=np.int64, count=len(combined)),
+        np.fromiter(combined.values(), dtype=np.float32, count=len(combined)),
+    )
+
+
+class Recommender:
+    """워커마다 하나: 인덱스를 만들고 변경 기록으로 최신 상태를 유지"""
+
+    def __init__(self):
+        self.index: Optional[PostingIndex] = None
+        self._changes = PostingChangeCursor()
+        self._checked_at = 0.0
+        self._build_lock = asyncio.Lock()
+        self._rebuild_task: Optional[asyncio.Task] = None
+
+    async def get_index(self) -> PostingIndex:
+        if self.index is None:
+            async with self._build_lock:
+                if self.index is None:
+                    await self._rebuild()
+        elif self.index.stale() and (
+            self._rebuild_task is None or self._rebuild_task.done()
+        ):
+            # 재구성하는 동안은 기존 인덱스로 응답
+            self._rebuild_task = asyncio.create_task(self._rebuild_in_background())
+        await self._sync()
+        return self.index
+
+    async def _rebuild(self):
+        started_at = time.time()
+        start = time.perf_counter()
+        rows = await get_active_posting_texts_query()
+        index = await asyncio.to_thread(PostingIndex.build, rows)
+        # 읽기 시작 이후의 변경은 다음 _sync 에서 반영
+        self.index, self._checked_at = index, 0.0
+        self._changes.reset(started_at)
+        logger.info(
+            f"[RECOMMEND] 공고 인덱스 구성: {len(rows)}건, "
+            f"{(time.perf_counter() - start) * 1000:.0f}ms"
+        )
+
+    async def _rebuild_in_background(self):
+        try:
+            await self._rebuild()
+        except Exception as e:
+            logger.error(f"[RECOMMEND] 공고 인덱스 재구성 실패: {e}")
+
+    async def _sync(self):
+        now = time.monotonic()
+        if now - self._checked_at < SYNC_INTERVAL:
+            return
+        self._checked_at = now
+        try:
+            changes = await self._changes.fetch()
+        except Exception as e:
+            logger.warning(f"[RECOMMEND] 공고 변경 기록 조회 실패: {e}")
+            return
+        if not changes:
+            return
+        ids = [id for id, _ in changes]
+        rows = await get_active_posting_texts_query(ids)
+        self.index.apply_changes(ids, rows)
+        self._changes.advance(changes)
+
+    async def recommend(
+        self,
+        interests: Iterable[str],
+        areas: Iterable[str],
+        bookmarks: Sequence[PostingText],
+        k: int,
+        exclude: Iterable[int] = (),
+    ) -> List[Tuple[int, float]]:
+        """(공고 id, 점수) 내림차순 k 개. 북마크한 공고와 exclude 는 제외"""
+        index = await self.get_index()
+        query = seeker_vector(index, interests, areas, bookmarks)
+        if not len(query[0]):
+            return []
+        return index.top_k(
+            query, k, exclude={row[0] for row in bookmarks} | set(exclude)
+        )
+
+
+recommender = Recommender()
@@ -0,0 +1,55 @@
+from app.core.scheduler import Scheduler
+from app.domain.admin.services.dashboard_services import reconcile_dashboard_stats
+from app.domain.free_board.repository import sync_free_board_comment_counts
+from app.domain.job_posting.services import (
+    backfill_deadline_dates,
+    transition_postings_by_deadline,
+)
+from app.domain.services.popularity import run_popularity_maintenance
+from app.domain.services.similar_postings import refresh_similar_postings
+from app.domain.user.services.user_register_services import purge_unverified_users
+
+
+def register_jobs(scheduler: Scheduler):
+    """lifespan 에서 start_scheduler 에 넘기는 주기 작업 목록"""
+    # 쓰기 경로에서 증감한 redis 카운터를 DB 집계로 보정
+    scheduler.add_job(
+        "reconcile_dashboard_stats", reconcile_dashboard_stats, every=30 * 60
+    )
+    # 인기 랭킹 감쇠 + 스냅샷 (redis 유실 시 복구용)
+    scheduler.add_job(
+        "popularity_maintenance", run_popularity_maintenance, every=15 * 60
+    )
+    # save() 를 거치지 않은 공고의 마감일 보정 (배포 직후 첫 실행이 backfill)
+    scheduler.add_job(
+        "backfill_deadline_dates",
+        backfill_deadline_dates,
+        every=6 * 60 * 60,
+        timeout=10 * 60,
+    )
+    # 마감일 기준 모집중 -> 마감 임박 -> 모집 종료 (날짜가 바뀐 뒤 첫 실행에서 반영)
+    scheduler.add_job(
+        "transition_postings_by_deadline",
+        transition_postings_by_deadline,
+        cron="5 * * * *",
+        timeout=10 * 60,
+    )
+    # 비슷한 공고: 변경분 증분 갱신 (6시간마다, 또는 리더가 바뀐 뒤 첫 실행은 전체 계산)
+    scheduler.add_job(
+        "refresh_similar_postings",
+        refresh_similar_postings,
+        every=60,
+        timeout=10 * 60,
+    )
+    # 새벽 시간대 전체 테이블 작업
+    # (comment_count 컬럼 추가 직후에는 새벽까지 0 으로 보이지 않도록 첫 리더가 바로 backfill)
+    scheduler.add_job(
+        "sync_free_board_comment_counts",
+        sync_free_board_comment_counts,
+        cron="30 4 * * *",
+        timeout=10 * 60,
+        run_if_never_run=True,
+    )
+    scheduler.add_job(
+        "purge_unverified_users", purge_unverified_users, cron="0 4 * * *"
+    )
@@ -0,0 +1,336 @@
+"""
+공고별 비슷한 공고 목록.
+
+모집 중인 공고마다 포지션, 지역, 고용 형태, 경력, 제목이 비슷한 공고 상위 SIMILAR_COUNT 개를 미리 계산해
+Redis 리스트(posting:similar:{id})에 둔다. 상세 조회는 키 하나만 읽는다.
+
+- 전체 계산: 같은 포지션을 가진 공고끼리만 후보로 보고, 포지션 묶음마다 밀집 행렬 곱으로 유사도를 구한다
+- 증분 갱신: posting_changes 기록으로 바뀐 공고만 전체 공고와 비교해 자기 목록을 다시 만들고,
+  다른 공고 목록의 마지막 점수보다 높으면 끼워 넣는다. 모집이 끝났거나 수정된 공고는 기존 목록에서 뺀다.
+- 표(neighbor table)는 스케줄러 리더 워커 메모리에 있다. 리더가 바뀌면 새 리더가 전체 계산부터 한다.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from app.core.http_cache import invalidate_validator, resource_key
+from app.core.redis import get_redis
+from app.domain.job_posting.models import JobPosting
+from app.domain.posting.repository import (
+    SIMILAR_POSTING_COLUMNS,
+    get_active_posting_texts_query,
+)
+from app.domain.services.posting_changes import PostingChangeCursor
+from app.domain.services.recommendation import (
+    MAX_DELTA,
+    PostingIndex,
+    PostingText,
+    Vector,
+)
+
+logger = logging.getLogger(__name__)
+
+SIMILAR_KEY = "posting:similar:{}"
+SIMILAR_COUNT = 10
+REBUILD_SECONDS = 6 * 60 * 60  # 전체 재계산 주기 (증분 갱신으로 빠진 자리 채우기)
+KEY_TTL_SECONDS = 2 * REBUILD_SECONDS  # 리더가 사라져도 오래된 목록이 남지 않도록
+CHUNK_ROWS = 1024  # 밀집 행렬 곱 한 번에 계산하는 행 수
+WRITE_BATCH = 1000  # Redis 트랜잭션 하나에 쓰는 목록 수
+
+
+def position_blocks(position: Optional[str]) -> List[str]:
+    """ "요양보호사, 경비/청소" -> ["요양보호사", "경비", "청소"] (후보 묶음)"""
+    return [p.strip().lower() for p in re.split(r"[,/]", position or "") if p.strip()]
+
+
+def _merge_top(
+    ids: np.ndarray, scores: np.ndarray, k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """행마다 중복 id 를 빼고 점수 상위 k 개 (빈 자리는 id -1, 점수 0)"""
+    rows = np.arange(len(ids))[:, None]
+    # id 순으로 정렬해 같은 id 가 연속하면 뒤쪽을 지운다 (같은 쌍은 점수도 같다)
+    order = np.argsort(ids, axis=1, kind="stable")
+    ids, scores = ids[rows, order], scores[rows, order].copy()
+    scores[:, 1:][ids[:, 1:] == ids[:, :-1]] = 0
+    scores[ids < 0] = 0
+    top = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+    ids, scores = ids[rows, top], scores[rows, top]
+    ids[scores <= 0] = -1
+    return ids, np.maximum(scores, 0)
+
+
+def compute_neighbors(
+    index: PostingIndex, blocks: Sequence[List[str]], k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    색인된 공고 행마다 (이웃 공고 id, 유사도) 상위 k 개 (len x k).
+    같은 포지션 묶음 안에서만 비교하므로 비용은 묶음 크기 제곱의 합에 비례한다.
+    """
+    n = len(index.ids)
+    best_ids = np.full((n, k), -1, dtype=np.int64)
+    best_scores = np.zeros((n, k), dtype=np.float32)
+
+    members: Dict[str, List[int]] = {}
+    for row, keys in enumerate(blocks):
+        for key in keys:
+            members.setdefault(key, []).append(row)
+
+    for rows in members.values():
+        if len(rows) < 2:
+            continue
+        rows = np.asarray(rows)
+        dense = _dense_block(index, rows)
+        kk = min(k, len(rows) - 1)
+        for start in range(0, len(rows), CHUNK_ROWS):
+            chunk = rows[start : start + CHUNK_ROWS]
+            scores = dense[start : start + len(chunk)] @ dense.T
+            scores[np.arange(len(chunk)), np.arange(start, start + len(chunk))] = 0
+            top = np.argpartition(-scores, kk - 1, axis=1)[:, :kk]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            best_ids[chunk], best_scores[chunk] = _merge_top(
+                np.hstack([best_ids[chunk], index.ids[rows[top]]]),
+                np.hstack([best_scores[chunk], top_scores]),
+                k,
+            )
+    return best_ids, best_scores
+
+
+def _dense_block(index: PostingIndex, rows: np.ndarray) -> np.ndarray:
+    """묶음 안에서 두 번 이상 나온 특징만 열로 쓰는 밀집 행렬 (한 번만 나온 특징은 내적에 기여하지 않는다)"""
+    starts, ends = index.row_ptr[rows], index.row_ptr[rows + 1]
+    lengths = ends - starts
+    offsets = np.cumsum(lengths) - lengths
+    positions = np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+    feats, vals = index.row_feats[positions], index.row_vals[positions]
+    local_rows = np.repeat(np.arange(len(rows)), lengths)
+
+    uniq, cols, counts = np.unique(feats, return_inverse=True, return_counts=True)
+    shared = counts[cols] >= 2
+    keep = np.cumsum(counts >= 2) - 1
+    dense = np.zeros((len(rows), int((counts >= 2).sum())), dtype=np.float32)
+    dense[local_rows[shared], keep[cols[shared]]] = vals[shared]
+    return dense
+
+
+class SimilarPostings:
+    """스케줄러 리더가 들고 있는 이웃 표. 슬롯 0..n-1 은 색인 행, 이후는 색인 뒤에 바뀐 공고"""
+
+    def __init__(self, k: int = SIMILAR_COUNT):
+        self.k = k
+        self.index: Optional[PostingIndex] = None
+        self.slot_ids = np.zeros(0, dtype=np.int64)
+        self.slot_of: Dict[int, int] = {}
+        self.neighbor_ids = np.zeros((0, k), dtype=np.int64)
+        self.neighbor_scores = np.zeros((0, k), dtype=np.float32)
+        self._changes = PostingChangeCursor()
+        self._built_at = 0.0
+
+    async def refresh(self) -> int:
+        """스케줄러 작업: 다시 쓴 목록 수"""
+        if (
+            self.index is None
+            or time.monotonic() - self._built_at > REBUILD_SECONDS
+            or len(self.index.delta) > MAX_DELTA
+        ):
+            return await self.rebuild()
+        return await self.sync()
+
+    async def rebuild(self) -> int:
+        started_at = time.time()
+        start = time.perf_counter()
+        rows = await get_active_posting_texts_query(columns=SIMILAR_POSTING_COLUMNS)
+        index, neighbor_ids, neighbor_scores = await asyncio.to_thread(
+            self._compute, rows
+        )
+        previous = {
+            int(id): self.neighbor_ids[slot]
+            for id, slot in self.slot_of.items()
+            if slot < len(self.neighbor_ids)
+        }
+        self.index, self.neighbor_ids, self.neighbor_scores = (
+            index,
+            neighbor_ids,
+            neighbor_scores,
+        )
+        self.slot_ids = index.ids.copy()
+        self.slot_of = dict(index.row_of)
+        self._changes.reset(started_at)
+        self._built_at = time.monotonic()
+
+        changed = [
+            slot
+            for slot, id in enumerate(self.slot_ids.tolist())
+            if id not in previous
+            or not np.array_equal(previous[id], self.neighbor_ids[slot])
+        ]
+        removed = set(previous) - set(self.slot_of)
+        changed_slots = set(changed)
+        unchanged = [s for s in range(len(self.slot_ids)) if s not in changed_slots]
+        try:
+            await self._write(changed, removed)
+            await self._touch(unchanged)
+        except Exception:
+            # 쓰지 못한 목록은 다음 실행의 전체 계산에서 다시 쓴다
+            self.index = None
+            raise
+        logger.info(
+            f"[SIMILAR] 비슷한 공고 전체 계산: {len(rows)}건, 변경 {len(changed)}건, "
+            f"{(time.perf_counter() - start):.1f}s"
+        )
+        return len(changed)
+
+    def _compute(self, rows: Sequence[PostingText]):
+        index = PostingIndex.build(rows)
+        blocks = [position_blocks(row[2]) for row in rows]
+        return (index, *compute_neighbors(index, blocks, self.k))
+
+    async def sync(self) -> int:
+        changes = await self._changes.fetch()
+        if not changes:
+            return 0
+        ids = list(dict.fromkeys(id for id, _ in changes))
+        rows = await get_active_posting_texts_query(
+            ids, columns=SIMILAR_POSTING_COLUMNS
+        )
+        touched = self.apply_changes(ids, rows)
+        removed = set(ids) - {row[0] for row in rows}
+        await self._write(sorted(touched), removed)
+        self._changes.advance(changes)
+        return len(touched)
+
+    def apply_changes(
+        self, ids: Iterable[int], rows: Sequence[PostingText]
+    ) -> Set[int]:
+        """
+        바뀐 공고를 표에 반영하고 목록이 바뀐 슬롯을 돌려준다.
+        rows 는 ids 중 아직 모집 중인 공고 (없으면 모집 종료/삭제).
+        """
+        ids = list(ids)
+        self.index.apply_changes(ids, rows)
+        touched: Set[int] = set()
+
+        # 이전 슬롯을 지우고, 그 공고를 이웃으로 가진 목록에서 뺀다
+        for id in ids:
+            slot = self.slot_of.pop(id, None)
+            if slot is not None:
+                self.neighbor_ids[slot] = -1
+                self.neighbor_scores[slot] = 0
+            holders = np.nonzero((self.neighbor_ids == id).any(axis=1))[0]
+            for holder in holders.tolist():
+                self._remove(holder, id)
+                touched.add(holder)
+
+        # 모집 중인 공고는 새 슬롯에서 자기 목록을 만들고 다른 목록에 끼워 넣는다
+        new_ids = [row[0] for row in rows]
+        first = len(self.slot_ids)
+        self.slot_ids = np.append(self.slot_ids, new_ids)
+        self.neighbor_ids = np.vstack(
+            [self.neighbor_ids, np.full((len(new_ids), self.k), -1, dtype=np.int64)]
+        )
+        self.neighbor_scores = np.vstack(
+            [self.neighbor_scores, np.zeros((len(new_ids), self.k), dtype=np.float32)]
+        )
+        for offset, id in enumerate(new_ids):
+            self.slot_of[id] = first + offset
+
+        for id in new_ids:
+            slot = self.slot_of[id]
+            scores = self._slot_scores(self.index.delta[id])
+            scores[slot] = 0
+            kk = min(self.k, len(scores))
+            top = np.argpartition(-scores, kk - 1)[:kk]
+            self.neighbor_ids[slot], self.neighbor_scores[slot] = _merge_top(
+                self.slot_ids[top][None, :], scores[top][None, :], self.k
+            )
+            touched.add(slot)
+
+            for holder in np.nonzero(scores > self.neighbor_scores[:, -1])[0].tolist():
+                self._insert(holder, id, float(scores[holder]))
+                touched.add(holder)
+        return touched
+
+    def _slot_scores(self, query: Vector) -> np.ndarray:
+        """모든 슬롯과의 유사도 (지워진 슬롯은 0)"""
+        scores = np.zeros(len(self.slot_ids), dtype=np.float32)
+        main = self.index.score_batch([query])[0]
+        scores[: len(main)] = main
+        for id, score in self.index.score_delta(query).items():
+            scores[self.slot_of[id]] = score
+        return scores
+
+    def _remove(self, slot: int, id: int):
+        keep = self.neighbor_ids[slot] != id
+        ids, scores = self.neighbor_ids[slot][keep], self.neighbor_scores[slot][keep]
+        pad = self.k - len(ids)
+        self.neighbor_ids[slot] = np.append(ids, [-1] * pad)
+        self.neighbor_scores[slot] = np.append(scores, [0] * pad)
+
+    def _insert(self, slot: int, id: int, score: float):
+        self.neighbor_ids[slot], self.neighbor_scores[slot] = _merge_top(
+            np.append(self.neighbor_ids[slot], id)[None, :],
+            np.append(self.neighbor_scores[slot], score)[None, :],
+            self.k,
+        )
+
+    def neighbors(self, id: int) -> List[int]:
+        slot = self.slot_of.get(id)
+        if slot is None:
+            return []
+        return [n for n in self.neighbor_ids[slot].tolist() if n >= 0]
+
+    async def _touch(self, slots: Sequence[int]):
+        """내용이 그대로인 목록도 전체 계산마다 만료 시간을 늘린다 (그대로 두면 KEY_TTL_SECONDS 뒤 사라진다)"""
+        ids = [int(self.slot_ids[slot]) for slot in slots]
+        redis = get_redis()
+        for start in range(0, len(ids), WRITE_BATCH):
+            async with redis.pipeline(transaction=False) as pipe:
+                for id in ids[start : start + WRITE_BATCH]:
+                    pipe.expire(SIMILAR_KEY.format(id), KEY_TTL_SECONDS)
+                await pipe.execute()
+
+    async def _write(self, slots: Sequence[int], removed: Iterable[int] = ()):
+        """목록을 통째로 바꿔 쓰고 (MULTI 로 빈 목록이 보이지 않게) 상세 응답 ETag 를 무효화"""
+        ids = [int(self.slot_ids[slot]) for slot in slots]
+        removed = list(removed)
+        redis = get_redis()
+        for start in range(0, len(ids), WRITE_BATCH):
+            async with redis.pipeline(transaction=True) as pipe:
+                for id in ids[start : start + WRITE_BATCH]:
+                    key = SIMILAR_KEY.format(id)
+                    pipe.delete(key)
+                    neighbors = self.neighbors(id)
+                    if neighbors:
+                        pipe.rpush(key, *neighbors)
+                        pipe.expire(key, KEY_TTL_SECONDS)
+                await pipe.execute()
+        if removed:
+            await redis.delete(*(SIMILAR_KEY.format(id) for id in removed))
+        for start in range(0, len(ids), WRITE_BATCH):
+            await invalidate_validator(
+                *(
+                    resource_key(JobPosting, id)
+                    for id in ids[start : start + WRITE_BATCH]
+                )
+            )
+
+
+similar_postings = SimilarPostings()
+
+
+async def refresh_similar_postings() -> int:
+    return await similar_postings.refresh()
+
+
+async def get_similar_posting_ids(id: int) -> List[int]:
+    """상세 조회용: 미리 계산한 비슷한 공고 id (없거나 Redis 장애면 빈 목록)"""
+    try:
+        ids = await get_redis().lrange(SIMILAR_KEY.format(id), 0, -1)
+    except Exception as e:
+        logger.warning(f"[SIMILAR] 비슷한 공고 조회 실패: posting_id={id}: {e}")
+        return []
+    return [int(n) for n in ids]
@@ -24,7 +24,11 @@ class SuccessReview(TimestampMixin):
         EmploymnetType, default=EmploymnetType.REGULAR
     )
     view_count = fields.IntField(default=0)
+    # redis 인기 랭킹 점수 스냅샷 (복구용)
+    popularity_score = fields.FloatField(default=0)
 
     class Meta:
         table = "success_reviews"
         ordering = ["-created_at"]
+        # 인기 랭킹 복구/장애 시 스냅샷 조회 (ORDER BY popularity_score DESC LIMIT)
+        indexes = (("popularity_score",),)
@@ -1,6 +1,17 @@
+from app.core.cache import cached, invalidate_tags
+from app.core.db import run_read
+from app.core.http_cache import invalidate_validator, resource_key
+from app.core.single_flight import single_flight
 from app.domain.services.permission import check_author
+from app.domain.services.popularity import (
+    SUCCESS_REVIEW,
+    get_top_ids,
+    record_event,
+    remove_target,
+)
 from app.domain.services.verification import check_existing
 from app.domain.success_review.models import SuccessReview
+from app.exceptions.search_exceptions import InvalidLimitException
 from app.exceptions.success_review_exceptions import SuccessReviewNotFoundException
 
 
@@ -8,16 +19,53 @@ async def create_success_review_by_id(success_review, current_user):
     return await SuccessReview.create(**success_review.dict(), user=current_user)
 
 
+@single_flight("success_review_list", key=lambda current_user: "all", distributed=True)
 async def get_all_success_reviews(current_user):
-    return await SuccessReview.all().select_related("user")
+    return await run_read(
+        lambda db: SuccessReview.all().using_db(db).select_related("user")
+    )
+
+
+@single_flight(
+    "success_review_popular",
+    key=lambda limit, current_user: str(limit),
+    distributed=True,
+)
+async def get_popular_success_reviews(limit, current_user):
+    if not (1 <= limit <= 100):
+        raise InvalidLimitException()
+
+    ids = await get_top_ids(SUCCESS_REVIEW, limit)
+    if not ids:
+        return []
+    reviews = await run_read(
+        lambda db: SuccessReview.filter(id__in=ids).using_db(db).select_related("user")
+    )
+    by_id = {review.id: review for review in reviews}
+    return [by_id[i] for i in ids if i in by_id]
+
+
+@cached("success_review", tags=lambda id: (f"success_review:{id}",))
+async def get_success_review_query(id):
+    return await run_read(
+        lambda db: SuccessReview.filter(pk=id)
+        .using_db(db)
+        .select_related("user")
+        .first()
+    )
 
 
 async def get_success_review_by_id(id, current_user):
-    review = await SuccessReview.filter(pk=id).select_related("user").first()
+    review = await get_success_review_query(id)
     check_existing(review, SuccessReviewNotFoundException)
+    await record_success_review_view(id)
     return review
 
 
+async def record_success_review_view(id):
+    await record_event(SUCCESS_REVIEW, id, "view")
+
+
 async def patch_success_review_by_id(id, success_review, current_user):
     review = await SuccessReview.filter(pk=id).select_related("user").first()
     check_existing(review, SuccessReviewNotFoundException)
@@ -30,6 +78,8 @@ async def patch_success_review_by_id(id, success_review, current_user):
     review.employment_type = success_review.employment_type
 
     await review.save()
+    await invalidate_validator(resource_key(SuccessReview, id))
+    await invalidate_tags(f"success_review:{id}")
 
     return review
 
@@ -40,3 +90,6 @@ async def delete_success_review_by_id(id, current_user):
     await check_author(review, current_user)
 
     await review.delete()
+    await remove_target(SUCCESS_REVIEW, id)
+    await invalidate_validator(resource_key(SuccessReview, id))
+    await invalidate_tags(f"success_review:{id}")
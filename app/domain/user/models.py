@@ -3,6 +3,8 @@ from enum import Enum
 from tortoise import fields, models
 from tortoise.contrib.postgres import fields as postgres_fields
 
+from app.utils.model import TrigramIndex
+
 
 class Gender(str, Enum):
     MALE = "male"
@@ -49,6 +51,7 @@ class BaseUser(models.Model):
 
     class Meta:
         table = "base_users"
+        indexes = (TrigramIndex(fields=["email"], name="idx_base_users_email_trgm"),)
 
 
 class UserBan(models.Model):
@@ -66,7 +69,9 @@ class UserBan(models.Model):
 
 class CorporateUser(models.Model):
     id = fields.IntField(pk=True)
-    user = fields.ForeignKeyField("models.BaseUser", related_name="corporate_profiles")
+    user = fields.ForeignKeyField(
+        "models.BaseUser", related_name="corporate_profiles", db_index=True
+    )
     company_name = fields.CharField(max_length=255, null=False)
     business_start_date = fields.DateField(null=False)
     business_number = fields.CharField(max_length=20, null=False, unique=True)
@@ -78,11 +83,21 @@ class CorporateUser(models.Model):
 
     class Meta:
         table = "corporate_users"
+        indexes = (
+            TrigramIndex(
+                fields=["company_name"], name="idx_corporate_users_company_trgm"
+            ),
+            TrigramIndex(
+                fields=["manager_name"], name="idx_corporate_users_manager_trgm"
+            ),
+        )
 
 
 class SeekerUser(models.Model):
     id = fields.IntField(pk=True)
-    user = fields.ForeignKeyField("models.BaseUser", related_name="seeker_profiles")
+    user = fields.ForeignKeyField(
+        "models.BaseUser", related_name="seeker_profiles", db_index=True
+    )
     name = fields.CharField(max_length=20, null=False)
     phone_number = fields.CharField(max_length=20, null=False)
     birth = fields.DateField(null=True)
@@ -101,3 +116,4 @@ class SeekerUser(models.Model):
 
     class Meta:
         table = "seeker_users"
+        indexes = (TrigramIndex(fields=["name"], name="idx_seeker_users_name_trgm"),)
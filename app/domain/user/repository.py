@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import Optional
 
-from app.domain.user.models import BaseUser, CorporateUser, SeekerUser
+from app.domain.user.models import BaseUser, CorporateUser, SeekerUser, UserStatus
 from app.domain.user.schema import UserRegisterRequest
 
 
@@ -84,3 +85,10 @@ async def get_bookmark_postings_by_repository(current_user: BaseUser):
         .first()
     )
     return await seeker_user.interests_posting.all()
+
+
+async def delete_unverified_users_before(before: datetime) -> int:
+    """이메일 인증 없이 before 이전에 가입한 pending 유저 삭제 (프로필은 cascade)"""
+    return await BaseUser.filter(
+        status=UserStatus.PENDING, email_verified=False, created_at__lt=before
+    ).delete()
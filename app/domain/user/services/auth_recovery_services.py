@@ -3,6 +3,7 @@ import logging
 from passlib.hash import bcrypt
 
 from app.core.redis import get_redis
+from app.domain.services.dashboard_stats import move_user_status
 from app.domain.services.email_detail import send_email_code
 from app.domain.user.repository import (
     get_corporate_by_manager_name_and_phone,
@@ -123,9 +124,11 @@ async def complete_email_verification(
     if not user:
         raise UserNotFoundException()
 
+    old_status = user.status
     user.email_verified = True
     user.status = "active"
     await user.save()
+    await move_user_status(old_status, user.status)
 
     return EmailVerificationResponseDTO(email=user.email, email_verified=True)
 
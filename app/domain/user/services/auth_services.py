@@ -6,6 +6,11 @@ from fastapi import Request
 from fastapi.responses import JSONResponse
 from passlib.hash import bcrypt
 
+from app.core.rate_limit import (
+    LOGIN_FAILURES_PER_IP_EMAIL,
+    check_rate_limit,
+    refund_rate_limit,
+)
 from app.core.redis import get_redis
 from app.core.token import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
@@ -15,6 +20,7 @@ from app.core.token import (
     create_jwt_tokens,
     create_token,
 )
+from app.domain.services.dashboard_stats import incr_user_status
 from app.domain.services.social_account import (
     get_naver_access_token,
     get_naver_user_info,
@@ -73,7 +79,9 @@ async def verify_user_password(user: BaseUser, password: str):
 
 
 # 로그인
-async def login_user(email: str, password: str) -> tuple[LoginResponseDTO, str, str]:
+async def login_user(
+    email: str, password: str, ip: str
+) -> tuple[LoginResponseDTO, str, str]:
     user = await BaseUser.get_or_none(email=email)
 
     if not user:
@@ -84,10 +92,16 @@ async def login_user(email: str, password: str) -> tuple[LoginResponseDTO, str,
         logger.warning(f"[CHECK] 로그인 실패 - 미인증 또는 비활성 상태: {email}")
         raise UnverifiedOrInactiveAccountException()
 
+    # 한 계정에 비밀번호를 대입하는 경우. bcrypt 전에 차감하고 성공하면 돌려준다
+    limit_key = f"{ip}:{email}"
+    await check_rate_limit(LOGIN_FAILURES_PER_IP_EMAIL, limit_key)
+
     if not bcrypt.verify(password, user.password):
         logger.warning(f"[CHECK] 로그인 실패 - 비밀번호 불일치: {email}")
         raise PasswordInvalidException()
 
+    await refund_rate_limit(LOGIN_FAILURES_PER_IP_EMAIL, limit_key)
+
     # user_id + user_type 둘 다 넣어서 토큰 발급 = 프론트 요청사항
     user_type = user.user_type[0] if user.user_type else "normal"
 
@@ -191,6 +205,7 @@ async def kakao_login(kakao_info: dict) -> tuple[LoginResponseDTO, str, str]:
             email_verified=True,
             gender=Gender.MALE,
         )
+        await incr_user_status(user.status)
         await create_seeker_profile(
             user=user,
             name=nickname,
@@ -238,6 +253,7 @@ async def naver_login(code: str, state: str) -> tuple[LoginResponseDTO, str, str
             email_verified=True,
             gender=Gender.MALE,
         )
+        await incr_user_status(user.status)
         await create_seeker_profile(
             user=user,
             name=nickname,
@@ -1,5 +1,6 @@
 import logging
 
+from app.core.cache import invalidate_tags
 from app.domain.job_posting.models import Applicants
 from app.domain.services.user_type_helper import split_user_types
 from app.domain.user.models import BaseUser
@@ -81,6 +82,7 @@ async def update_seeker_profile(
         profile.profile_url = update_data.profile_url
 
     await profile.save()
+    await invalidate_tags(f"user:{current_user.id}")
 
     return UserUnionResponseDTO(
         base=UserResponseDTO.from_orm(current_user),
@@ -110,6 +112,7 @@ async def update_corporate_profile(
         profile.profile_url = update_data.profile_url
 
     await profile.save()
+    await invalidate_tags(f"user:{current_user.id}")
 
     return UserUnionResponseDTO(
         base=UserResponseDTO.from_orm(current_user),
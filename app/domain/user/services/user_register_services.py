@@ -1,19 +1,22 @@
 import logging
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
 from passlib.hash import bcrypt
 
 from app.core.redis import get_redis
+from app.core.settings import settings
 from app.core.token import create_jwt_tokens
 from app.domain.services.business_verify import verify_business_number
+from app.domain.services.dashboard_stats import incr_user_status, move_user_status
 from app.domain.services.email_detail import send_email_code
 from app.domain.user.models import BaseUser, CorporateUser
 from app.domain.user.repository import (
     check_duplicate_phone_number,
     create_base_user,
     create_seeker_profile,
+    delete_unverified_users_before,
     get_corporate_profile_by_user,
     get_seeker_profile_by_user,
     get_user_by_email,
@@ -73,6 +76,7 @@ async def register_user(request: UserRegisterRequest) -> UserUnionResponseDTO:
         status="pending",
         signinMethod=request.signinMethod,
     )
+    await incr_user_status(base_user.status)
 
     interests = (
         ",".join(request.interests)
@@ -165,6 +169,7 @@ async def delete_user(
         logger.warning(f"[CHECK] 패스워드 같지 않음: {password}")
         raise PasswordMismatchException()
 
+    old_status = current_user.status
     current_user.deleted_at = datetime.utcnow()
     current_user.email_verified = False
     current_user.status = "delete"
@@ -173,6 +178,7 @@ async def delete_user(
         current_user.leave_reason = reason
 
     await current_user.save()
+    await move_user_status(old_status, current_user.status)
 
     return UserDeleteDTO(
         user_id=current_user.id,
@@ -180,3 +186,13 @@ async def delete_user(
         reason=current_user.leave_reason,
         deleted_at=current_user.deleted_at,
     )
+
+
+async def purge_unverified_users() -> int:
+    """주기 작업: 보관 기간이 지나도록 이메일 인증을 하지 않은 가입자 정리"""
+    before = datetime.utcnow() - timedelta(days=settings.PENDING_USER_RETENTION_DAYS)
+    count = await delete_unverified_users_before(before)
+    if count:
+        await incr_user_status("pending", -count)
+    logger.info(f"[USER] 미인증 가입자 정리: {count}명 ({before} 이전 가입)")
+    return count
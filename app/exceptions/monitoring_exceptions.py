@@ -0,0 +1,10 @@
+from app.exceptions.base_exceptions import CustomException
+
+
+class ProfileNotFoundException(CustomException):
+    def __init__(self):
+        super().__init__(
+            status_code=404,
+            code="profile_not_found",
+            error="존재하지 않거나 만료된 프로파일입니다.",
+        )
@@ -6,3 +6,13 @@ class RequiredFieldException(CustomException):
         super().__init__(
             status_code=400, code="required_field", error="필수 필드가 누락되었습니다."
         )
+
+
+class TooManyRequestsException(CustomException):
+    def __init__(self, retry_after: int):
+        super().__init__(
+            status_code=429,
+            code="too_many_requests",
+            error="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+        )
+        self.headers = {"Retry-After": str(retry_after)}
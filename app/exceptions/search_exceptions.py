@@ -34,3 +34,19 @@ class InvalidLimitException(CustomException):
         super().__init__(
             status_code=400, code="invalid_limit", error="limit는 1 이상 100 이하로 입력해주세요."
         )
+
+
+class InvalidCursorException(CustomException):
+    def __init__(self):
+        super().__init__(
+            status_code=400, code="invalid_cursor", error="유효하지 않은 cursor 입니다."
+        )
+
+
+class InvalidFieldsException(CustomException):
+    def __init__(self, field: str):
+        super().__init__(
+            status_code=400,
+            code="invalid_fields",
+            error=f"선택할 수 없는 응답 필드입니다: {field}",
+        )
@@ -20,3 +20,12 @@ class ExternalApiErrorException(CustomException):
         super().__init__(
             status_code=500, error="국세청 API 요청 실패", code="external_api_error"
         )
+
+
+class ServerOverloadedException(CustomException):
+    def __init__(self):
+        super().__init__(
+            status_code=503,
+            code="server_overloaded",
+            error="요청이 많아 잠시 후 다시 시도해주세요.",
+        )
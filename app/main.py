@@ -1,9 +1,10 @@
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.security import HTTPBearer
 from tortoise.contrib.fastapi import register_tortoise
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
@@ -14,18 +15,48 @@ from app.api.v1.chatbot import chatbot_router
 from app.api.v1.comment import comment_router
 from app.api.v1.freeboard import free_board_router
 from app.api.v1.jobposting import job_posting_router
+from app.api.v1.metrics import metrics_router
 from app.api.v1.postings import posting_router
 from app.api.v1.resume import resume_router
 from app.api.v1.success_review import success_review_router
 from app.api.v1.user import router as user_router
 from app.api.v1.websocket import websocket_router
+from app.core.admission import AdmissionMiddleware, instrument_db_pool
+from app.core.cache import start_invalidation_listener
 from app.core.config import TORTOISE_ORM
+from app.core.loop_monitor import start_loop_monitor
+from app.core.metrics import MetricsMiddleware, instrument_redis, instrument_tortoise
+from app.core.profiler import ProfilerMiddleware
+from app.core.query_trace import QueryTraceMiddleware
+from app.core.redis import close_redis
+from app.core.scheduler import start_scheduler
 from app.core.settings import settings
 from app.domain.services.s3_service import image_upload_router
+from app.domain.services.scheduled_jobs import register_jobs
 from app.exceptions.base_exceptions import CustomException
 
 bearer_scheme = HTTPBearer()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # register_tortoise 의 lifespan 안쪽에서 실행되므로 DB 연결이 준비된 상태
+    loop_monitor = start_loop_monitor()
+    cache_listener = start_invalidation_listener()
+    scheduler = start_scheduler(register_jobs)
+    yield
+    if scheduler:
+        await scheduler.stop()
+    if cache_listener:
+        await cache_listener.stop()
+    if loop_monitor:
+        await loop_monitor.stop()
+    await close_redis()
+
+
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url=None if settings.ENV == "prod" else "/docs",
     redoc_url=None if settings.ENV == "prod" else "/redoc",
     openapi_url=None if settings.ENV == "prod" else "/openapi.json",
@@ -44,6 +75,7 @@ app.include_router(posting_router)
 app.include_router(resume_router)
 app.include_router(image_upload_router)
 app.include_router(applicant_router)
+app.include_router(metrics_router)
 
 if settings.ENV == "prod":
     origins = [
@@ -57,6 +89,8 @@ else:
         "http://127.0.0.1:3000",
     ]
 
+# CORS 안쪽에서 거절해야 503 응답에도 CORS 헤더가 붙는다
+app.add_middleware(AdmissionMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,  # 위에서 지정한 origins 목록 허용
@@ -65,6 +99,14 @@ app.add_middleware(
     allow_headers=["*"],  # 모든 HTTP 헤더 허용
 )
 
+# 가장 바깥 미들웨어로 등록해 CORS, 프록시 처리 시간까지 포함해서 측정
+instrument_tortoise()
+instrument_redis()
+instrument_db_pool()
+app.add_middleware(ProfilerMiddleware)
+app.add_middleware(QueryTraceMiddleware)
+app.add_middleware(MetricsMiddleware)
+
 register_tortoise(
     app,
     config=TORTOISE_ORM,
@@ -83,6 +125,7 @@ async def custom_exception_handler(request: Request, exc: CustomException):
                 "code": exc.code,
             }
         },
+        headers=exc.headers,
     )
 
 
@@ -77,5 +77,8 @@ def apply_redis_patch():
     mock.get.return_value = None
     mock.set.return_value = True
 
-    with patch("app.core.redis.get_redis", return_value=mock):
+    # 수집 단계에서 get_redis 를 먼저 import 한 모듈도 mock 을 받도록 클라이언트 생성 자체를 patch
+    with patch("app.core.redis.get_redis", return_value=mock), patch(
+        "app.core.redis.aioredis.Redis", return_value=mock
+    ):
         yield
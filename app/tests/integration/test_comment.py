@@ -95,7 +95,8 @@ async def test_get_comments(client, access_token):
     response = await client.get("/api/free-board/1/comment/", headers=headers)
 
     assert response.status_code == 200
-    assert len(response.json()) == 3
+    assert len(response.json()["data"]) == 3
+    assert response.json()["next_cursor"] is None
 
 
 @pytest.mark.asyncio
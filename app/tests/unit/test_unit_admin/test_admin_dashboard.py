@@ -0,0 +1,195 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.domain.admin.services.dashboard_services import (
+    get_dashboard_stats_service,
+    reconcile_dashboard_stats,
+)
+from app.domain.services.dashboard_stats import (
+    POSTING_STATS_KEY,
+    STATS_INITIALIZED_KEY,
+    get_dashboard_stats,
+    incr_applicant,
+    incr_resume,
+    move_posting_status,
+    move_user_status,
+    replace_dashboard_stats,
+)
+from app.exceptions.auth_exceptions import PermissionDeniedException
+
+
+class DummyUser:
+    def __init__(self, id, user_type="normal"):
+        self.id = id
+        self.user_type = user_type
+
+
+DUMMY_STATS = {
+    "users": {"active": 3, "pending": 1},
+    "postings": {"모집중": 2},
+    "applicants_daily": {"2025-05-01": 4},
+    "totals": {"applicants": 4, "resumes": 5},
+}
+
+
+@pytest.mark.asyncio
+@patch(
+    "app.domain.admin.services.dashboard_services.get_dashboard_stats",
+    new_callable=AsyncMock,
+)
+async def test_get_dashboard_stats_service(mock_get_stats):
+    # given
+    mock_get_stats.return_value = DUMMY_STATS
+
+    # when
+    result = await get_dashboard_stats_service(DummyUser(1, "normal,admin"))
+
+    # then
+    assert result.users == {"active": 3, "pending": 1}
+    assert result.postings == {"모집중": 2}
+    assert result.applicants_total == 4
+    assert result.resumes_total == 5
+
+
+@pytest.mark.asyncio
+@patch(
+    "app.domain.admin.services.dashboard_services.reconcile_dashboard_stats",
+    new_callable=AsyncMock,
+)
+@patch(
+    "app.domain.admin.services.dashboard_services.get_dashboard_stats",
+    new_callable=AsyncMock,
+)
+async def test_get_dashboard_stats_service_cold_start(mock_get_stats, mock_reconcile):
+    # given
+    mock_get_stats.return_value = None
+    mock_reconcile.return_value = DUMMY_STATS
+
+    # when
+    result = await get_dashboard_stats_service(DummyUser(1, "admin"))
+
+    # then
+    mock_reconcile.assert_called_once()
+    assert result.applicants_daily == {"2025-05-01": 4}
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_stats_service_permission_denied():
+    with pytest.raises(PermissionDeniedException):
+        await get_dashboard_stats_service(DummyUser(1, "normal"))
+
+
+@pytest.mark.asyncio
+@patch(
+    "app.domain.admin.services.dashboard_services.replace_dashboard_stats",
+    new_callable=AsyncMock,
+)
+@patch(
+    "app.domain.admin.services.dashboard_services.aggregate_dashboard_stats",
+    new_callable=AsyncMock,
+)
+async def test_reconcile_dashboard_stats(mock_aggregate, mock_replace):
+    mock_aggregate.return_value = DUMMY_STATS
+
+    result = await reconcile_dashboard_stats()
+
+    mock_replace.assert_called_once_with(DUMMY_STATS)
+    assert result == DUMMY_STATS
+
+
+@pytest.mark.asyncio
+async def test_move_posting_status_counter():
+    redis = MagicMock()
+    redis.eval = AsyncMock()
+
+    with patch("app.domain.services.dashboard_stats.get_redis", return_value=redis):
+        await move_posting_status("모집중", "모집 종료")
+
+    _, numkeys, *keys_and_args = redis.eval.await_args.args
+    assert numkeys == 3
+    assert keys_and_args == [
+        STATS_INITIALIZED_KEY,
+        POSTING_STATS_KEY,
+        POSTING_STATS_KEY,
+        "모집중",
+        -1,
+        "모집 종료",
+        1,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_move_user_status_redis_error_is_ignored():
+    redis = MagicMock()
+    redis.eval = AsyncMock(side_effect=ConnectionError("redis down"))
+
+    with patch("app.domain.services.dashboard_stats.get_redis", return_value=redis):
+        # 카운터 갱신 실패가 쓰기 요청을 실패시키면 안 된다
+        await move_user_status("pending", "active")
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        return [getattr(self.redis, n)(*a, **k) for n, a, k in self.commands]
+
+
+class FakeStatsRedis:
+    """INCR_IF_INITIALIZED_SCRIPT 와 같은 동작을 하는 메모리 redis"""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def eval(self, script, numkeys, *keys_and_args):
+        keys, args = keys_and_args[:numkeys], keys_and_args[numkeys:]
+        if keys[0] not in self.data:
+            return 0
+        for i, key in enumerate(keys[1:]):
+            field, amount = args[2 * i], args[2 * i + 1]
+            hash_ = self.data.setdefault(key, {})
+            hash_[field] = int(hash_.get(field, 0)) + amount
+        return 1
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def hset(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+
+@pytest.mark.asyncio
+async def test_increment_before_first_aggregation_is_not_treated_as_stats():
+    redis = FakeStatsRedis()
+    with patch("app.domain.services.dashboard_stats.get_redis", return_value=redis):
+        # given: 배포 직후, 집계 전에 지원자/이력서가 생겼다
+        await incr_applicant()
+        await incr_resume()
+
+        # then: 증감만으로는 초기화되지 않아 DB 집계를 타게 된다
+        assert await get_dashboard_stats() is None
+
+        # when: 집계 후의 증감은 반영된다
+        await replace_dashboard_stats(DUMMY_STATS)
+        await incr_resume()
+        stats = await get_dashboard_stats()
+
+    assert stats["totals"] == {"applicants": 4, "resumes": 6}
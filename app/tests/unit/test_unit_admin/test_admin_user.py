@@ -0,0 +1,118 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.domain.admin.repositories.user_repository import (
+    _like_pattern,
+    split_user_union_row,
+)
+from app.domain.admin.services.user_services import (
+    get_user_all_service,
+    get_user_by_id_service,
+)
+from app.exceptions.search_exceptions import (
+    InvalidLimitException,
+    SearchKeywordTooLongException,
+)
+from app.exceptions.user_exceptions import UserNotFoundException
+
+
+class DummyUser:
+    def __init__(self, id, user_type="admin"):
+        self.id = id
+        self.user_type = user_type
+
+
+def make_row(seeker=True, corp=False):
+    row = {
+        "base__id": 1,
+        "base__email": "test@test.com",
+        "base__user_type": "normal",
+        "base__signinMethod": "email",
+        "base__status": "active",
+        "base__email_verified": True,
+        "base__created_at": datetime(2025, 5, 1),
+        "base__deleted_at": None,
+        "base__gender": "male",
+        "base__leave_reason": None,
+        "seeker__id": 10 if seeker else None,
+        "seeker__name": "테스트유저" if seeker else None,
+        "seeker__phone_number": "01012345678" if seeker else None,
+        "seeker__birth": None,
+        "seeker__interests": "" if seeker else None,
+        "seeker__purposes": "" if seeker else None,
+        "seeker__sources": "" if seeker else None,
+        "seeker__applied_posting": None,
+        "seeker__applied_posting_count": 0 if seeker else None,
+        "seeker__status": "seeking" if seeker else None,
+        "seeker__profile_url": None,
+        "corp__id": 20 if corp else None,
+        "corp__company_name": "테스트 주식회사" if corp else None,
+        "corp__business_start_date": datetime(2010, 1, 1) if corp else None,
+        "corp__business_number": "123-45-67890" if corp else None,
+        "corp__company_description": None,
+        "corp__manager_name": "홍길동" if corp else None,
+        "corp__manager_phone_number": "01012345678" if corp else None,
+        "corp__manager_email": None,
+        "corp__profile_url": None,
+    }
+    return split_user_union_row(row)
+
+
+def test_split_user_union_row():
+    row = make_row(seeker=True, corp=False)
+
+    assert row["base"]["email"] == "test@test.com"
+    assert row["seeker"]["id"] == 10
+    assert row["corp"] is None
+
+
+def test_like_pattern_escapes_wildcards():
+    assert _like_pattern("a_b%") == "%a\\_b\\%%"
+
+
+@pytest.mark.asyncio
+@patch(
+    "app.domain.admin.services.user_services.get_user_unions",
+    new_callable=AsyncMock,
+)
+async def test_get_user_all_service(mock_get_user_unions):
+    # given
+    mock_get_user_unions.return_value = [make_row(seeker=True, corp=True)]
+
+    # when
+    result = await get_user_all_service(DummyUser(1), False, False, "test", 0, 10)
+
+    # then
+    mock_get_user_unions.assert_called_once_with(False, False, "test", 0, 10)
+    assert result[0].base.id == 1
+    assert result[0].seeker.name == "테스트유저"
+    assert result[0].corp.company_name == "테스트 주식회사"
+
+
+@pytest.mark.asyncio
+async def test_get_user_all_service_invalid_params():
+    with pytest.raises(SearchKeywordTooLongException):
+        await get_user_all_service(DummyUser(1), False, False, "1" * 101)
+
+    with pytest.raises(InvalidLimitException):
+        await get_user_all_service(DummyUser(1), False, False, None, 0, 101)
+
+
+@pytest.mark.asyncio
+@patch(
+    "app.domain.admin.services.user_services.get_user_union_by_id",
+    new_callable=AsyncMock,
+)
+async def test_get_user_by_id_service(mock_get_user_union_by_id):
+    mock_get_user_union_by_id.return_value = make_row(seeker=False, corp=True)
+
+    result = await get_user_by_id_service(DummyUser(1), 1)
+
+    assert result.seeker is None
+    assert result.corp.manager_name == "홍길동"
+
+    mock_get_user_union_by_id.return_value = None
+    with pytest.raises(UserNotFoundException):
+        await get_user_by_id_service(DummyUser(1), 999)
@@ -0,0 +1,131 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.core.admission import (
+    ADMIN_LIST,
+    ANONYMOUS_BROWSE,
+    CRITICAL,
+    NORMAL,
+    AdmissionController,
+    AdmissionMiddleware,
+    classify,
+    is_authenticated,
+)
+from app.core.token import create_jwt_tokens, create_token
+
+ACCESS_TOKEN, REFRESH_TOKEN = create_jwt_tokens(1, "normal")
+
+
+def test_classify_route_classes():
+    assert classify("POST", "/api/user/login/", False) is CRITICAL
+    assert classify("POST", "/api/postings/3/applicant/", True) is CRITICAL
+    assert classify("GET", "/api/postings/", False) is ANONYMOUS_BROWSE
+    assert classify("GET", "/api/postings/", True) is NORMAL
+    assert classify("GET", "/api/admin/users/", True) is ADMIN_LIST
+    assert classify("PATCH", "/api/admin/job-postings/1/", True) is NORMAL
+
+
+def test_only_valid_access_token_counts_as_authenticated():
+    expired = create_token({"sub": "1", "user_type": "normal"}, timedelta(minutes=-1))
+
+    assert is_authenticated([(b"authorization", f"Bearer {ACCESS_TOKEN}".encode())])
+    assert is_authenticated(
+        [(b"cookie", f"theme=dark; access_token={ACCESS_TOKEN}".encode())]
+    )
+    # 위조/만료/다른 용도 토큰은 비로그인과 같게 취급
+    assert not is_authenticated([(b"authorization", b"x")])
+    assert not is_authenticated([(b"authorization", b"Bearer x")])
+    assert not is_authenticated([(b"cookie", b"access_token=abc")])
+    assert not is_authenticated([(b"authorization", f"Bearer {expired}".encode())])
+    assert not is_authenticated(
+        [(b"authorization", f"Bearer {REFRESH_TOKEN}".encode())]
+    )
+    assert not is_authenticated([])
+
+
+def test_shedding_levels_by_pool_wait():
+    # given
+    controller = AdmissionController(pool_wait_threshold=0.05, max_in_flight=100)
+
+    # when
+    for _ in range(20):
+        controller.record_pool_wait(0.1)
+
+    # then
+    assert controller.overload_level() == 1
+    assert controller.should_shed(ANONYMOUS_BROWSE) == 1
+    assert controller.should_shed(NORMAL) is None
+
+    for _ in range(20):
+        controller.record_pool_wait(0.5)
+    assert controller.should_shed(NORMAL) == 2
+    assert controller.should_shed(CRITICAL) is None
+
+
+def test_pool_wait_estimate_decays_without_samples():
+    controller = AdmissionController(pool_wait_threshold=0.05, max_in_flight=100)
+    for _ in range(20):
+        controller.record_pool_wait(0.1)
+
+    with patch(
+        "app.core.admission.time.monotonic", return_value=controller._wait_at + 3
+    ):
+        assert controller.overload_level() == 0
+
+
+def test_in_flight_limit_sheds_low_priority():
+    controller = AdmissionController(pool_wait_threshold=1, max_in_flight=2)
+    controller.enter(NORMAL)
+    controller.enter(CRITICAL)
+
+    assert controller.should_shed(ADMIN_LIST) == 1
+    controller.leave(NORMAL)
+    assert controller.should_shed(ADMIN_LIST) is None
+
+
+@pytest.mark.asyncio
+async def test_middleware_rejects_with_retry_after_and_keeps_login():
+    # given
+    controller = AdmissionController(pool_wait_threshold=0.05, max_in_flight=100)
+    for _ in range(20):
+        controller.record_pool_wait(0.1)
+
+    app = FastAPI()
+
+    @app.get("/api/postings/")
+    async def postings():
+        return []
+
+    @app.post("/api/user/login/")
+    async def login():
+        return {"ok": True}
+
+    app.add_middleware(AdmissionMiddleware, controller=controller)
+    transport = httpx.ASGITransport(app=app)
+
+    with patch("app.core.admission.settings.ADMISSION_ENABLED", True):
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            # when
+            shed = await c.get("/api/postings/")
+            login = await c.post("/api/user/login/")
+            authed = await c.get(
+                "/api/postings/", headers={"Authorization": f"Bearer {ACCESS_TOKEN}"}
+            )
+            cookie_authed = await c.get(
+                "/api/postings/", headers={"Cookie": f"access_token={ACCESS_TOKEN}"}
+            )
+            forged = await c.get("/api/postings/", headers={"Authorization": "x"})
+
+    # then
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "2"
+    assert shed.json()["message"]["code"] == "server_overloaded"
+    assert login.status_code == 200
+    assert authed.status_code == 200
+    assert cookie_authed.status_code == 200
+    assert forged.status_code == 503
+    assert sum(controller.in_flight.values()) == 0
@@ -0,0 +1,184 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.cache import LocalLRU, ReadThroughCache, cached, read_cache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.published = []
+
+    async def mget(self, *keys):
+        return [self.data.get(k) for k in keys]
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def incr(self, key):
+        self.ops.append(("incr", key))
+
+    def publish(self, channel, message):
+        self.ops.append(("publish", (channel, message)))
+
+    async def execute(self):
+        for op, arg in self.ops:
+            if op == "incr":
+                self.redis.data[arg] = str(int(self.redis.data.get(arg, 0)) + 1)
+            else:
+                self.redis.published.append(arg)
+
+
+def new_cache():
+    return ReadThroughCache(l1_size=16, l1_ttl=60, ttl=300)
+
+
+def posting(title="경비원 모집"):
+    return SimpleNamespace(id=3, title=title, view_count=0)
+
+
+@pytest.mark.asyncio
+async def test_read_through_fills_both_tiers_and_returns_copies():
+    # given
+    redis = FakeRedis()
+    worker_a, worker_b = new_cache(), new_cache()
+    loader = AsyncMock(side_effect=lambda: posting())
+
+    with patch("app.core.cache.get_redis", return_value=redis):
+        # when
+        first = await worker_a.get_or_load("posting", "k", ("posting:3",), loader)
+        first.view_count += 1
+        second = await worker_a.get_or_load("posting", "k", ("posting:3",), loader)
+        other = await worker_b.get_or_load("posting", "k", ("posting:3",), loader)
+
+    # then
+    assert loader.await_count == 1
+    assert second.view_count == 0 and second is not first
+    assert other.title == "경비원 모집"
+    assert "cache:value:k" in redis.data
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tags_drops_l1_and_stale_l2_entries():
+    # given
+    redis = FakeRedis()
+    worker_a, worker_b = new_cache(), new_cache()
+    titles = iter(["이전 제목", "수정된 제목"])
+    loader = AsyncMock(side_effect=lambda: posting(next(titles)))
+
+    with patch("app.core.cache.get_redis", return_value=redis):
+        await worker_a.get_or_load("posting", "k", ("posting:3",), loader)
+
+        # when
+        await worker_b.invalidate_tags("posting:3")
+        reloaded = await worker_b.get_or_load("posting", "k", ("posting:3",), loader)
+        worker_a.local.invalidate_tags(["posting:3"])  # pub/sub 수신 대신
+        on_a = await worker_a.get_or_load("posting", "k", ("posting:3",), loader)
+
+    # then
+    assert reloaded.title == "수정된 제목"
+    assert on_a.title == "수정된 제목"
+    assert loader.await_count == 2
+    assert redis.published == [("cache:invalidate", "posting:3")]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_load_once():
+    # given
+    cache = new_cache()
+
+    async def slow_load():
+        await asyncio.sleep(0.01)
+        return posting()
+
+    loader = AsyncMock(side_effect=slow_load)
+
+    with patch("app.core.cache.get_redis", return_value=FakeRedis()):
+        # when
+        results = await asyncio.gather(
+            *(
+                cache.get_or_load("posting", "k", ("posting:3",), loader)
+                for _ in range(5)
+            )
+        )
+
+    # then
+    assert loader.await_count == 1
+    assert all(r.title == "경비원 모집" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_redis_down_falls_back_to_l1_and_skips_missing_rows():
+    # given
+    redis = AsyncMock()
+    redis.mget.side_effect = ConnectionError("redis down")
+    cache = new_cache()
+    loader = AsyncMock(side_effect=[None, posting(), posting()])
+
+    with patch("app.core.cache.get_redis", return_value=redis):
+        # when
+        missing = await cache.get_or_load("posting", "k", ("posting:3",), loader)
+        loaded = await cache.get_or_load("posting", "k", ("posting:3",), loader)
+        hit = await cache.get_or_load("posting", "k", ("posting:3",), loader)
+
+    # then
+    assert missing is None
+    assert loaded.title == hit.title
+    assert loader.await_count == 2
+    redis.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cached_decorator_keys_by_tags_and_fresh_bypasses():
+    # given
+    calls = []
+
+    @cached("posting", tags=lambda id: (f"posting:{id}",))
+    async def get_posting(id):
+        calls.append(id)
+        return posting()
+
+    read_cache.local.clear()
+    with patch("app.core.cache.settings.READ_CACHE_ENABLED", True), patch(
+        "app.core.cache.get_redis", return_value=FakeRedis()
+    ):
+        # when
+        await get_posting(3)
+        await get_posting(3)
+        await get_posting(4)
+        await get_posting(3, fresh=True)
+
+    # then
+    assert calls == [3, 4, 3]
+    read_cache.local.clear()
+
+
+def test_local_lru_evicts_oldest_and_indexes_tags():
+    lru = LocalLRU(maxsize=2, ttl=60)
+    lru.set("a", b"1", ("posting:1",))
+    lru.set("b", b"2", ("posting:2", "user:9"))
+    lru.get("a")
+    lru.set("c", b"3", ("user:9",))
+
+    assert lru.get("b") is None  # 가장 오래 안 쓴 항목
+    lru.invalidate_tags(["user:9"])
+    assert lru.get("c") is None and lru.get("a") == b"1"
+    assert len(lru) == 1
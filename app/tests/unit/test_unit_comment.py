@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -10,6 +11,8 @@ from app.domain.comment.services import (
     patch_comment_by_id_service,
 )
 from app.exceptions.base_exceptions import CustomException
+from app.exceptions.search_exceptions import InvalidLimitException
+from app.utils.pagination import decode_cursor
 
 
 @pytest.mark.asyncio
@@ -56,7 +59,36 @@ async def test_get_all_comments_service(mock_get_comments):
     result = await get_all_comments_service(dummy_id)
 
     # then
-    assert result == mock_data
+    mock_get_comments.assert_called_once_with(dummy_id, None, 20)
+    assert result.data == mock_data
+    assert result.next_cursor is None
+
+
+@pytest.mark.asyncio
+@patch("app.domain.comment.services.get_comments_query", new_callable=AsyncMock)
+async def test_get_all_comments_service_next_cursor(mock_get_comments):
+    # given
+    mock_get_comments.return_value = [
+        CommentResponseDTO(
+            id=i,
+            content="테스트 댓글",
+            created_at=datetime(2025, 4, 23, 12, 0, tzinfo=timezone.utc),
+        )
+        for i in (3, 2, 1)
+    ]
+
+    # when
+    result = await get_all_comments_service(1, None, 2)
+
+    # then
+    assert [c.id for c in result.data] == [3, 2]
+    assert decode_cursor(result.next_cursor)[1] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_all_comments_service_invalid_limit():
+    with pytest.raises(InvalidLimitException):
+        await get_all_comments_service(1, None, 0)
 
 
 @pytest.mark.asyncio
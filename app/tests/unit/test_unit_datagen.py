@@ -0,0 +1,56 @@
+import random
+from collections import Counter
+
+from app.domain.free_board.models import FreeBoard
+from benchmarks.datagen import DatasetConfig, Generator, ZipfSampler, column_defaults
+
+
+def test_dataset_config_for_postings_scales_ratios():
+    config = DatasetConfig.for_postings(1_000_000, seekers=10, days=None)
+
+    assert config.corporates == 50_000
+    assert config.seekers == 10  # 직접 지정한 값이 우선
+    assert config.free_boards == 100_000
+    assert config.days == 730
+
+
+def test_zipf_sampler_skews_towards_popular_ids():
+    # given
+    sampler = ZipfSampler(1000, 1.1, random.Random(0))
+
+    # when
+    counts = Counter(sampler.sample(50_000))
+
+    # then
+    top_ten = sum(count for _, count in counts.most_common(10))
+    assert top_ten > 50_000 * 0.25
+    assert set(counts) <= set(range(1, 1001))
+
+
+def test_job_postings_use_enum_values_and_unique_titles():
+    config = DatasetConfig(postings=200, corporates=5)
+    rows = list(Generator(config).job_postings([f"회사{i}" for i in range(5)]))
+
+    assert len({row["title"] for row in rows}) == 200
+    assert {row["status"] for row in rows} <= {
+        "모집중",
+        "마감 임박",
+        "모집 종료",
+        "블라인드",
+        "대기중",
+        "반려됨",
+    }
+    assert all(1 <= row["user_id"] <= 5 for row in rows)
+
+
+def test_column_defaults_fill_model_defaults():
+    columns = ["view_count", "comment_count", "image_url", "created_at"]
+
+    defaults = column_defaults(FreeBoard, columns, now="NOW")
+
+    assert defaults == {
+        "view_count": 0,
+        "comment_count": 0,
+        "image_url": None,
+        "created_at": "NOW",
+    }
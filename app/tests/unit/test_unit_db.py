@@ -0,0 +1,69 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from tortoise.exceptions import ConfigurationError
+
+from app.core import db
+
+
+@pytest.fixture(autouse=True)
+def reset_replica_state():
+    db._replica_down_until = 0.0
+    yield
+    db._replica_down_until = 0.0
+
+
+def fake_connections(replica=True):
+    primary, replica_conn = MagicMock(name="primary"), MagicMock(name="replica")
+
+    def get_connection(name):
+        if name == db.REPLICA:
+            if not replica:
+                raise ConfigurationError("not configured")
+            return replica_conn
+        return primary
+
+    return primary, replica_conn, get_connection
+
+
+@pytest.mark.asyncio
+async def test_run_read_uses_replica():
+    # given
+    primary, replica, get_connection = fake_connections()
+    query = AsyncMock(return_value="rows")
+
+    # when
+    with patch("app.core.db.Tortoise.get_connection", side_effect=get_connection):
+        result = await db.run_read(query)
+
+    # then
+    query.assert_awaited_once_with(replica)
+    assert result == "rows"
+
+
+@pytest.mark.asyncio
+async def test_run_read_without_replica_uses_primary():
+    primary, _, get_connection = fake_connections(replica=False)
+    query = AsyncMock(return_value="rows")
+
+    with patch("app.core.db.Tortoise.get_connection", side_effect=get_connection):
+        await db.run_read(query)
+
+    query.assert_awaited_once_with(primary)
+
+
+@pytest.mark.asyncio
+async def test_run_read_falls_back_to_primary_when_replica_down():
+    # given
+    primary, replica, get_connection = fake_connections()
+    query = AsyncMock(side_effect=[ConnectionRefusedError("replica down"), "rows"])
+
+    # when
+    with patch("app.core.db.Tortoise.get_connection", side_effect=get_connection):
+        result = await db.run_read(query)
+        # 우회 시간 동안은 replica 를 시도하지 않는다
+        assert db.get_read_connection() is primary
+
+    # then
+    assert result == "rows"
+    assert [call.args[0] for call in query.await_args_list] == [replica, primary]
@@ -0,0 +1,146 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.responses import PrevalidatedJSONResponse
+from app.domain.applicant.repository import applicant_projection
+from app.domain.applicant.schema import APPLICANT_FIELDS
+from app.domain.applicant.utils import format_applicant_rows
+from app.domain.posting.repository import posting_columns, to_posting_dtos
+from app.domain.posting.schemas import (
+    JOB_POSTING_FIELDS,
+    JobPostingResponseDTO,
+    PaginatedJobPostingsResponseDTO,
+)
+from app.exceptions.search_exceptions import InvalidFieldsException
+from app.utils.fieldsets import partial_page_schema, partial_schema
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def test_resolve_presets_and_field_names():
+    # when
+    card = JOB_POSTING_FIELDS.resolve("card")
+    custom = JOB_POSTING_FIELDS.resolve(" deadline,title ,")
+
+    # then
+    assert JOB_POSTING_FIELDS.resolve(None) == tuple(JobPostingResponseDTO.model_fields)
+    assert JOB_POSTING_FIELDS.resolve("card,full") == JOB_POSTING_FIELDS.resolve(None)
+    assert card[0] == "id" and "description" not in card
+    assert custom == ("id", "title", "deadline")  # 스키마 필드 순서, id 항상 포함
+    assert JOB_POSTING_FIELDS.resolve("card,view_count") == tuple(
+        f for f in JobPostingResponseDTO.model_fields if f in {*card, "view_count"}
+    )
+
+
+def test_resolve_unknown_field_raises():
+    with pytest.raises(InvalidFieldsException) as exc:
+        JOB_POSTING_FIELDS.resolve("title,password")
+
+    assert exc.value.status_code == 400
+    assert exc.value.code == "invalid_fields"
+
+
+def test_partial_schema_is_cached_and_full_returns_original():
+    fields = JOB_POSTING_FIELDS.resolve("card")
+
+    assert partial_schema(JobPostingResponseDTO, fields) is partial_schema(
+        JobPostingResponseDTO, fields
+    )
+    assert set(partial_schema(JobPostingResponseDTO, fields).model_fields) == set(
+        fields
+    )
+    assert (
+        partial_page_schema(
+            PaginatedJobPostingsResponseDTO,
+            JobPostingResponseDTO,
+            JOB_POSTING_FIELDS.resolve(None),
+        )
+        is PaginatedJobPostingsResponseDTO
+    )
+
+
+def test_posting_card_page_projection_and_payload():
+    # given
+    fields = JOB_POSTING_FIELDS.resolve("card")
+    rows = [
+        {
+            "id": i,
+            "company": "한빛시설관리",
+            "title": f"경비원 모집 #{i}",
+            "location": "서울특별시 강남구",
+            "salary": "월 250만원",
+            "deadline": "2025-02-01",
+            "status": "모집중",
+            "image_url": None,
+        }
+        for i in (1, 2)
+    ]
+
+    # when
+    data = to_posting_dtos(rows, bookmarked_ids=[2], fields=fields)
+    page = partial_page_schema(
+        PaginatedJobPostingsResponseDTO, JobPostingResponseDTO, fields
+    ).model_construct(total=2, offset=0, limit=10, data=data)
+    body = json.loads(PrevalidatedJSONResponse(page).body)
+
+    # then
+    assert "description" not in posting_columns(fields)
+    assert "is_bookmarked" not in posting_columns(fields)
+    assert body["total"] == 2
+    assert set(body["data"][0]) == set(fields)
+    assert [d["is_bookmarked"] for d in body["data"]] == [False, True]
+
+
+def test_posting_full_rows_build_nested_user():
+    # given
+    fields = JOB_POSTING_FIELDS.resolve(None)
+    row = {column: "x" for column in posting_columns(fields)}
+    row.update(
+        id=1,
+        user_id=7,
+        recruitment_count=1,
+        view_count=0,
+        report=0,
+        created_at=NOW,
+        updated_at=NOW,
+        image_url=None,
+    )
+
+    # when
+    dto = to_posting_dtos([row], bookmarked_ids=[])[0]
+
+    # then
+    assert "user_id" in posting_columns(fields)
+    assert isinstance(dto, JobPostingResponseDTO)
+    assert dto.user.id == 7 and dto.is_bookmarked is False
+
+
+def test_applicant_rows_join_resume_and_posting_columns():
+    # given
+    fields = APPLICANT_FIELDS.resolve("card")
+    projection = applicant_projection(fields)
+    row = {
+        "id": 1,
+        "job_posting_id": 3,
+        "resume_id": 5,
+        "resume_title": "경비 경력 이력서",
+        "resume_name": "김영수",
+        "resume_email": "kim@senior-tomorrow.kr",
+        "status": "지원 중",
+        "created_at": NOW,
+        "title": "경비원 모집",
+        "company": "한빛시설관리",
+        "deadline": "2025-02-01",
+    }
+
+    # when
+    result = format_applicant_rows([row], fields)
+
+    # then
+    assert projection["title"] == "job_posting__title"
+    assert projection["resume_name"] == "resume__name"
+    assert "memo" not in projection
+    assert result[0].resume.name == "김영수"
+    assert result[0].company == "한빛시설관리"
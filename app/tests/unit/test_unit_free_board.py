@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -8,9 +9,16 @@ from app.domain.free_board.services import (
     delete_free_board_by_id_service,
     get_all_free_board_service,
     get_free_board_by_id_service,
+    get_free_board_feed_service,
+    get_popular_free_boards_service,
     patch_free_board_by_id_service,
 )
 from app.exceptions.base_exceptions import CustomException
+from app.exceptions.search_exceptions import (
+    InvalidCursorException,
+    InvalidLimitException,
+)
+from app.utils.pagination import decode_cursor, encode_cursor
 
 
 @pytest.mark.asyncio
@@ -145,3 +153,96 @@ async def test_delete_free_board_by_id_service(
 
     # then
     assert result is None
+
+
+def make_feed_row(id, created_at):
+    return {
+        "id": id,
+        "title": f"title {id}",
+        "image_url": None,
+        "view_count": 0,
+        "comment_count": 0,
+        "created_at": created_at,
+        "user_id": 1,
+        "user_email": "test@test.com",
+    }
+
+
+@pytest.mark.asyncio
+@patch(
+    "app.domain.free_board.services.get_free_board_feed_query",
+    new_callable=AsyncMock,
+)
+async def test_get_free_board_feed_service(mock_feed):
+    # given
+    created_at = datetime(2025, 4, 23, 12, 0, tzinfo=timezone.utc)
+    mock_feed.return_value = [make_feed_row(i, created_at) for i in (3, 2, 1)]
+    mock_feed.return_value[0]["comment_count"] = 5
+
+    # when
+    result = await get_free_board_feed_service(None, 2)
+
+    # then
+    mock_feed.assert_called_once_with(None, 2)
+    assert [item.id for item in result.data] == [3, 2]
+    assert [item.comment_count for item in result.data] == [5, 0]
+    assert decode_cursor(result.next_cursor) == (created_at, 2)
+
+
+@pytest.mark.asyncio
+@patch(
+    "app.domain.free_board.services.get_free_board_feed_query",
+    new_callable=AsyncMock,
+)
+async def test_get_free_board_feed_service_last_page(mock_feed):
+    created_at = datetime(2025, 4, 23, 12, 0, tzinfo=timezone.utc)
+    mock_feed.return_value = [make_feed_row(1, created_at)]
+
+    result = await get_free_board_feed_service(encode_cursor(created_at, 2), 2)
+
+    assert len(result.data) == 1
+    assert result.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_free_board_feed_service_invalid_params():
+    with pytest.raises(InvalidLimitException):
+        await get_free_board_feed_service(None, 101)
+
+    with pytest.raises(InvalidCursorException):
+        decode_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+@patch(
+    "app.domain.free_board.services.get_free_board_cards_by_ids_query",
+    new_callable=AsyncMock,
+)
+@patch("app.domain.free_board.services.get_top_ids", new_callable=AsyncMock)
+async def test_get_popular_free_boards_service(mock_top_ids, mock_cards):
+    # given
+    created_at = datetime(2025, 4, 23, 12, 0, tzinfo=timezone.utc)
+    mock_top_ids.return_value = [2, 1]
+    mock_cards.return_value = [
+        make_feed_row(2, created_at),
+        make_feed_row(1, created_at),
+    ]
+
+    # when
+    result = await get_popular_free_boards_service(2)
+
+    # then
+    mock_top_ids.assert_called_once_with("free_board", 2)
+    mock_cards.assert_called_once_with([2, 1])
+    assert [item.id for item in result] == [2, 1]
+
+
+@pytest.mark.asyncio
+@patch("app.domain.free_board.services.get_top_ids", new_callable=AsyncMock)
+async def test_get_popular_free_boards_service_empty(mock_top_ids):
+    mock_top_ids.return_value = []
+
+    assert await get_popular_free_boards_service() == []
+
+    with pytest.raises(InvalidLimitException):
+        await get_popular_free_boards_service(0)
@@ -0,0 +1,163 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from pydantic import BaseModel
+
+from app.core.http_cache import (
+    PRIVATE_REVALIDATE,
+    PUBLIC_REVALIDATE,
+    conditional_get,
+    invalidate_validator,
+    make_validator,
+)
+
+UPDATED_AT = datetime(2025, 1, 1, 9, 0, 0, 123456, tzinfo=timezone.utc)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def mget(self, *keys):
+        return [self.data.get(k) for k in keys]
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def incr(self, key):
+        self.ops.append(("incr", key))
+
+    def delete(self, key):
+        self.ops.append(("delete", key))
+
+    async def execute(self):
+        for op, key in self.ops:
+            if op == "incr":
+                self.redis.data[key] = str(int(self.redis.data.get(key, 0)) + 1)
+            else:
+                self.redis.data.pop(key, None)
+
+
+class BoardDTO(BaseModel):
+    id: int
+    title: str
+
+    model_config = {"from_attributes": True}
+
+
+def make_app(load, on_cache_hit):
+    app = FastAPI()
+
+    @app.get("/boards/{id}/")
+    async def get_board(request: Request, id: int):
+        return await conditional_get(
+            request,
+            f"boards:{id}",
+            load=load,
+            serialize=BoardDTO.model_validate,
+            policy=PRIVATE_REVALIDATE,
+            on_cache_hit=on_cache_hit,
+        )
+
+    return app
+
+
+async def get(app, headers=None):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        return await c.get("/boards/1/", headers=headers or {})
+
+
+def board():
+    return SimpleNamespace(id=1, title="공지", updated_at=UPDATED_AT)
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_uses_cached_validator_without_loading():
+    # given
+    redis = FakeRedis()
+    load = AsyncMock(side_effect=lambda: board())
+    on_cache_hit = AsyncMock()
+    app = make_app(load, on_cache_hit)
+
+    with patch("app.core.http_cache.get_redis", return_value=redis):
+        # when
+        first = await get(app)
+        second = await get(app, {"If-None-Match": first.headers["etag"]})
+        by_date = await get(app, {"If-Modified-Since": first.headers["last-modified"]})
+
+    # then
+    assert first.status_code == 200
+    assert first.json() == {"id": 1, "title": "공지"}
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert first.headers["etag"].startswith('W/"')
+    assert second.status_code == 304 and second.content == b""
+    assert second.headers["etag"] == first.headers["etag"]
+    assert by_date.status_code == 304
+    assert load.await_count == 1
+    assert on_cache_hit.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_changes_etag_and_forces_reload():
+    # given
+    redis = FakeRedis()
+    load = AsyncMock(side_effect=lambda: board())
+    app = make_app(load, AsyncMock())
+
+    with patch("app.core.http_cache.get_redis", return_value=redis):
+        first = await get(app)
+
+        # when
+        await invalidate_validator("boards:1")
+        after = await get(app, {"If-None-Match": first.headers["etag"]})
+
+    # then
+    assert after.status_code == 200
+    assert after.headers["etag"] != first.headers["etag"]
+    assert load.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_without_redis_still_returns_304_after_load():
+    # given
+    redis = AsyncMock()
+    redis.mget.side_effect = ConnectionError("redis down")
+    redis.set.side_effect = ConnectionError("redis down")
+    load = AsyncMock(side_effect=lambda: board())
+    on_cache_hit = AsyncMock()
+    app = make_app(load, on_cache_hit)
+    etag = make_validator(UPDATED_AT).etag
+
+    with patch("app.core.http_cache.get_redis", return_value=redis):
+        # when
+        response = await get(app, {"If-None-Match": f'"other", {etag}'})
+
+    # then
+    assert response.status_code == 304
+    assert load.await_count == 1
+    on_cache_hit.assert_not_awaited()
+
+
+def test_cache_policy_headers():
+    assert PUBLIC_REVALIDATE.header == "public, no-cache"
+    assert make_validator(UPDATED_AT, 3).etag.endswith('.3"')
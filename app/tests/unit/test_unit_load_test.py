@@ -0,0 +1,63 @@
+from benchmarks.load_test import compare_with_baseline, percentile, summarize
+from benchmarks.scenarios import Recorder
+
+
+def stats(p95, rps=100.0, error_rate=0.0):
+    return {"p95": p95, "rps": rps, "error_rate": error_rate}
+
+
+def test_summarize_percentiles():
+    # given
+    recorder = Recorder()
+    recorder.record("GET /api/postings/", 1.0, ok=True)  # 워밍업 중에는 무시
+    recorder.active = True
+    for ms in range(1, 101):
+        recorder.record("GET /api/postings/", ms / 1000, ok=ms % 10 != 0)
+
+    # when
+    summary = summarize(recorder, elapsed=10.0)["GET /api/postings/"]
+
+    # then
+    assert summary["count"] == 100
+    assert summary["rps"] == 10.0
+    assert summary["p50"] == 51.0
+    assert summary["p99"] == 99.0
+    assert summary["error_rate"] == 0.1
+    assert percentile([], 95) == 0.0
+
+
+def test_compare_with_baseline_within_tolerance():
+    baseline = {"GET /api/postings/": stats(p95=100.0)}
+    summary = {"GET /api/postings/": stats(p95=115.0, rps=90.0)}
+
+    assert compare_with_baseline(summary, baseline, tolerance=0.2) == []
+
+
+def test_compare_with_baseline_reports_regressions():
+    # given
+    baseline = {
+        "GET /api/postings/": stats(p95=100.0),
+        "POST /api/user/login/": stats(p95=50.0),
+        "GET /api/admin/user/": stats(p95=20.0),
+    }
+    summary = {
+        "GET /api/postings/": stats(p95=150.0, rps=50.0),
+        "POST /api/user/login/": stats(p95=50.0, error_rate=0.05),
+    }
+
+    # when
+    regressions = compare_with_baseline(summary, baseline, tolerance=0.2)
+
+    # then
+    assert len(regressions) == 4
+    assert any("p95" in r and "GET /api/postings/" in r for r in regressions)
+    assert any("처리량" in r for r in regressions)
+    assert any("오류율" in r for r in regressions)
+    assert any("측정 결과 없음" in r for r in regressions)
+
+
+def test_compare_with_baseline_ignores_noise_on_fast_endpoints():
+    baseline = {"GET /api/postings/{id}/": stats(p95=2.0)}
+    summary = {"GET /api/postings/{id}/": stats(p95=6.0)}
+
+    assert compare_with_baseline(summary, baseline, tolerance=0.2) == []
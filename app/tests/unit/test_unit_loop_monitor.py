@@ -0,0 +1,56 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.loop_monitor import LoopMonitor
+from app.domain.admin.services.monitoring_services import get_loop_offenders_service
+from app.exceptions.auth_exceptions import PermissionDeniedException
+
+
+class DummyUser:
+    def __init__(self, id, user_type="normal"):
+        self.id = id
+        self.user_type = user_type
+
+
+def blocking_call():
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+@patch("app.core.loop_monitor.record_offender", new_callable=AsyncMock)
+async def test_loop_monitor_captures_blocking_stack(mock_record):
+    # given
+    monitor = LoopMonitor(interval=0.02, threshold=0.1)
+    monitor.start()
+    await asyncio.sleep(0.05)
+
+    # when
+    blocking_call()
+    await asyncio.sleep(0.1)
+    await monitor.stop()
+
+    # then
+    mock_record.assert_awaited_once()
+    location = mock_record.await_args.args[0]
+    assert "test_unit_loop_monitor.py" in location
+    assert "blocking_call" in location
+
+
+@pytest.mark.asyncio
+@patch(
+    "app.domain.admin.services.monitoring_services.get_top_offenders",
+    new_callable=AsyncMock,
+)
+async def test_get_loop_offenders_service(mock_top_offenders):
+    mock_top_offenders.return_value = [("app/domain/user/services.py:10 login", 3)]
+
+    result = await get_loop_offenders_service(DummyUser(1, "admin"), 10)
+
+    mock_top_offenders.assert_awaited_once_with(10)
+    assert result[0].count == 3
+
+    with pytest.raises(PermissionDeniedException):
+        await get_loop_offenders_service(DummyUser(1, "normal"))
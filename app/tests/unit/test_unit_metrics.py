@@ -0,0 +1,83 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from prometheus_client import REGISTRY
+
+from app.core.metrics import (
+    MetricsMiddleware,
+    _wrap_db_method,
+    _wrap_redis_method,
+    get_request_stats,
+)
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class DummyDBClient:
+    async def execute_query(self, query, values=None):
+        return 2, [{"id": 1}, {"id": 2}]
+
+
+class DummyRedis:
+    async def execute_command(self, *args):
+        return "OK"
+
+
+DummyDBClient.execute_query = _wrap_db_method(
+    "execute_query", DummyDBClient.execute_query
+)
+DummyRedis.execute_command = _wrap_redis_method(DummyRedis.execute_command)
+
+
+def make_app():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{id}/")
+    async def get_item(id: int):
+        await DummyDBClient().execute_query("SELECT 1")
+        await DummyDBClient().execute_query("SELECT 2")
+        await DummyRedis().execute_command("GET", "key")
+        stats = get_request_stats()
+        return {"db_queries": stats.db_queries, "redis_calls": stats.redis_calls}
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_metrics_middleware_records_route_and_db_usage():
+    # given
+    route = "/items/{id}/"
+    before_requests = sample(
+        "http_requests_total", method="GET", route=route, status="200"
+    )
+    before_queries = sample("db_queries_total", route=route)
+    before_rows = sample("db_rows_total", route=route)
+    before_redis = sample("redis_calls_total", route=route)
+
+    # when
+    transport = httpx.ASGITransport(app=make_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        response = await c.get("/items/1/")
+
+    # then
+    assert response.json() == {"db_queries": 2, "redis_calls": 1}
+    assert (
+        sample("http_requests_total", method="GET", route=route, status="200")
+        == before_requests + 1
+    )
+    assert sample("db_queries_total", route=route) == before_queries + 2
+    assert sample("db_rows_total", route=route) == before_rows + 4
+    assert sample("redis_calls_total", route=route) == before_redis + 1
+    assert sample("http_requests_in_progress", method="GET") == 0
+
+
+@pytest.mark.asyncio
+async def test_db_query_outside_request_is_background():
+    before = sample("db_queries_total", route="background")
+
+    await DummyDBClient().execute_query("SELECT 1")
+
+    assert sample("db_queries_total", route="background") == before + 1
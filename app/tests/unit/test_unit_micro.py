@@ -0,0 +1,70 @@
+import pytest
+
+from benchmarks.micro import (
+    BENCHMARKS,
+    MicroResult,
+    compare_with_baseline,
+    make_user_union_row,
+    measure,
+)
+
+
+def result(mean_us, peak_kib):
+    return MicroResult(
+        mean_us=mean_us, median_us=mean_us, peak_kib=peak_kib, retained_kib=0.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_measure_sync_and_async_functions():
+    # given
+    def allocate():
+        return [0] * 10_000
+
+    async def allocate_async():
+        return [0] * 10_000
+
+    # when
+    sync_result = await measure(allocate, repeat=2)
+    async_result = await measure(allocate_async, repeat=2)
+
+    # then
+    for r in (sync_result, async_result):
+        assert r.mean_us > 0
+        assert r.peak_kib >= 10_000 * 8 / 1024  # 리스트 포인터 배열
+        assert r.retained_kib < 1
+
+
+def test_compare_with_baseline_reports_time_and_alloc_regressions():
+    baseline = {
+        "_meta": {"python": "3.11.7"},
+        "posting_dto_page": {"mean_us": 1000.0, "peak_kib": 100.0},
+        "admin_user_union_page": {"mean_us": 500.0, "peak_kib": 20.0},
+    }
+    results = {
+        "posting_dto_page": result(mean_us=1400.0, peak_kib=120.0),
+        "admin_user_union_page": result(mean_us=550.0, peak_kib=21.0),
+        "new_benchmark": result(mean_us=1.0, peak_kib=1.0),
+    }
+
+    regressions = compare_with_baseline(
+        results, baseline, time_tolerance=0.25, alloc_tolerance=0.1
+    )
+
+    assert len(regressions) == 2
+    assert all(r.startswith("posting_dto_page") for r in regressions)
+
+
+def test_registered_benchmarks_and_fixture_rows():
+    row = make_user_union_row(2)
+
+    assert {
+        "posting_dto_page",
+        "posting_page_response",
+        "posting_card_page_response",
+        "posting_page_response_model",
+        "admin_user_union_page",
+        "format_applicant_response",
+        "postings_filter_parsing",
+    } <= set(BENCHMARKS)
+    assert row["seeker__name"] and row["corp__id"] is None
@@ -0,0 +1,40 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.domain.services.posting_changes import CHANGE_SKEW_SECONDS, PostingChangeCursor
+
+
+@pytest.mark.asyncio
+async def test_cursor_picks_up_late_write_and_skips_applied_changes():
+    # given: 100초까지 반영
+    cursor = PostingChangeCursor()
+    cursor.reset(90.0)
+    with patch(
+        "app.domain.services.posting_changes.get_posting_changes",
+        new=AsyncMock(
+            side_effect=[
+                [(1, 96.0), (2, 100.0)],
+                # 다른 워커가 99초에 찍은 기록이 늦게 도착
+                [(1, 96.0), (3, 99.0), (2, 100.0)],
+            ]
+        ),
+    ) as get_changes:
+        cursor.advance(await cursor.fetch())
+
+        # when
+        late = await cursor.fetch()
+
+    # then: 겹치는 구간을 다시 읽되 이미 반영한 기록은 건너뛴다
+    assert late == [(3, 99.0)]
+    assert get_changes.await_args.args == (100.0 - CHANGE_SKEW_SECONDS,)
+    cursor.advance(late)
+    assert cursor.synced_at == 100.0
+
+
+def test_cursor_forgets_changes_outside_overlap_window():
+    cursor = PostingChangeCursor()
+    cursor.advance([(1, 10.0)])
+    cursor.advance([(2, 10.0 + CHANGE_SKEW_SECONDS + 1)])
+
+    assert cursor._applied == {(2, 10.0 + CHANGE_SKEW_SECONDS + 1)}
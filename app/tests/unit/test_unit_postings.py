@@ -0,0 +1,113 @@
+from datetime import date
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.domain.job_posting.services import (
+    backfill_deadline_dates,
+    transition_postings_by_deadline,
+)
+from app.domain.job_posting.utils import parse_deadline
+from app.domain.posting.services import get_all_postings_service
+from app.exceptions.search_exceptions import InvalidQueryParamsException
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2025-06-30", date(2025, 6, 30)),
+        ("2025.06.30", date(2025, 6, 30)),
+        ("2025. 6. 3.", date(2025, 6, 3)),
+        ("2025/6/30까지", date(2025, 6, 30)),
+        ("20250630", date(2025, 6, 30)),
+        ("2025년 6월 30일", date(2025, 6, 30)),
+        ("2025-02-30", None),
+        ("상시채용", None),
+        ("", None),
+    ],
+)
+def test_parse_deadline_formats(value, expected):
+    assert parse_deadline(value) == expected
+
+
+@pytest.mark.asyncio
+async def test_backfill_deadline_dates_updates_parsed_rows_in_batches():
+    # given
+    batches = [[(1, "2025-06-30"), (2, "상시채용")], [(5, "2025.07.01")], []]
+    with patch(
+        "app.domain.job_posting.services.rep_get_postings_without_deadline_date",
+        new=AsyncMock(side_effect=batches),
+    ) as fetch, patch(
+        "app.domain.job_posting.services.rep_set_deadline_dates",
+        new=AsyncMock(side_effect=[1, 1]),
+    ) as update:
+        # when
+        count = await backfill_deadline_dates(batch_size=2)
+
+    # then
+    assert count == 2
+    assert [c.args for c in fetch.await_args_list] == [(0, 2), (2, 2), (5, 2)]
+    assert update.await_args_list[0].args == ([1], [date(2025, 6, 30)])
+    assert update.await_args_list[1].args == ([5], [date(2025, 7, 1)])
+
+
+@pytest.mark.asyncio
+async def test_postings_deadline_filters_are_passed_to_query():
+    with patch(
+        "app.domain.posting.services.get_postings_query", new=AsyncMock()
+    ) as query:
+        await get_all_postings_service(
+            deadline_after=date(2025, 6, 1),
+            deadline_before=date(2025, 6, 3),
+            sort="closing_soon",
+        )
+
+    kwargs = query.await_args.kwargs
+    assert kwargs["deadline_after"] == date(2025, 6, 1)
+    assert kwargs["deadline_before"] == date(2025, 6, 3)
+    assert kwargs["sort"] == "closing_soon"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"sort": "popular"},
+        {"deadline_after": date(2025, 6, 3), "deadline_before": date(2025, 6, 1)},
+    ],
+)
+async def test_postings_invalid_sort_or_deadline_range(params):
+    with pytest.raises(InvalidQueryParamsException):
+        await get_all_postings_service(**params)
+
+
+@pytest.mark.asyncio
+async def test_transition_postings_by_deadline_batches_side_effects():
+    # given: 모집 종료 2배치(2건 + 1건), 마감 임박 0건
+    batches = [
+        [{"id": 1, "old_status": "모집중"}, {"id": 2, "old_status": "마감 임박"}],
+        [{"id": 3, "old_status": "모집중"}],
+        [],
+    ]
+    with patch(
+        "app.domain.job_posting.services.rep_transition_postings_by_deadline",
+        new=AsyncMock(side_effect=batches),
+    ) as transition, patch(
+        "app.domain.job_posting.services.move_posting_status", new=AsyncMock()
+    ) as move, patch(
+        "app.domain.job_posting.services.invalidate_tags", new=AsyncMock()
+    ) as invalidate, patch(
+        "app.domain.job_posting.services.invalidate_validator", new=AsyncMock()
+    ):
+        # when
+        result = await transition_postings_by_deadline(batch_size=2)
+
+    # then
+    assert result == {"모집 종료": 3, "마감 임박": 0}
+    assert transition.await_args_list[0].args[:2] == (["모집중", "마감 임박"], "모집 종료")
+    assert transition.await_args_list[2].args[:2] == (["모집중"], "마감 임박")
+    assert [c.args for c in invalidate.await_args_list] == [
+        ("posting:1", "posting:2"),
+        ("posting:3",),
+    ]
+    assert move.await_count == 3  # 배치별 이전 상태마다 한 번
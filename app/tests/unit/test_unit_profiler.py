@@ -0,0 +1,156 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.core.profiler import (
+    ProfilerMiddleware,
+    is_profile_requested,
+    is_superuser_request,
+)
+from app.domain.admin.services.monitoring_services import get_profile_service
+from app.exceptions.monitoring_exceptions import ProfileNotFoundException
+
+
+class DummyUser:
+    def __init__(self, id, user_type="normal"):
+        self.id = id
+        self.user_type = user_type
+
+
+def make_app():
+    app = FastAPI()
+    app.add_middleware(ProfilerMiddleware)
+
+    @app.get("/items/")
+    async def get_items():
+        return {"total": sum(range(10000))}
+
+    return app
+
+
+async def request(headers=None):
+    transport = httpx.ASGITransport(app=make_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        return await c.get("/items/", headers=headers or {})
+
+
+def test_is_profile_requested():
+    assert is_profile_requested({"headers": [(b"x-profile", b"1")]})
+    assert is_profile_requested({"headers": [], "query_string": b"profile=1"})
+    assert not is_profile_requested({"headers": [], "query_string": b"limit=10"})
+
+
+@pytest.mark.asyncio
+@patch("app.core.profiler.save_profile", new_callable=AsyncMock)
+@patch("app.core.profiler.acquire_rate_slot", new_callable=AsyncMock)
+@patch("app.core.profiler.is_superuser_request", new_callable=AsyncMock)
+async def test_profiler_middleware_stores_profile(mock_superuser, mock_rate, mock_save):
+    # given
+    mock_superuser.return_value = True
+    mock_rate.return_value = True
+
+    # when
+    response = await request({"X-Profile": "1"})
+
+    # then
+    profile_id = response.headers["x-profile-id"]
+    mock_save.assert_awaited_once()
+    saved_id, profile = mock_save.await_args.args
+    assert saved_id == profile_id
+    assert "speedscope" in json.loads(profile)["$schema"]
+
+
+@pytest.mark.asyncio
+@patch("app.core.profiler.save_profile", new_callable=AsyncMock)
+@patch("app.core.profiler.acquire_rate_slot", new_callable=AsyncMock)
+@patch("app.core.profiler.is_superuser_request", new_callable=AsyncMock)
+async def test_profiler_middleware_skips_when_rate_limited(
+    mock_superuser, mock_rate, mock_save
+):
+    mock_superuser.return_value = True
+    mock_rate.return_value = False
+
+    response = await request({"X-Profile": "1"})
+
+    assert response.status_code == 200
+    assert "x-profile-id" not in response.headers
+    mock_save.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("app.core.profiler.is_superuser_request", new_callable=AsyncMock)
+async def test_profiler_middleware_requires_superuser(mock_superuser):
+    mock_superuser.return_value = False
+
+    response = await request({"X-Profile": "1"})
+
+    assert "x-profile-id" not in response.headers
+
+
+@pytest.mark.asyncio
+@patch("app.core.profiler.save_profile", new_callable=AsyncMock)
+@patch("app.core.profiler.acquire_rate_slot", new_callable=AsyncMock)
+@patch("app.core.profiler.is_superuser_request")
+async def test_concurrent_profile_request_falls_through_without_waiting(
+    mock_superuser, mock_rate, mock_save
+):
+    # given: 두 요청이 모두 관리자 확인을 기다리는 중
+    async def superuser(scope):
+        await asyncio.sleep(0)
+        return True
+
+    mock_superuser.side_effect = superuser
+    mock_rate.return_value = True
+    release = asyncio.Event()
+
+    app = FastAPI()
+    app.add_middleware(ProfilerMiddleware)
+
+    @app.get("/slow/")
+    async def slow():
+        await release.wait()
+        return {}
+
+    @app.get("/fast/")
+    async def fast():
+        return {}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        # when
+        first = asyncio.create_task(c.get("/slow/", headers={"X-Profile": "1"}))
+        second = await asyncio.wait_for(
+            c.get("/fast/", headers={"X-Profile": "1"}), timeout=1
+        )
+        release.set()
+        first = await first
+
+    # then: 두 번째 요청은 기다리지 않고 프로파일 없이 처리되고 호출 제한 슬롯도 쓰지 않는다
+    assert "x-profile-id" in first.headers
+    assert "x-profile-id" not in second.headers
+    mock_rate.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("app.core.profiler.get_current_user", new_callable=AsyncMock)
+async def test_superuser_check_fails_closed_on_db_error(mock_current_user):
+    mock_current_user.side_effect = ConnectionError("db down")
+    scope = {"type": "http", "headers": [(b"authorization", b"Bearer x")]}
+
+    assert await is_superuser_request(scope) is False
+
+
+@pytest.mark.asyncio
+@patch(
+    "app.domain.admin.services.monitoring_services.get_profile",
+    new_callable=AsyncMock,
+)
+async def test_get_profile_service_not_found(mock_get_profile):
+    mock_get_profile.return_value = None
+
+    with pytest.raises(ProfileNotFoundException):
+        await get_profile_service(DummyUser(1, "admin"), "0" * 32)
@@ -0,0 +1,68 @@
+import logging
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.query_trace import (
+    QueryTrace,
+    TracedQuery,
+    normalize_sql,
+    report,
+    should_trace,
+)
+
+
+def test_normalize_sql_groups_same_shape():
+    a = normalize_sql("SELECT * FROM comments WHERE id IN ($1,$2,$3) AND x = 'a'")
+    b = normalize_sql("SELECT  *  FROM comments WHERE id IN ($1) AND x = 'bb'")
+
+    assert a == b == "SELECT * FROM comments WHERE id IN (?) AND x = ?"
+
+
+def test_should_trace_with_token():
+    with patch("app.core.query_trace.settings") as mock_settings:
+        mock_settings.QUERY_TRACE_TOKEN = "secret"
+        mock_settings.QUERY_TRACE_SAMPLE_RATE = 0.0
+
+        assert should_trace("secret") is True
+        assert should_trace("wrong") is False
+        assert should_trace(None) is False
+
+
+@pytest.mark.asyncio
+@patch("app.core.query_trace.explain", new_callable=AsyncMock)
+async def test_report_flags_n_plus_one(mock_explain, caplog):
+    # given
+    trace = QueryTrace(path="GET /api/applicants/")
+    for i in range(5):
+        trace.queries.append(
+            TracedQuery(
+                sql=f'SELECT * FROM "resumes" WHERE "id"={i}',
+                values=None,
+                elapsed=0.001,
+                call_site="app/domain/applicant/services.py:10 format",
+            )
+        )
+
+    # when
+    with caplog.at_level(logging.WARNING, logger="app.core.query_trace"):
+        await report(trace)
+
+    # then
+    mock_explain.assert_not_called()
+    assert "N+1 의심" in caplog.text
+    assert "x5" in caplog.text
+
+
+@pytest.mark.asyncio
+@patch("app.core.query_trace.explain", new_callable=AsyncMock)
+async def test_report_explains_slow_query(mock_explain, caplog):
+    mock_explain.return_value = "Seq Scan on job_postings"
+    trace = QueryTrace(path="GET /api/postings/")
+    trace.queries.append(TracedQuery("SELECT 1", None, 10.0, "unknown"))
+
+    with caplog.at_level(logging.WARNING, logger="app.core.query_trace"):
+        await report(trace)
+
+    mock_explain.assert_awaited_once()
+    assert "Seq Scan on job_postings" in caplog.text
@@ -0,0 +1,144 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from starlette.requests import Request
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
+
+from app.core.rate_limit import (
+    RateLimit,
+    check_rate_limit,
+    client_ip,
+    limit_by_ip,
+    limit_by_user_or_ip,
+    refund_rate_limit,
+)
+from app.exceptions.request_exceptions import TooManyRequestsException
+
+LIMIT = RateLimit("test", capacity=5, period=300)
+
+
+def redis_returning(result):
+    script = AsyncMock(return_value=result)
+    redis = MagicMock()
+    redis.register_script.return_value = script
+    return redis, script
+
+
+@pytest.mark.asyncio
+async def test_limited_request_raises_429_with_retry_after():
+    # given
+    redis, script = redis_returning([0, 59001])
+
+    with patch("app.core.rate_limit.settings.RATE_LIMIT_ENABLED", True), patch(
+        "app.core.rate_limit.get_redis", return_value=redis
+    ):
+        # when
+        with pytest.raises(TooManyRequestsException) as exc:
+            await check_rate_limit(LIMIT, "a@test.com")
+
+    # then
+    assert exc.value.status_code == 429
+    assert exc.value.headers == {"Retry-After": "60"}
+    script.assert_awaited_once_with(
+        keys=["rate_limit:test:a@test.com"], args=[5, 300000, 1]
+    )
+
+
+@pytest.mark.asyncio
+async def test_allowed_request_passes():
+    redis, script = redis_returning([1, 0])
+
+    with patch("app.core.rate_limit.settings.RATE_LIMIT_ENABLED", True), patch(
+        "app.core.rate_limit.get_redis", return_value=redis
+    ):
+        await check_rate_limit(LIMIT, "a@test.com")
+
+    script.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fails_open_when_redis_is_down():
+    # given
+    redis = MagicMock()
+    redis.register_script.return_value = AsyncMock(
+        side_effect=ConnectionError("redis down")
+    )
+
+    with patch("app.core.rate_limit.settings.RATE_LIMIT_ENABLED", True), patch(
+        "app.core.rate_limit.get_redis", return_value=redis
+    ):
+        # when / then (예외 없이 통과)
+        await check_rate_limit(LIMIT, "a@test.com")
+
+
+@pytest.mark.asyncio
+async def test_refund_returns_token_with_negative_cost():
+    redis, script = redis_returning([1, 0])
+
+    with patch("app.core.rate_limit.settings.RATE_LIMIT_ENABLED", True), patch(
+        "app.core.rate_limit.get_redis", return_value=redis
+    ):
+        await refund_rate_limit(LIMIT, "a@test.com")
+
+    script.assert_awaited_once_with(
+        keys=["rate_limit:test:a@test.com"], args=[5, 300000, -1]
+    )
+
+
+def test_resolve_uses_settings_override():
+    with patch("app.core.rate_limit.settings.RATE_LIMITS", {"test": "50/60"}):
+        assert LIMIT.resolve() == (50, 60)
+    with patch("app.core.rate_limit.settings.RATE_LIMITS", {}):
+        assert LIMIT.resolve() == (5, 300)
+
+
+@pytest.mark.asyncio
+async def test_dependency_keys_and_when_condition():
+    # given
+    request = MagicMock()
+    request.client.host = "10.0.0.1"
+    request.headers = {}
+    request.query_params = {}
+    user = MagicMock(id=7)
+
+    with patch("app.core.rate_limit.check_rate_limit", new=AsyncMock()) as check:
+        # when
+        await limit_by_ip(LIMIT)(request)
+        await limit_by_user_or_ip(LIMIT)(request, user)
+        await limit_by_user_or_ip(LIMIT)(request, None)
+        await limit_by_user_or_ip(
+            LIMIT, when=lambda r: bool(r.query_params.get("search_keyword"))
+        )(request, user)
+
+    # then
+    assert [c.args[1] for c in check.await_args_list] == [
+        "10.0.0.1",
+        "user:7",
+        "ip:10.0.0.1",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_forged_forwarded_for_does_not_change_bucket_key():
+    # given: nginx 가 X-Real-IP 를 실제 접속 주소로 덮어쓰고, X-Forwarded-For 는 클라이언트 값 뒤에 붙인다
+    keys = []
+
+    async def app(scope, receive, send):
+        keys.append(client_ip(Request(scope)))
+
+    middleware = ProxyHeadersMiddleware(app, trusted_hosts="*")
+
+    # when: 요청마다 X-Forwarded-For 맨 앞 값을 바꿔 보낸다
+    for forged in ("1.1.1.1", "2.2.2.2"):
+        scope = {
+            "type": "http",
+            "client": ("172.18.0.5", 40000),
+            "headers": [
+                (b"x-forwarded-for", f"{forged}, 203.0.113.7".encode()),
+                (b"x-real-ip", b"203.0.113.7"),
+            ],
+        }
+        await middleware(scope, None, None)
+
+    # then
+    assert keys == ["203.0.113.7", "203.0.113.7"]
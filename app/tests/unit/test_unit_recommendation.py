@@ -0,0 +1,123 @@
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.domain.posting.services import get_recommended_postings_service
+from app.domain.services.recommendation import PostingIndex, Recommender, seeker_vector
+from app.exceptions.search_exceptions import InvalidLimitException
+from app.exceptions.user_exceptions import UserNotFoundException
+
+ROWS = [
+    (1, "요양보호사 모집", "요양보호사", "서울특별시 강남구"),
+    (2, "아파트 경비원 채용", "경비", "서울특별시 송파구"),
+    (3, "주간보호센터 요양보호사", "요양보호사", "부산광역시 해운대구"),
+    (4, "사무실 청소", "청소", "서울특별시 강남구"),
+]
+
+
+def test_top_k_ranks_by_position_and_location():
+    # given
+    index = PostingIndex.build(ROWS)
+    query = seeker_vector(index, ["요양보호사"], ["서울특별시 강남구"], [])
+
+    # when
+    ranked = index.top_k(query, k=3, exclude=set())
+
+    # then: 포지션과 지역이 모두 맞는 공고가 먼저
+    assert [id for id, _ in ranked] == [1, 3, 4]
+    assert ranked[0][1] > ranked[1][1] > ranked[2][1] > 0
+
+
+def test_apply_changes_replaces_and_removes_postings():
+    # given
+    index = PostingIndex.build(ROWS)
+    query = seeker_vector(index, ["요양보호사"], [], [])
+
+    # when: 1번은 모집 종료(rows 에 없음), 2번은 요양보호사 공고로 수정, 5번은 새 공고
+    index.apply_changes(
+        [1, 2, 5],
+        [
+            (2, "요양보호사 구인", "요양보호사", "서울특별시 송파구"),
+            (5, "방문 요양보호사", "요양보호사", "대구광역시 중구"),
+        ],
+    )
+    ranked = [id for id, _ in index.top_k(query, k=10, exclude=set())]
+
+    # then
+    assert 1 not in ranked
+    assert set(ranked) == {2, 3, 5}
+
+
+def test_bookmarked_postings_shape_query_and_are_excluded():
+    # given
+    index = PostingIndex.build(ROWS)
+    bookmarks = [ROWS[1]]
+
+    # when
+    query = seeker_vector(index, [], [], bookmarks)
+    ranked = index.top_k(query, k=3, exclude={2})
+
+    # then: 북마크한 경비 공고와 같은 지역(서울)의 공고가 추천되고 북마크는 제외
+    assert 2 not in [id for id, _ in ranked]
+    assert ranked and all(id in (1, 4) for id, _ in ranked)
+
+
+@pytest.mark.asyncio
+async def test_recommender_syncs_posting_changes():
+    # given
+    recommender = Recommender()
+    now = time.time()
+    with patch(
+        "app.domain.services.recommendation.get_active_posting_texts_query",
+        new=AsyncMock(side_effect=[ROWS, [(6, "요양보호사", "요양보호사", "서울")]]),
+    ) as texts, patch(
+        "app.domain.services.posting_changes.get_posting_changes",
+        new=AsyncMock(side_effect=[[(6, now + 1), (1, now + 2)]]),
+    ):
+        # when
+        ranked = await recommender.recommend(["요양보호사"], [], [], k=10)
+
+    # then
+    assert texts.await_args_list[1].args == ([6, 1],)
+    assert {id for id, _ in ranked} == {3, 6}
+    assert recommender._changes.synced_at == now + 2
+
+
+@pytest.mark.asyncio
+async def test_recommended_postings_service_passes_ranked_ids():
+    # given
+    seeker = SimpleNamespace(id=1, interests="요양보호사")
+    with patch(
+        "app.domain.posting.services.get_seeker_user",
+        new=AsyncMock(return_value=seeker),
+    ), patch(
+        "app.domain.posting.services.get_seeker_signals_query",
+        new=AsyncMock(return_value=(["요양보호사"], ["서울"], [], [7])),
+    ), patch(
+        "app.domain.posting.services.recommender.recommend",
+        new=AsyncMock(return_value=[(3, 0.9), (1, 0.5)]),
+    ) as recommend, patch(
+        "app.domain.posting.services.get_recommended_postings_query",
+        new=AsyncMock(),
+    ) as query:
+        # when
+        await get_recommended_postings_service(SimpleNamespace(id=1), limit=5)
+
+    # then
+    assert recommend.await_args.kwargs["exclude"] == [7]
+    assert query.await_args.args[:2] == ([3, 1], [7])
+
+
+@pytest.mark.asyncio
+async def test_recommended_postings_service_validates_limit_and_seeker():
+    with pytest.raises(InvalidLimitException):
+        await get_recommended_postings_service(SimpleNamespace(id=1), limit=0)
+
+    with patch(
+        "app.domain.posting.services.get_seeker_user",
+        new=AsyncMock(return_value=None),
+    ):
+        with pytest.raises(UserNotFoundException):
+            await get_recommended_postings_service(SimpleNamespace(id=1))
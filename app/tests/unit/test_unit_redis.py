@@ -0,0 +1,43 @@
+import importlib.util
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import app.core.redis
+
+
+def load_redis_module():
+    """conftest 가 get_redis 를 세션 내내 mock 으로 바꿔 두므로 원본을 새로 읽는다"""
+    spec = importlib.util.spec_from_file_location(
+        "redis_under_test", app.core.redis.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.asyncio
+async def test_get_redis_reuses_client_per_decode_mode_until_closed():
+    # given
+    redis_module = load_redis_module()
+    created = []
+
+    def make_client(**kwargs):
+        client = MagicMock(aclose=AsyncMock(), kwargs=kwargs)
+        created.append(client)
+        return client
+
+    with patch.object(redis_module.aioredis, "Redis", side_effect=make_client):
+        # when
+        text = redis_module.get_redis()
+        raw = redis_module.get_redis(decode_responses=False)
+
+        # then: 호출마다 새 커넥션 풀을 만들지 않는다
+        assert redis_module.get_redis() is text
+        assert redis_module.get_redis(decode_responses=False) is raw
+        assert [c.kwargs["decode_responses"] for c in created] == [True, False]
+
+        await redis_module.close_redis()
+        text.aclose.assert_awaited_once()
+        raw.aclose.assert_awaited_once()
+        assert redis_module.get_redis() is not text
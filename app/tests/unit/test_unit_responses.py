@@ -0,0 +1,59 @@
+import json
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from app.core.responses import PrevalidatedJSONResponse, encode_json
+
+
+class ItemDTO(BaseModel):
+    id: int
+    title: str
+    created_at: datetime
+    tags: List[str] = []
+    memo: Optional[str] = None
+
+
+class PageDTO(BaseModel):
+    total: int
+    data: List[ItemDTO]
+
+
+def make_item(i: int) -> ItemDTO:
+    return ItemDTO(
+        id=i,
+        title=f"공고 {i}",
+        created_at=datetime(2025, 1, 1, 9, 30, tzinfo=timezone.utc),
+        tags=["경비", "주간"],
+    )
+
+
+def test_encode_json_matches_response_model_encoding():
+    # given
+    page = PageDTO.model_construct(total=2, data=[make_item(1), make_item(2)])
+
+    # when
+    body = PrevalidatedJSONResponse(page).body
+
+    # then
+    assert json.loads(body) == jsonable_encoder(PageDTO.model_validate(page))
+    assert "공고 1".encode() in body
+
+
+def test_encode_json_model_list_bytes_and_plain_values():
+    items = [make_item(1), make_item(2)]
+
+    assert json.loads(encode_json(items)) == jsonable_encoder(items)
+    assert encode_json(b'{"cached":true}') == b'{"cached":true}'
+    assert json.loads(encode_json({"item": items[0], 1: "a"})) == {
+        "item": jsonable_encoder(items[0]),
+        "1": "a",
+    }
+
+
+def test_encode_json_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        encode_json({"value": object()})
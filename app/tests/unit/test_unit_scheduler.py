@@ -0,0 +1,152 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.scheduler import LEADER_KEY, CronSchedule, Job, Scheduler
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.names = []
+
+    def hget(self, key, field):
+        self.names.append((key, field))
+
+    async def execute(self):
+        return [self.redis.hashes.get(k, {}).get(f) for k, f in self.names]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.hashes = {}
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def eval(self, script, numkeys, key, token, *args):
+        if self.data.get(key) != token:
+            return 0
+        if "DEL" in script:
+            del self.data[key]
+        return 1
+
+    async def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def test_cron_next_after():
+    daily = CronSchedule("30 4 * * *")
+    assert daily.next_after(datetime(2025, 1, 1, 4, 29, 59)) == datetime(
+        2025, 1, 1, 4, 30
+    )
+    assert daily.next_after(datetime(2025, 1, 1, 4, 30)) == datetime(2025, 1, 2, 4, 30)
+
+    # 매주 월요일 9시, 15분 간격
+    monday = CronSchedule("*/15 9 * * 1")
+    assert monday.next_after(datetime(2025, 1, 1, 12, 0)) == datetime(2025, 1, 6, 9, 0)
+    assert monday.next_after(datetime(2025, 1, 6, 9, 0)) == datetime(2025, 1, 6, 9, 15)
+
+    # 연말 -> 다음 해 1월
+    assert CronSchedule("0 0 1 1 *").next_after(datetime(2025, 3, 1)) == datetime(
+        2026, 1, 1
+    )
+
+
+def test_cron_rejects_invalid_expression():
+    with pytest.raises(ValueError):
+        CronSchedule("* * *")
+    with pytest.raises(ValueError):
+        CronSchedule("61 * * * *")
+
+
+def test_interval_job_resumes_from_last_run():
+    job = Job("test", AsyncMock(), every=600)
+
+    assert job.next_run(None, now=1000.0) == 1000.0
+    assert job.next_run(900.0, now=1000.0) == 1500.0
+
+
+def test_cron_job_runs_immediately_only_if_never_run():
+    now = datetime(2025, 1, 1, 12, 0).timestamp()
+    backfill = Job(
+        "test", AsyncMock(), cron=CronSchedule("30 4 * * *"), run_if_never_run=True
+    )
+    nightly = Job("test", AsyncMock(), cron=CronSchedule("30 4 * * *"))
+
+    assert backfill.next_run(None, now=now) == now
+    assert backfill.next_run(now, now=now) == datetime(2025, 1, 2, 4, 30).timestamp()
+    assert nightly.next_run(None, now=now) == datetime(2025, 1, 2, 4, 30).timestamp()
+
+
+@pytest.mark.asyncio
+async def test_only_one_worker_becomes_leader_and_runs_jobs():
+    # given
+    redis = FakeRedis()
+    func = AsyncMock()
+    workers = [Scheduler(leader_ttl=30) for _ in range(4)]
+    for worker in workers:
+        worker.add_job("job", func, every=600)
+
+    with patch("app.core.scheduler.get_redis", return_value=redis):
+        # when
+        for worker in workers:
+            await worker._elect()
+            if worker.is_leader:
+                worker._dispatch(now=10**10)
+        await asyncio.gather(*(t for w in workers for t in w._running.values()))
+
+    # then
+    assert [w.is_leader for w in workers] == [True, False, False, False]
+    func.assert_awaited_once()
+    assert redis.hashes["scheduler:job:job"]["outcome"] == "success"
+
+
+@pytest.mark.asyncio
+async def test_leader_steps_down_when_lock_is_taken():
+    # given
+    redis = FakeRedis()
+    scheduler = Scheduler(leader_ttl=30)
+    scheduler.add_job("job", AsyncMock(), every=600)
+
+    with patch("app.core.scheduler.get_redis", return_value=redis):
+        await scheduler._elect()
+        assert scheduler.is_leader
+
+        # when: 락이 만료되어 다른 워커가 잡았다
+        redis.data[LEADER_KEY] = "other"
+        scheduler._renewed_at -= 30
+        await scheduler._elect()
+
+    # then
+    assert not scheduler.is_leader
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_recorded_and_rescheduled():
+    # given
+    redis = FakeRedis()
+    scheduler = Scheduler(leader_ttl=30)
+    scheduler.add_job("job", AsyncMock(side_effect=RuntimeError("boom")), every=600)
+
+    with patch("app.core.scheduler.get_redis", return_value=redis):
+        await scheduler._elect()
+
+        # when
+        await scheduler._execute(scheduler.jobs["job"])
+
+    # then
+    record = redis.hashes["scheduler:job:job"]
+    assert record["outcome"] == "error"
+    assert "boom" in record["error"]
+    assert scheduler._next_runs["job"] == pytest.approx(float(record["last_run"]) + 600)
+    assert "job" not in scheduler._running
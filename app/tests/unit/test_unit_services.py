@@ -1,6 +1,17 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
 from app.domain.services.permission import check_author
+from app.domain.services.popularity import (
+    EVENT_WEIGHTS,
+    HALF_LIFE_SECONDS,
+    RESTORE_RETRY_SECONDS,
+    decay_factor,
+    decay_popularity,
+    get_top_ids,
+    record_event,
+)
 from app.domain.services.verification import check_existing, check_superuser
 from app.exceptions.auth_exceptions import PermissionDeniedException
 from app.exceptions.base_exceptions import CustomException
@@ -72,3 +83,106 @@ async def test_check_author_superuser():
     user = DummyUser(id=99, user_type="normal,admin")
 
     assert await check_author(obj, user) is None
+
+
+def test_decay_factor_half_life():
+    assert decay_factor(0) == 1
+    assert decay_factor(HALF_LIFE_SECONDS) == pytest.approx(0.5)
+    assert decay_factor(-10) == 1
+
+
+@pytest.mark.asyncio
+async def test_record_event():
+    redis = MagicMock()
+    redis.zincrby = AsyncMock()
+
+    with patch("app.domain.services.popularity.get_redis", return_value=redis):
+        await record_event("free_board", 1, "comment")
+
+    redis.zincrby.assert_awaited_once_with(
+        "popular:free_board", EVENT_WEIGHTS["comment"], 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_record_event_redis_error_is_ignored():
+    redis = MagicMock()
+    redis.zincrby = AsyncMock(side_effect=ConnectionError("redis down"))
+
+    with patch("app.domain.services.popularity.get_redis", return_value=redis):
+        await record_event("free_board", 1, "view")
+
+
+@pytest.mark.asyncio
+@patch("app.domain.services.popularity._snapshot_rows", new_callable=AsyncMock)
+async def test_get_top_ids_falls_back_to_snapshot(mock_snapshot_rows):
+    # given
+    redis = MagicMock()
+    redis.zrevrange = AsyncMock(side_effect=ConnectionError("redis down"))
+    mock_snapshot_rows.return_value = [{"id": 3, "popularity_score": 2.0}]
+
+    # when
+    with patch("app.domain.services.popularity.get_redis", return_value=redis):
+        result = await get_top_ids("free_board", 10)
+
+    # then
+    assert result == [3]
+
+
+@pytest.mark.asyncio
+@patch("app.domain.services.popularity.restore_popularity", new_callable=AsyncMock)
+async def test_get_top_ids_restores_empty_ranking_once_per_interval(mock_restore):
+    # given: 랭킹도 스냅샷도 비어 있음
+    markers = set()
+
+    async def set_nx(key, value, nx=False, ex=None):
+        if key in markers:
+            return None
+        markers.add(key)
+        return True
+
+    redis = MagicMock()
+    redis.zrevrange = AsyncMock(return_value=[])
+    redis.set = AsyncMock(side_effect=set_nx)
+    mock_restore.return_value = 0
+
+    # when
+    with patch("app.domain.services.popularity.get_redis", return_value=redis):
+        assert await get_top_ids("free_board", 10) == []
+        assert await get_top_ids("free_board", 10) == []
+
+    # then
+    mock_restore.assert_awaited_once_with("free_board")
+    assert redis.set.await_args.kwargs == {"nx": True, "ex": RESTORE_RETRY_SECONDS}
+
+
+@pytest.mark.asyncio
+async def test_decay_popularity():
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis = MagicMock()
+    redis.get = AsyncMock(return_value=str(1000.0))
+    redis.set = AsyncMock()
+    redis.pipeline.return_value = pipe
+
+    with patch("app.domain.services.popularity.get_redis", return_value=redis):
+        await decay_popularity("free_board", now=1000.0 + HALF_LIFE_SECONDS)
+
+    pipe.zunionstore.assert_called_once_with(
+        "popular:free_board", {"popular:free_board": pytest.approx(0.5)}
+    )
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("app.domain.services.popularity.restore_popularity", new_callable=AsyncMock)
+async def test_decay_popularity_first_run_restores_snapshot(mock_restore):
+    redis = MagicMock()
+    redis.get = AsyncMock(return_value=None)
+    redis.set = AsyncMock()
+
+    with patch("app.domain.services.popularity.get_redis", return_value=redis):
+        await decay_popularity("free_board", now=1000.0)
+
+    mock_restore.assert_awaited_once_with("free_board")
+    redis.pipeline.assert_not_called()
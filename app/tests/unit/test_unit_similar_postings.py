@@ -0,0 +1,135 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.domain.services.similar_postings import (
+    KEY_TTL_SECONDS,
+    SimilarPostings,
+    get_similar_posting_ids,
+    position_blocks,
+)
+
+ROWS = [
+    (1, "요양보호사 모집", "요양보호사", "서울특별시 강남구", "일반", "경력무관"),
+    (2, "요양보호사 채용", "요양보호사", "서울특별시 강남구", "일반", "경력무관"),
+    (3, "주간보호센터 요양보호사", "요양보호사", "부산광역시 해운대구", "공공", "신입"),
+    (4, "아파트 경비원", "경비", "서울특별시 강남구", "일반", "경력무관"),
+    (5, "경비원 채용", "경비", "서울특별시 송파구", "일반", "경력무관"),
+]
+
+
+def build(rows=ROWS, k=2) -> SimilarPostings:
+    similar = SimilarPostings(k=k)
+    similar.index, similar.neighbor_ids, similar.neighbor_scores = similar._compute(
+        rows
+    )
+    similar.slot_ids = similar.index.ids.copy()
+    similar.slot_of = dict(similar.index.row_of)
+    return similar
+
+
+def test_position_blocks():
+    assert position_blocks("요양보호사, 경비/청소 ") == ["요양보호사", "경비", "청소"]
+    assert position_blocks(None) == []
+
+
+def test_neighbors_are_ranked_within_same_position():
+    # when
+    similar = build()
+
+    # then: 같은 포지션끼리만, 지역까지 같은 공고가 먼저
+    assert similar.neighbors(1) == [2, 3]
+    assert sorted(similar.neighbors(3)) == [1, 2]
+    assert similar.neighbors(4) == [5]
+
+
+def test_apply_changes_removes_closed_and_inserts_new_posting():
+    # given
+    similar = build()
+
+    # when: 2번 모집 종료, 6번 새 공고 (1번과 거의 같은 내용)
+    touched = similar.apply_changes(
+        [2, 6], [(6, "요양보호사 모집", "요양보호사", "서울특별시 강남구", "일반", "경력무관")]
+    )
+
+    # then
+    assert similar.neighbors(2) == []
+    assert similar.neighbors(6)[0] == 1
+    assert similar.neighbors(1) == [6, 3]
+    assert 2 not in similar.neighbors(3)
+    assert {similar.slot_of[1], similar.slot_of[3], similar.slot_of[6]} <= touched
+
+
+@pytest.mark.asyncio
+async def test_get_similar_posting_ids_fails_open():
+    class BrokenRedis:
+        async def lrange(self, *args):
+            raise ConnectionError("down")
+
+    with patch(
+        "app.domain.services.similar_postings.get_redis", return_value=BrokenRedis()
+    ):
+        assert await get_similar_posting_ids(1) == []
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def delete(self, key):
+        self.redis.lists.pop(key, None)
+
+    def rpush(self, key, *values):
+        self.redis.lists.setdefault(key, []).extend(values)
+
+    def expire(self, key, seconds):
+        self.redis.expires.append((key, seconds))
+
+    async def execute(self):
+        return []
+
+
+class FakeRedis:
+    def __init__(self):
+        self.lists = {}
+        self.expires = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.lists.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_rebuild_refreshes_ttl_of_unchanged_lists():
+    # given
+    redis = FakeRedis()
+    similar = SimilarPostings(k=2)
+    with patch(
+        "app.domain.services.similar_postings.get_redis", return_value=redis
+    ), patch(
+        "app.domain.services.similar_postings.get_active_posting_texts_query",
+        new=AsyncMock(return_value=ROWS),
+    ), patch(
+        "app.domain.services.similar_postings.invalidate_validator", new=AsyncMock()
+    ):
+        await similar.rebuild()
+        redis.expires.clear()
+
+        # when: 이웃이 바뀌지 않은 채 다시 전체 계산
+        written = await similar.rebuild()
+
+    # then: 다시 쓰지는 않지만 모든 목록의 만료 시간을 늘린다
+    assert written == 0
+    assert sorted(redis.expires) == sorted(
+        (f"posting:similar:{row[0]}", KEY_TTL_SECONDS) for row in ROWS
+    )
+    assert redis.lists["posting:similar:1"] == [2, 3]
@@ -0,0 +1,168 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.single_flight import SingleFlight, request_key, single_flight
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, *keys):
+        return [self.data.get(k) for k in keys]
+
+    async def eval(self, script, numkeys, key, token):
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+
+def slow(result, delay=0.02):
+    async def run():
+        await asyncio.sleep(delay)
+        return result
+
+    return AsyncMock(side_effect=run)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    # given
+    flight = SingleFlight("test")
+    fn = slow({"total": 3})
+
+    # when
+    results = await asyncio.gather(*(flight.do("k", fn) for _ in range(10)))
+    again = await flight.do("k", fn)
+
+    # then
+    assert fn.await_count == 2  # 끝난 뒤의 호출은 새로 실행
+    assert all(r is results[0] for r in results)
+    assert again == {"total": 3}
+
+
+@pytest.mark.asyncio
+async def test_followers_receive_leader_exception():
+    # given
+    flight = SingleFlight("test")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    fn = AsyncMock(side_effect=fail)
+
+    # when
+    results = await asyncio.gather(
+        *(flight.do("k", fn) for _ in range(3)), return_exceptions=True
+    )
+
+    # then
+    assert fn.await_count == 1
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_distributed_follower_takes_result_from_other_worker():
+    # given
+    redis = FakeRedis()
+    worker_a = SingleFlight("test", distributed=True)
+    worker_b = SingleFlight("test", distributed=True)
+    fn_a, fn_b = slow(b'{"id":1}', 0.05), slow(b"unused")
+
+    with patch(
+        "app.core.single_flight.settings.SINGLE_FLIGHT_DISTRIBUTED", True
+    ), patch("app.core.single_flight.get_redis", return_value=redis):
+        # when
+        leader = asyncio.create_task(worker_a.do("k", fn_a))
+        await asyncio.sleep(0.01)
+        remote = await worker_b.do("k", fn_b)
+        await leader
+
+    # then
+    assert remote == b'{"id":1}'
+    fn_b.assert_not_awaited()
+    assert not any(k.endswith(":lock:test:k") for k in redis.data)  # 락 해제
+
+
+@pytest.mark.asyncio
+async def test_distributed_runs_locally_when_redis_is_down():
+    # given
+    redis = MagicMock()
+    redis.set = AsyncMock(side_effect=ConnectionError("redis down"))
+    flight = SingleFlight("test", distributed=True)
+    fn = AsyncMock(return_value=[1, 2])
+
+    with patch(
+        "app.core.single_flight.settings.SINGLE_FLIGHT_DISTRIBUTED", True
+    ), patch("app.core.single_flight.get_redis", return_value=redis):
+        # when
+        result = await flight.do("k", fn)
+
+    # then
+    assert result == [1, 2]
+    fn.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_decorator_key_ignores_unrelated_arguments():
+    # given
+    calls = []
+
+    @single_flight("test", key=lambda limit, current_user: str(limit))
+    async def popular(limit, current_user):
+        calls.append(current_user)
+        await asyncio.sleep(0.01)
+        return list(range(limit))
+
+    # when
+    results = await asyncio.gather(popular(3, "a"), popular(3, "b"), popular(5, "a"))
+
+    # then
+    assert len(calls) == 2
+    assert results[0] == results[1] == [0, 1, 2]
+
+
+def test_request_key_normalizes_query_order_and_user():
+    request = MagicMock()
+    request.url.path = "/api/postings/"
+    request.query_params.multi_items.return_value = [
+        ("limit", "10"),
+        ("location", "서울"),
+    ]
+    user = MagicMock(id=7)
+
+    assert request_key(request) == "/api/postings/?limit=10&location=서울|anon"
+    assert request_key(request, user).endswith("|7")
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_followers():
+    # given
+    flight = SingleFlight("test")
+    fn = slow({"total": 3}, delay=0.05)
+    leader = asyncio.create_task(flight.do("k", fn))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("k", fn))
+    await asyncio.sleep(0.01)
+
+    # when: 먼저 온 요청의 연결이 끊겼다
+    leader.cancel()
+
+    # then
+    assert await follower == {"total": 3}
+    assert leader.cancelled()
+    assert fn.await_count == 1
+    assert "k" not in flight._calls
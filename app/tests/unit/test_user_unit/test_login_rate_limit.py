@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.rate_limit import LOGIN_FAILURES_PER_IP_EMAIL
+from app.domain.user.services.auth_services import login_user
+from app.exceptions.user_exceptions import PasswordInvalidException
+
+SERVICE = "app.domain.user.services.auth_services"
+
+
+def active_user():
+    return SimpleNamespace(
+        id=1,
+        email="a@test.com",
+        password="hashed",
+        email_verified=True,
+        status="active",
+        user_type="normal",
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_password_keeps_ip_email_bucket_charged():
+    # given
+    with patch(
+        f"{SERVICE}.BaseUser.get_or_none", new=AsyncMock(return_value=active_user())
+    ), patch(f"{SERVICE}.bcrypt.verify", return_value=False), patch(
+        f"{SERVICE}.check_rate_limit", new=AsyncMock()
+    ) as check, patch(
+        f"{SERVICE}.refund_rate_limit", new=AsyncMock()
+    ) as refund:
+        # when
+        with pytest.raises(PasswordInvalidException):
+            await login_user("a@test.com", "wrong", ip="203.0.113.7")
+
+    # then: 같은 IP 에서 같은 계정으로 실패한 횟수만 센다
+    check.assert_awaited_once_with(
+        LOGIN_FAILURES_PER_IP_EMAIL, "203.0.113.7:a@test.com"
+    )
+    refund.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_successful_login_refunds_ip_email_bucket():
+    # given
+    redis = MagicMock()
+    redis.set = AsyncMock()
+    with patch(
+        f"{SERVICE}.BaseUser.get_or_none", new=AsyncMock(return_value=active_user())
+    ), patch(f"{SERVICE}.bcrypt.verify", return_value=True), patch(
+        f"{SERVICE}.check_rate_limit", new=AsyncMock()
+    ), patch(
+        f"{SERVICE}.refund_rate_limit", new=AsyncMock()
+    ) as refund, patch(
+        f"{SERVICE}.get_redis", return_value=redis
+    ), patch(
+        f"{SERVICE}.SeekerUser.get_or_none", new=AsyncMock(return_value=None)
+    ):
+        # when
+        await login_user("a@test.com", "right", ip="203.0.113.7")
+
+    # then
+    refund.assert_awaited_once_with(
+        LOGIN_FAILURES_PER_IP_EMAIL, "203.0.113.7:a@test.com"
+    )
@@ -0,0 +1,91 @@
+"""
+목록 응답의 필드 선택 (`fields=` 쿼리 파라미터).
+
+`fields=card` 같은 프리셋 이름이나 `fields=id,title,deadline` 같은 필드 목록을 받아
+응답 스키마의 부분집합을 만든다. 저장소는 선택된 필드로 SELECT 컬럼을 좁히고(.values()),
+서비스는 같은 부분 스키마로 검증하므로 DB I/O, 메모리, 응답 크기가 함께 줄어든다.
+부분 스키마는 응답 스키마와 모양이 달라 라우터에서는 PrevalidatedJSONResponse 로 반환한다.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+
+from app.exceptions.search_exceptions import InvalidFieldsException
+
+FULL = "full"
+
+
+@lru_cache(maxsize=None)
+def partial_schema(schema: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    schema 에서 fields 만 남긴 모델. 필드 타입/기본값은 그대로 옮기고
+    필드 검증기/직렬화기는 옮기지 않는다 (DB 에서 읽은 값은 이미 저장 형식이므로).
+    """
+    if len(fields) == len(schema.model_fields):
+        return schema
+    definitions = {
+        name: (schema.model_fields[name].annotation, schema.model_fields[name])
+        for name in fields
+    }
+    return create_model(
+        f"{schema.__name__}Partial",
+        __config__=ConfigDict(from_attributes=True),
+        **definitions,
+    )
+
+
+@lru_cache(maxsize=None)
+def partial_page_schema(
+    page: Type[BaseModel], schema: Type[BaseModel], fields: Tuple[str, ...]
+) -> Type[BaseModel]:
+    """`data: List[schema]` 를 가진 페이지 래퍼의 data 항목만 부분 스키마로 바꾼 하위 모델"""
+    item = partial_schema(schema, fields)
+    if item is schema:
+        return page
+    return create_model(
+        f"{page.__name__}Partial", __base__=page, data=(List[item], ...)
+    )
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+@dataclass(frozen=True)
+class FieldSet:
+    schema: Type[BaseModel]
+    presets: Dict[str, Tuple[str, ...]]
+    required: Tuple[str, ...] = ("id",)
+
+    @property
+    def description(self) -> str:
+        presets = ", ".join([FULL, *self.presets])
+        return f"응답 필드: 프리셋({presets}) 또는 쉼표로 구분한 필드명 (기본 {FULL})"
+
+    def resolve(self, fields: Optional[str]) -> Tuple[str, ...]:
+        """프리셋/필드명 목록을 스키마 필드 순서의 튜플로 정리"""
+        selected = set(self.required)
+        for token in (fields or FULL).split(","):
+            token = token.strip()
+            if not token:
+                continue
+            if token == FULL:
+                return tuple(self.schema.model_fields)
+            if token in self.presets:
+                selected.update(self.presets[token])
+            elif token in self.schema.model_fields:
+                selected.add(token)
+            else:
+                raise InvalidFieldsException(token)
+        return tuple(name for name in self.schema.model_fields if name in selected)
+
+    def validate_rows(
+        self, fields: Tuple[str, ...], rows: Iterable[Dict[str, Any]]
+    ) -> List[BaseModel]:
+        return _list_adapter(partial_schema(self.schema, fields)).validate_python(
+            list(rows)
+        )
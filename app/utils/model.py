@@ -1,4 +1,5 @@
 from tortoise import fields, models
+from tortoise.contrib.postgres.indexes import GinIndex
 
 
 class TimestampMixin(models.Model):
@@ -7,3 +8,26 @@ class TimestampMixin(models.Model):
 
     class Meta:
         abstract = True
+
+
+class TrigramIndex(GinIndex):
+    """
+    pg_trgm GIN 인덱스 - `icontains`(ILIKE '%검색어%') 검색을 인덱스로 처리
+    pg_trgm 확장을 설치할 수 없는 DB 에서는 인덱스 생성을 건너뛴다.
+    """
+
+    def get_sql(self, schema_generator, model, safe: bool) -> str:
+        fields = ", ".join(
+            f"{schema_generator.quote(f)} gin_trgm_ops" for f in self.field_names
+        )
+        exists = "IF NOT EXISTS " if safe else ""
+        return (
+            "DO $$ BEGIN "
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm; "
+            f'CREATE INDEX {exists}"{self.index_name(schema_generator, model)}" '
+            f'ON "{model._meta.db_table}" USING GIN ({fields}); '
+            "EXCEPTION WHEN feature_not_supported OR undefined_file "
+            "OR insufficient_privilege THEN "
+            "RAISE NOTICE 'pg_trgm unavailable, skip trigram index'; "
+            "END $$;"
+        )
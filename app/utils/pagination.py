@@ -0,0 +1,30 @@
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+
+from tortoise.expressions import Q
+
+from app.exceptions.search_exceptions import InvalidCursorException
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """(created_at, id) 키셋 커서를 불투명한 문자열로 인코딩"""
+    raw = f"{created_at.isoformat()}|{id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(id)
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidCursorException()
+
+
+def keyset_before(cursor: Optional[str]) -> Q:
+    """`-created_at, -id` 정렬 기준으로 커서 이후(더 오래된) 행 조건"""
+    if not cursor:
+        return Q()
+    created_at, id = decode_cursor(cursor)
+    return Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=id)
@@ -0,0 +1,546 @@
+"""
+대용량 합성 데이터 생성기.
+
+    python -m benchmarks.datagen --postings 1000000
+
+한글 제목/지역과 운영 데이터에 가까운 enum 비율, 인기 공고/열성 사용자 쏠림(Zipf)을 흉내 낸다.
+id 를 직접 매겨 FK 를 재조회 없이 연결하고 asyncpg COPY 로 적재하므로,
+대상 테이블을 비우고(TRUNCATE) 시작한 뒤 마지막에 시퀀스를 맞춘다.
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import asyncpg
+from passlib.hash import bcrypt
+from tortoise import Tortoise
+
+from benchmarks.env import apply_bench_env
+
+BENCH_PASSWORD = "Bench1234!"
+# EmailStr 검증을 통과해야 하므로 .local 같은 예약 도메인은 쓰지 않는다
+EMAIL_DOMAIN = "bench.senior-tomorrow.kr"
+
+# 운영 데이터 비율에 맞춘 가중치
+POSTING_STATUS_WEIGHTS = {
+    "모집중": 55,
+    "마감 임박": 10,
+    "모집 종료": 30,
+    "블라인드": 1,
+    "대기중": 3,
+    "반려됨": 1,
+}
+CAREER_WEIGHTS = {"경력무관": 60, "신입": 25, "경력직": 15}
+METHOD_WEIGHTS = {"계약직": 35, "정규직": 30, "일용직": 15, "파견직": 15, "프리랜서": 5}
+EMPLOYMENT_WEIGHTS = {"일반": 70, "공공": 30}
+RESUME_STATUS_WEIGHTS = {"구직중": 60, "작성중": 25, "완료": 15}
+SEEKER_STATUS_WEIGHTS = {"seeking": 70, "employed": 20, "not_seeking": 10}
+SIGNIN_WEIGHTS = {"email": 70, "kakao": 20, "naver": 10}
+EDUCATION_WEIGHTS = {"학력무관": 70, "고졸": 20, "대졸": 10}
+
+# 시도 -> (인구 비중, 시군구)
+REGIONS = {
+    "서울특별시": (19, ["강남구", "서초구", "송파구", "마포구", "노원구", "은평구", "관악구"]),
+    "경기도": (26, ["수원시", "성남시", "고양시", "용인시", "부천시", "안산시"]),
+    "부산광역시": (7, ["해운대구", "부산진구", "사하구", "동래구"]),
+    "인천광역시": (6, ["남동구", "부평구", "미추홀구"]),
+    "대구광역시": (5, ["수성구", "달서구", "북구"]),
+    "광주광역시": (3, ["북구", "서구", "광산구"]),
+    "대전광역시": (3, ["유성구", "서구", "중구"]),
+    "경상남도": (6, ["창원시", "김해시", "진주시"]),
+    "충청남도": (4, ["천안시", "아산시"]),
+    "전북특별자치도": (3, ["전주시", "익산시"]),
+    "강원특별자치도": (3, ["춘천시", "원주시", "강릉시"]),
+    "제주특별자치도": (1, ["제주시", "서귀포시"]),
+}
+POSITIONS = {
+    "경비원": 20,
+    "미화원": 18,
+    "요양보호사": 15,
+    "조리원": 8,
+    "운전기사": 8,
+    "사무보조": 7,
+    "주차관리원": 6,
+    "택배분류": 6,
+    "매장관리": 5,
+    "시설관리": 4,
+    "배송원": 3,
+}
+WORK_TIMES = ["09:00~18:00", "07:00~16:00", "격일제 24시간", "주 3일 4시간", "06:00~10:00"]
+COMPANY_PREFIXES = ["한빛", "새솔", "푸른", "대한", "우리", "늘봄", "행복", "든든", "온누리", "해오름"]
+COMPANY_SUFFIXES = ["물산", "산업", "케어", "시설관리", "복지센터", "유통", "건설", "푸드", "서비스", "요양원"]
+TITLE_TAGS = ["주5일", "초보가능", "시니어우대", "즉시출근", "장기근무", "4대보험"]
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_SYLLABLES = "민서준영지현수정호성우진희경숙자순옥철미광"
+BOARD_TOPICS = ["면접 후기", "첫 출근 했어요", "이력서 질문", "자격증 공부", "근무 환경 어떤가요", "교육 일정 공유"]
+COMMENT_TEMPLATES = [
+    "좋은 정보 감사합니다.",
+    "저도 같은 고민이에요.",
+    "응원합니다!",
+    "자세히 알려주세요.",
+    "도움이 되었어요.",
+]
+
+
+@dataclass
+class DatasetConfig:
+    postings: int = 10_000
+    corporates: int = 500
+    seekers: int = 5_000
+    resumes_per_seeker: float = 1.2
+    work_exps_per_resume: float = 1.5
+    applicants_per_posting: float = 3.0
+    bookmarks_per_seeker: float = 4.0
+    free_boards: int = 1_000
+    comments_per_free_board: float = 5.0
+    # Zipf 지수 (클수록 일부 공고/사용자/게시글에 쏠림)
+    posting_skew: float = 1.1  # 공고별 지원/북마크 수
+    bookmark_skew: float = 1.2  # 구직자별 북마크 수
+    comment_skew: float = 1.0  # 게시글별 댓글 수
+    days: int = 730  # created_at 분포 기간
+    seed: int = 42
+    batch_size: int = 50_000
+
+    @classmethod
+    def for_postings(cls, postings: int, **overrides) -> "DatasetConfig":
+        """공고 수 기준으로 나머지 규모를 비율대로 맞춘다"""
+        seekers = max(postings // 2, 1)
+        values = {
+            "postings": postings,
+            "corporates": max(postings // 20, 1),
+            "seekers": seekers,
+            "free_boards": max(seekers // 5, 1),
+        }
+        values.update({k: v for k, v in overrides.items() if v is not None})
+        return cls(**values)
+
+
+def weighted(rng: random.Random, weights: Dict[str, int], k: int) -> List[str]:
+    return rng.choices(list(weights), weights=list(weights.values()), k=k)
+
+
+class ZipfSampler:
+    """1..n 중 순위^-s 비율로 뽑는다. 인기 순위는 id 와 무관하게 섞는다"""
+
+    def __init__(self, n: int, s: float, rng: random.Random):
+        ids = list(range(1, n + 1))
+        rng.shuffle(ids)
+        self.ids = ids
+        self.cum_weights = list(
+            itertools.accumulate(1 / (rank**s) for rank in range(1, n + 1))
+        )
+        self.rng = rng
+
+    def sample(self, k: int) -> List[int]:
+        return self.rng.choices(self.ids, cum_weights=self.cum_weights, k=k)
+
+
+class Generator:
+    def __init__(self, config: DatasetConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.now = datetime.now(timezone.utc)
+        self.regions = list(REGIONS)
+        self.region_weights = [weight for weight, _ in REGIONS.values()]
+
+    def created_at(self) -> datetime:
+        # 최근 데이터가 더 많도록 기간 안에서 지수 분포
+        days = min(self.rng.expovariate(3 / self.config.days), self.config.days)
+        return self.now - timedelta(days=days, seconds=self.rng.randint(0, 86399))
+
+    def name(self) -> str:
+        return self.rng.choice(SURNAMES) + "".join(
+            self.rng.choices(GIVEN_SYLLABLES, k=2)
+        )
+
+    def phone(self) -> str:
+        return f"010-{self.rng.randint(1000, 9999)}-{self.rng.randint(1000, 9999)}"
+
+    def location(self) -> Tuple[str, str]:
+        sido = self.rng.choices(self.regions, weights=self.region_weights)[0]
+        return sido, self.rng.choice(REGIONS[sido][1])
+
+    def base_users(self, password: str) -> Iterator[dict]:
+        c, rng = self.config, self.rng
+        yield self._base_user(1, f"admin@{EMAIL_DOMAIN}", "admin", password)
+        for i in range(c.corporates):
+            yield self._base_user(
+                2 + i, f"corp{i}@{EMAIL_DOMAIN}", "business", password
+            )
+        for i in range(c.seekers):
+            user_id = 2 + c.corporates + i
+            yield self._base_user(
+                user_id, f"seeker{i}@{EMAIL_DOMAIN}", "normal", password
+            )
+
+    def _base_user(self, id: int, email: str, user_type: str, password: str) -> dict:
+        return {
+            "id": id,
+            "email": email,
+            "password": password,
+            "user_type": user_type,
+            "signinMethod": weighted(self.rng, SIGNIN_WEIGHTS, 1)[0],
+            "status": "active",
+            "email_verified": True,
+            "gender": self.rng.choice(["male", "female"]),
+            "created_at": self.created_at(),
+        }
+
+    def corporate_users(self) -> Iterator[dict]:
+        rng = self.rng
+        for i in range(self.config.corporates):
+            company = f"{rng.choice(COMPANY_PREFIXES)}{rng.choice(COMPANY_SUFFIXES)}{i}"
+            yield {
+                "id": i + 1,
+                "user_id": 2 + i,
+                "company_name": company,
+                "business_start_date": date(1990, 1, 1)
+                + timedelta(days=rng.randint(0, 12000)),
+                "business_number": f"{1000000000 + i}",
+                "company_description": f"{company}은(는) 시니어 인재를 우대합니다.",
+                "manager_name": self.name(),
+                "manager_phone_number": self.phone(),
+                "manager_email": f"manager{i}@{EMAIL_DOMAIN}",
+            }
+
+    def seeker_users(self) -> Iterator[dict]:
+        c, rng = self.config, self.rng
+        positions = weighted(rng, POSITIONS, c.seekers)
+        statuses = weighted(rng, SEEKER_STATUS_WEIGHTS, c.seekers)
+        for i in range(c.seekers):
+            yield {
+                "id": i + 1,
+                "user_id": 2 + c.corporates + i,
+                "name": self.name(),
+                "phone_number": self.phone(),
+                "birth": date(1945, 1, 1) + timedelta(days=rng.randint(0, 7300)),
+                "interests": positions[i],
+                "status": statuses[i],
+            }
+
+    def job_postings(self, company_names: Sequence[str]) -> Iterator[dict]:
+        c, rng = self.config, self.rng
+        statuses = weighted(rng, POSTING_STATUS_WEIGHTS, c.postings)
+        careers = weighted(rng, CAREER_WEIGHTS, c.postings)
+        methods = weighted(rng, METHOD_WEIGHTS, c.postings)
+        employments = weighted(rng, EMPLOYMENT_WEIGHTS, c.postings)
+        positions = weighted(rng, POSITIONS, c.postings)
+        educations = weighted(rng, EDUCATION_WEIGHTS, c.postings)
+        for i in range(c.postings):
+            corp_id = rng.randint(1, c.corporates)
+            company = company_names[corp_id - 1][:50]
+            sido, sigungu = self.location()
+            position = positions[i]
+            created_at = self.created_at()
+            closed = statuses[i] == "모집 종료"
+            deadline = created_at + timedelta(days=rng.randint(14, 60))
+            if not closed and deadline < self.now:
+                deadline = self.now + timedelta(days=rng.randint(1, 30))
+            yield {
+                "id": i + 1,
+                "user_id": corp_id,
+                "company": company,
+                "title": f"[{sigungu}] {position} 모집 - {rng.choice(TITLE_TAGS)} #{i + 1}",
+                "location": f"{sido} {sigungu}",
+                "employment_type": employments[i],
+                "employ_method": methods[i],
+                "work_time": rng.choice(WORK_TIMES),
+                "position": position,
+                "history": "관련 경력 우대",
+                "recruitment_count": rng.randint(1, 10),
+                "education": educations[i],
+                "deadline": deadline.date().isoformat(),
+                "deadline_date": deadline.date(),
+                "salary": f"월 {rng.randrange(200, 350, 10)}만원",
+                "summary": f"{sigungu} {position}, {rng.choice(TITLE_TAGS)}",
+                "description": f"{company}에서 {position}을(를) 모집합니다. "
+                "성실하고 책임감 있는 분을 기다립니다.",
+                "status": statuses[i],
+                "view_count": int(rng.paretovariate(1.5) * 10),
+                "career": careers[i],
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+    def resumes(self) -> Iterator[Tuple[dict, int]]:
+        """(resume row, seeker_id)"""
+        c, rng = self.config, self.rng
+        resume_id = 0
+        extra = c.resumes_per_seeker - 1
+        for seeker_id in range(1, c.seekers + 1):
+            for _ in range(1 + (rng.random() < extra)):
+                resume_id += 1
+                sido, sigungu = self.location()
+                created_at = self.created_at()
+                yield {
+                    "id": resume_id,
+                    "user_id": seeker_id,
+                    "title": f"{weighted(rng, POSITIONS, 1)[0]} 희망합니다",
+                    "name": self.name(),
+                    "phone_number": self.phone(),
+                    "email": f"seeker{seeker_id - 1}@{EMAIL_DOMAIN}",
+                    "desired_area": f"{sido} {sigungu}",
+                    "education": weighted(rng, EDUCATION_WEIGHTS, 1)[0],
+                    "introduce": "성실하게 일하겠습니다.",
+                    "status": weighted(rng, RESUME_STATUS_WEIGHTS, 1)[0],
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }, seeker_id
+
+    def work_exps(self, resume_count: int) -> Iterator[dict]:
+        rng = self.rng
+        work_exp_id = 0
+        mean = self.config.work_exps_per_resume
+        for resume_id in range(1, resume_count + 1):
+            for _ in range(rng.randint(0, int(mean * 2))):
+                work_exp_id += 1
+                start = rng.randint(1985, 2020)
+                yield {
+                    "id": work_exp_id,
+                    "resume_id": resume_id,
+                    "company": f"{rng.choice(COMPANY_PREFIXES)}{rng.choice(COMPANY_SUFFIXES)}",
+                    "period": f"{start}~{start + rng.randint(1, 10)}",
+                    "position": weighted(rng, POSITIONS, 1)[0],
+                }
+
+    def applicants(
+        self, postings: ZipfSampler, resume_owner: List[int], seeker_user_id
+    ) -> Iterator[dict]:
+        c, rng = self.config, self.rng
+        count = int(c.postings * c.applicants_per_posting)
+        posting_ids = postings.sample(count)
+        for i in range(count):
+            resume_id = rng.randint(1, len(resume_owner))
+            created_at = self.created_at()
+            yield {
+                "id": i + 1,
+                "job_posting_id": posting_ids[i],
+                "resume_id": resume_id,
+                "user_id": seeker_user_id(resume_owner[resume_id - 1]),
+                "status": "지원 취소" if rng.random() < 0.05 else "지원 중",
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+    def bookmarks(self, postings: ZipfSampler) -> Iterator[Tuple[int, int]]:
+        c = self.config
+        count = int(c.seekers * c.bookmarks_per_seeker)
+        seekers = ZipfSampler(c.seekers, c.bookmark_skew, self.rng).sample(count)
+        seen = set()
+        for pair in zip(seekers, postings.sample(count)):
+            if pair not in seen:
+                seen.add(pair)
+                yield pair
+
+    def free_boards(self, comment_counts: Counter, user_count: int) -> Iterator[dict]:
+        rng = self.rng
+        for board_id in range(1, self.config.free_boards + 1):
+            created_at = self.created_at()
+            topic = rng.choice(BOARD_TOPICS)
+            yield {
+                "id": board_id,
+                "user_id": rng.randint(2, user_count),
+                "title": f"{topic} 공유합니다",
+                "content": f"{topic} 관련해서 이야기 나눠요. " * rng.randint(1, 5),
+                "view_count": int(rng.paretovariate(1.5) * 5),
+                "comment_count": comment_counts[board_id],
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+    def comments(self, board_ids: List[int], user_count: int) -> Iterator[dict]:
+        rng = self.rng
+        for i, board_id in enumerate(board_ids):
+            created_at = self.created_at()
+            yield {
+                "id": i + 1,
+                "user_id": rng.randint(2, user_count),
+                "free_board_id": board_id,
+                "content": rng.choice(COMMENT_TEMPLATES),
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+
+def column_defaults(model, columns: List[str], now: datetime) -> dict:
+    """행에 없는 컬럼을 채울 모델 필드 기본값 (auto_now 계열은 적재 시각)"""
+    defaults = {}
+    for name in columns:
+        field = model._meta.fields_map[name]
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+            value = now
+        elif callable(field.default):
+            value = field.default()
+        else:
+            value = field.default
+        defaults[name] = value.value if isinstance(value, Enum) else value
+    return defaults
+
+
+async def copy_rows(
+    table: str, columns: List[str], records: Iterable[tuple], batch_size
+):
+    conn = Tortoise.get_connection("default")
+    start = time.perf_counter()
+    total = 0
+    records = iter(records)
+    async with conn.acquire_connection() as raw:
+        # id 를 직접 맞춰 넣으므로 FK 트리거 검사를 생략 (superuser 가 아니면 검사한 채로 적재)
+        try:
+            await raw.execute("SET session_replication_role = replica")
+        except asyncpg.InsufficientPrivilegeError:
+            pass
+        while batch := list(itertools.islice(records, batch_size)):
+            await raw.copy_records_to_table(table, records=batch, columns=columns)
+            total += len(batch)
+        await raw.execute("RESET session_replication_role")
+    print(f"{table:<22} {total:>10,}건 {time.perf_counter() - start:>7.1f}s")
+    return total
+
+
+async def copy_model(model, rows: Iterable[dict], batch_size: int, now: datetime):
+    columns = list(model._meta.fields_db_projection)
+    defaults = column_defaults(model, columns, now)
+    return await copy_rows(
+        model._meta.db_table,
+        columns,
+        (tuple([row.get(c, defaults[c]) for c in columns]) for row in rows),
+        batch_size,
+    )
+
+
+async def generate(config: DatasetConfig):
+    from app.domain.comment.models import Comment
+    from app.domain.free_board.models import FreeBoard
+    from app.domain.job_posting.models import Applicants, JobPosting
+    from app.domain.resume.models import Resume, WorkExp
+    from app.domain.user.models import BaseUser, CorporateUser, SeekerUser
+
+    gen = Generator(config)
+    now, batch = gen.now, config.batch_size
+    bookmark = SeekerUser._meta.fields_map["interests_posting"]
+    tables = [
+        m._meta.db_table
+        for m in (BaseUser, CorporateUser, SeekerUser, JobPosting, Resume, WorkExp)
+    ] + [Applicants._meta.db_table, bookmark.through]
+    tables += [FreeBoard._meta.db_table, Comment._meta.db_table]
+
+    conn = Tortoise.get_connection("default")
+    await conn.execute_script(f"TRUNCATE {', '.join(tables)} RESTART IDENTITY CASCADE")
+
+    # 모든 계정이 같은 비밀번호 해시를 공유 (bcrypt 를 한 번만 계산)
+    password = bcrypt.hash(BENCH_PASSWORD)
+    user_count = 1 + config.corporates + config.seekers
+    await copy_model(BaseUser, gen.base_users(password), batch, now)
+
+    company_names = []
+
+    def corporates():
+        for row in gen.corporate_users():
+            company_names.append(row["company_name"])
+            yield row
+
+    await copy_model(CorporateUser, corporates(), batch, now)
+    await copy_model(SeekerUser, gen.seeker_users(), batch, now)
+    await copy_model(JobPosting, gen.job_postings(company_names), batch, now)
+
+    resume_owner: List[int] = []
+
+    def resumes():
+        for row, seeker_id in gen.resumes():
+            resume_owner.append(seeker_id)
+            yield row
+
+    await copy_model(Resume, resumes(), batch, now)
+    await copy_model(WorkExp, gen.work_exps(len(resume_owner)), batch, now)
+
+    postings = ZipfSampler(config.postings, config.posting_skew, gen.rng)
+    seeker_base = 1 + config.corporates
+    await copy_model(
+        Applicants,
+        gen.applicants(
+            postings, resume_owner, lambda seeker_id: seeker_base + seeker_id
+        ),
+        batch,
+        now,
+    )
+    await copy_rows(
+        bookmark.through,
+        [bookmark.backward_key, bookmark.forward_key],
+        gen.bookmarks(postings),
+        batch,
+    )
+
+    # 댓글이 달릴 게시글을 먼저 뽑아서 free_boards.comment_count 를 맞춘다
+    board_ids = ZipfSampler(config.free_boards, config.comment_skew, gen.rng).sample(
+        int(config.free_boards * config.comments_per_free_board)
+    )
+    await copy_model(
+        FreeBoard, gen.free_boards(Counter(board_ids), user_count), batch, now
+    )
+    await copy_model(Comment, gen.comments(board_ids, user_count), batch, now)
+
+    for table in tables:
+        if table == bookmark.through:
+            continue
+        await conn.execute_script(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f'(SELECT COALESCE(MAX(id), 0) + 1 FROM "{table}"), false)'
+        )
+    await conn.execute_script(f"ANALYZE {', '.join(tables)}")
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    defaults = DatasetConfig()
+    parser = argparse.ArgumentParser(description="대용량 합성 데이터 생성")
+    parser.add_argument("--postings", type=int, default=defaults.postings)
+    parser.add_argument("--corporates", type=int, help="기본: 공고 수 / 20")
+    parser.add_argument("--seekers", type=int, help="기본: 공고 수 / 2")
+    parser.add_argument("--free-boards", type=int, help="기본: 구직자 수 / 5")
+    parser.add_argument("--resumes-per-seeker", type=float)
+    parser.add_argument("--work-exps-per-resume", type=float)
+    parser.add_argument("--applicants-per-posting", type=float)
+    parser.add_argument("--bookmarks-per-seeker", type=float)
+    parser.add_argument("--comments-per-free-board", type=float)
+    parser.add_argument("--posting-skew", type=float, help="공고별 지원/북마크 쏠림 (Zipf 지수)")
+    parser.add_argument("--bookmark-skew", type=float, help="구직자별 북마크 쏠림")
+    parser.add_argument("--comment-skew", type=float, help="게시글별 댓글 쏠림")
+    parser.add_argument("--days", type=int, help="created_at 분포 기간(일)")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--batch-size", type=int)
+    return parser.parse_args(argv)
+
+
+async def run(config: DatasetConfig):
+    from app.core.config import TORTOISE_ORM
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        await Tortoise.generate_schemas(safe=True)
+        start = time.perf_counter()
+        await generate(config)
+        print(f"완료: {time.perf_counter() - start:.1f}s")
+    finally:
+        await Tortoise.close_connections()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    apply_bench_env()
+    overrides = {k: v for k, v in vars(args).items() if k != "postings"}
+    config = DatasetConfig.for_postings(args.postings, **overrides)
+    asyncio.run(run(config))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+import os
+
+# docker-compose.bench.yml 의 DB/Redis 기준 기본값 (이미 설정된 환경 변수가 우선)
+BENCH_ENV = {
+    "ENV": "bench",
+    "POSTGRES_DB": "bench",
+    "POSTGRES_USER": "postgres",
+    "POSTGRES_PASSWORD": "1q2w3e4r",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "55432",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "56379",
+    "SECRET_KEY": "bench_secret_key",
+    "LOOP_MONITOR_ENABLED": "false",
+    # 외부 연동은 부하 테스트에서 호출하지 않으므로 더미 값
+    "SMTP_USER": "bench",
+    "SMTP_PASSWORD": "bench",
+    "SMTP_SERVER": "localhost",
+    "SMTP_PORT": "587",
+    "BIZINFO_API_KEY": "bench",
+    "AWS_ACCESS_KEY_ID": "bench",
+    "AWS_SECRET_ACCESS_KEY": "bench",
+    "AWS_REGION": "ap-northeast-2",
+    "S3_BUCKET_NAME": "bench",
+    "URL_SCHEME": "http",
+    "DOMAIN": "localhost:8000",
+    "KAKAO_CLIENT_ID": "bench",
+    "KAKAO_REDIRECT_URI": "http://localhost:8000/callback",
+    "KAKAO_CLIENT_SECRET": "bench",
+    "NAVER_CLIENT_ID": "bench",
+    "NAVER_CLIENT_SECRET": "bench",
+    "NAVER_REDIRECT_URI": "http://localhost:8000/callback",
+    "NAVER_STATE": "bench",
+}
+
+
+def apply_bench_env():
+    """app 설정은 import 시점에 만들어지므로 app 모듈을 import 하기 전에 호출해야 한다"""
+    for key, value in BENCH_ENV.items():
+        os.environ.setdefault(key, value)
@@ -0,0 +1,247 @@
+"""
+API 부하 테스트.
+
+    docker compose -f docker-compose.bench.yml up -d
+    python -m benchmarks.load_test --duration 60 --concurrency 32
+    python -m benchmarks.load_test --update-baseline   # 현재 결과를 기준으로 저장
+
+시드 데이터를 넣고 uvicorn 을 띄운 뒤 시나리오 비율대로 요청을 보내고,
+엔드포인트별 처리량/지연 백분위를 기준 결과와 비교해 회귀가 있으면 종료 코드 1 로 끝난다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+from benchmarks.env import apply_bench_env
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "load_test.json"
+NOISE_FLOOR_MS = 5.0  # 이보다 작은 지연 증가는 회귀로 보지 않음
+MAX_ERROR_RATE_INCREASE = 0.01
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(q / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def summarize(recorder, elapsed: float) -> Dict[str, dict]:
+    summary = {}
+    for name, stats in sorted(recorder.stats.items()):
+        values = sorted(stats.latencies)
+        summary[name] = {
+            "count": len(values),
+            "rps": round(len(values) / elapsed, 2),
+            "p50": round(percentile(values, 50), 2),
+            "p95": round(percentile(values, 95), 2),
+            "p99": round(percentile(values, 99), 2),
+            "max": round(values[-1], 2) if values else 0.0,
+            "error_rate": round(stats.errors / len(values), 4) if values else 0.0,
+        }
+    return summary
+
+
+def compare_with_baseline(
+    summary: Dict[str, dict], baseline: Dict[str, dict], tolerance: float
+) -> List[str]:
+    """기준 대비 p95 지연 증가, 처리량 감소, 오류율 증가를 회귀로 보고한다"""
+    regressions = []
+    for name, base in baseline.items():
+        current = summary.get(name)
+        if current is None:
+            regressions.append(f"{name}: 측정 결과 없음")
+            continue
+        p95_limit = max(base["p95"] * (1 + tolerance), base["p95"] + NOISE_FLOOR_MS)
+        if current["p95"] > p95_limit:
+            regressions.append(
+                f"{name}: p95 {base['p95']}ms -> {current['p95']}ms (허용 {p95_limit:.1f}ms)"
+            )
+        if current["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: 처리량 {base['rps']} -> {current['rps']} req/s")
+        if current["error_rate"] > base["error_rate"] + MAX_ERROR_RATE_INCREASE:
+            regressions.append(
+                f"{name}: 오류율 {base['error_rate']:.2%} -> {current['error_rate']:.2%}"
+            )
+    return regressions
+
+
+def print_summary(summary: Dict[str, dict]):
+    header = f"{'endpoint':<50} {'count':>7} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'err%':>6}"
+    print(header)
+    print("-" * len(header))
+    for name, s in summary.items():
+        print(
+            f"{name:<50} {s['count']:>7} {s['rps']:>8.1f} {s['p50']:>8.1f} "
+            f"{s['p95']:>8.1f} {s['p99']:>8.1f} {s['max']:>8.1f} {s['error_rate'] * 100:>6.2f}"
+        )
+
+
+def start_server(host: str, port: int, workers: int, log) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            host,
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        env=os.environ.copy(),
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+
+
+async def wait_until_ready(base_url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as http:
+        while time.monotonic() < deadline:
+            try:
+                if (await http.get("/metrics")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    raise RuntimeError(f"서버가 {timeout}초 안에 준비되지 않았습니다: {base_url}")
+
+
+async def run_load(args, data, scenarios) -> Dict[str, dict]:
+    from benchmarks.scenarios import BenchClient, Recorder
+
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=args.concurrency)
+    weights = [s.weight for s in scenarios]
+    ws_url = args.base_url.replace("http", "ws", 1)
+
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=30.0
+    ) as http:
+
+        async def virtual_user(index: int, deadline: float):
+            rng = random.Random(args.seed + index)
+            client = BenchClient(http, ws_url, recorder)
+            while time.monotonic() < deadline:
+                scenario = rng.choices(scenarios, weights=weights)[0]
+                await scenario.run(client, data, rng)
+
+        deadline = time.monotonic() + args.warmup + args.duration
+        users = [
+            asyncio.create_task(virtual_user(i, deadline))
+            for i in range(args.concurrency)
+        ]
+        await asyncio.sleep(args.warmup)
+        recorder.active = True
+        started = time.monotonic()
+        await asyncio.gather(*users)
+        elapsed = time.monotonic() - started
+
+    return summarize(recorder, elapsed)
+
+
+async def prepare_data(args):
+    from tortoise import Tortoise
+
+    from benchmarks.seed import init_db, load_seed_data, seed
+
+    await init_db()
+    try:
+        if not args.skip_seed:
+            print(f"시드 데이터 생성 중 (scale={args.scale})...")
+            await seed(args.scale, args.seed)
+        return await load_seed_data()
+    finally:
+        await Tortoise.close_connections()
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="API 부하 테스트")
+    parser.add_argument("--base-url", help="이미 떠 있는 서버에 부하를 줄 때 (미지정 시 직접 실행)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--server-log", type=Path, default=Path("bench_server.log"))
+    parser.add_argument("--duration", type=float, default=60, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=5, help="기록하지 않는 워밍업 시간(초)")
+    parser.add_argument("--concurrency", type=int, default=32, help="가상 사용자 수")
+    parser.add_argument("--scale", type=float, default=1.0, help="시드 데이터 배율")
+    parser.add_argument("--skip-seed", action="store_true")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        help="실행할 시나리오 (browse, login, corporate, chatbot, admin / 기본 전체)",
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 회귀 비율")
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    apply_bench_env()
+    from benchmarks.scenarios import SCENARIOS
+
+    scenarios = [SCENARIOS[name] for name in args.scenario or SCENARIOS]
+    data = asyncio.run(prepare_data(args))
+
+    server = None
+    if not args.base_url:
+        args.base_url = f"http://127.0.0.1:{args.port}"
+        # 앱 로그는 결과 표와 섞이지 않도록 파일로 분리
+        server = start_server(
+            "127.0.0.1", args.port, args.workers, args.server_log.open("w")
+        )
+    try:
+        asyncio.run(wait_until_ready(args.base_url))
+        print(
+            f"부하 테스트 시작: {', '.join(s.name for s in scenarios)} / "
+            f"동시 사용자 {args.concurrency} / {args.duration}초"
+        )
+        summary = asyncio.run(run_load(args, data, scenarios))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    print_summary(summary)
+    if args.output:
+        args.output.write_text(json.dumps(summary, ensure_ascii=False, indent=2))
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(summary, ensure_ascii=False, indent=2))
+        print(f"기준 결과 저장: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"기준 결과가 없어 비교를 건너뜁니다: {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare_with_baseline(summary, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"[REGRESSION] {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
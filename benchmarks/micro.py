@@ -0,0 +1,541 @@
+"""
+직렬화/쿼리 조립 핫패스 마이크로 벤치마크 (DB 불필요).
+
+    python -m benchmarks.micro
+    python -m benchmarks.micro --only posting_dto_page --update-baseline
+
+쿼리 결과와 같은 방식(_init_from_db)으로 만든 모델 인스턴스로 순수 CPU 비용만 잰다.
+Tortoise 는 초기화만 하고 연결하지 않으며, 경로 중간의 DB 호출은 미리 만든 결과로 대체한다.
+호출당 시간은 best-of-N 평균, 메모리는 tracemalloc 으로 호출당 최대 할당량(peak)과 잔존량을 잰다.
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from unittest.mock import patch
+
+from benchmarks.env import apply_bench_env
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "micro.json"
+MIN_REPEAT_SECONDS = 0.2
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class MicroBenchmark:
+    name: str
+    description: str
+    setup: Callable  # 측정할 함수를 yield 하는 contextmanager
+
+
+@dataclass
+class MicroResult:
+    mean_us: float  # 반복 묶음별 호출당 평균 중 최솟값
+    median_us: float
+    peak_kib: float  # 호출 한 번의 최대 할당량
+    retained_kib: float  # 호출 후 해제되지 않고 남은 양 (캐시/누수)
+
+
+BENCHMARKS: Dict[str, MicroBenchmark] = {}
+
+
+def micro_benchmark(name: str, description: str):
+    def decorator(setup):
+        BENCHMARKS[name] = MicroBenchmark(name, description, contextmanager(setup))
+        return setup
+
+    return decorator
+
+
+# ---------------------------------------------------------------- 모델 인스턴스
+
+
+def make_corporate(i: int):
+    from app.domain.user.models import CorporateUser
+
+    return CorporateUser._init_from_db(
+        id=i,
+        user_id=i + 1,
+        company_name=f"한빛시설관리{i}",
+        business_start_date=date(2000, 1, 1),
+        business_number=f"{1000000000 + i}",
+        company_description="시니어 인재를 우대합니다.",
+        manager_name="김민수",
+        manager_phone_number="010-1234-5678",
+        manager_email=f"manager{i}@senior-tomorrow.kr",
+        profile_url=None,
+    )
+
+
+def make_posting(i: int):
+    """select_related("user") 로 조회한 것과 같은 공고 인스턴스"""
+    from app.domain.job_posting.models import JobPosting
+
+    posting = JobPosting._init_from_db(
+        id=i,
+        user_id=i % 50 + 1,
+        company=f"한빛시설관리{i % 50}",
+        title=f"[강남구] 아파트 경비원 모집 - 주5일 #{i}",
+        location="서울특별시 강남구",
+        employment_type="일반",
+        employ_method="계약직",
+        work_time="격일제 24시간",
+        position="경비원",
+        history="관련 경력 우대",
+        recruitment_count=3,
+        education="학력무관",
+        deadline="2025-02-01",
+        salary="월 250만원",
+        summary="강남구 경비원, 시니어우대",
+        description="성실하고 책임감 있는 분을 기다립니다. " * 5,
+        status="모집중",
+        view_count=i * 7,
+        report=0,
+        career="경력무관",
+        image_url=None,
+        created_at=NOW - timedelta(hours=i),
+        updated_at=NOW - timedelta(hours=i),
+    )
+    setattr(posting, "_user", make_corporate(i % 50 + 1))
+    return posting
+
+
+def make_posting_row(i: int, fields=None) -> dict:
+    """get_postings_query 의 .values(...) 결과와 같은 공고 행"""
+    from app.domain.posting.repository import posting_columns
+    from app.domain.posting.schemas import JOB_POSTING_FIELDS
+
+    posting = make_posting(i)
+    columns = posting_columns(fields or JOB_POSTING_FIELDS.resolve(None))
+    return {column: getattr(posting, column) for column in columns}
+
+
+def make_resume(i: int):
+    from app.domain.resume.models import Resume
+
+    return Resume._init_from_db(
+        id=i,
+        user_id=i,
+        title="경비원 희망합니다",
+        visibility=True,
+        name="박영희",
+        phone_number="010-1111-2222",
+        email=f"seeker{i}@senior-tomorrow.kr",
+        image_url=None,
+        interests="경비원",
+        desired_area="서울특별시 강남구",
+        education="고졸",
+        school_name=None,
+        graduation_status=None,
+        introduce="성실하게 일하겠습니다.",
+        status="구직중",
+        document_url=None,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def make_applicant(i: int):
+    from app.domain.job_posting.models import Applicants
+
+    applicant = Applicants._init_from_db(
+        id=i,
+        job_posting_id=i,
+        resume_id=i,
+        user_id=i + 100,
+        status="지원 중",
+        memo=None,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+    setattr(applicant, "_job_posting", make_posting(i))
+    return applicant
+
+
+def make_user_union_row(i: int) -> dict:
+    """USER_UNION_SELECT 결과 행 (seeker/corp 가 번갈아 비어 있음)"""
+    from app.domain.admin.repositories.user_repository import (
+        BASE_USER_COLUMNS,
+        CORP_USER_COLUMNS,
+        SEEKER_USER_COLUMNS,
+    )
+
+    seeker = i % 2 == 0
+    base = {
+        "id": i,
+        "email": f"user{i}@senior-tomorrow.kr",
+        "user_type": "normal" if seeker else "business",
+        "signinMethod": "email",
+        "status": "active",
+        "email_verified": True,
+        "created_at": NOW,
+        "deleted_at": None,
+        "gender": "male",
+        "leave_reason": None,
+    }
+    seeker_row = {
+        "id": i,
+        "name": "박영희",
+        "phone_number": "010-1111-2222",
+        "birth": date(1958, 3, 1),
+        "interests": "경비원,미화원",
+        "purposes": "재취업",
+        "sources": "지인 추천",
+        "applied_posting": None,
+        "applied_posting_count": 3,
+        "status": "seeking",
+        "profile_url": None,
+    }
+    corp_row = {
+        "id": i,
+        "company_name": f"한빛시설관리{i}",
+        "business_start_date": datetime(2000, 1, 1),
+        "business_number": f"{1000000000 + i}",
+        "company_description": None,
+        "manager_name": "김민수",
+        "manager_phone_number": "010-1234-5678",
+        "manager_email": None,
+        "profile_url": None,
+    }
+    row = {f"base__{c}": base[c] for c in BASE_USER_COLUMNS}
+    row.update(
+        {f"seeker__{c}": seeker_row[c] if seeker else None for c in SEEKER_USER_COLUMNS}
+    )
+    row.update(
+        {f"corp__{c}": None if seeker else corp_row[c] for c in CORP_USER_COLUMNS}
+    )
+    return row
+
+
+# ---------------------------------------------------------------- 벤치마크
+
+
+@micro_benchmark("posting_dto_page", "get_postings_query: 공고 100행 DTO 변환 (행 복사 포함)")
+def posting_dto_page():
+    from app.domain.posting.repository import to_posting_dtos
+
+    rows = [make_posting_row(i) for i in range(1, 101)]
+    bookmarked_ids = [3, 17, 42]
+
+    def run():
+        return to_posting_dtos([dict(row) for row in rows], bookmarked_ids)
+
+    yield run
+
+
+def make_posting_page(fields=None):
+    from app.domain.posting.repository import to_posting_dtos
+    from app.domain.posting.schemas import (
+        JobPostingResponseDTO,
+        PaginatedJobPostingsResponseDTO,
+    )
+    from app.utils.fieldsets import partial_page_schema
+
+    rows = [make_posting_row(i, fields) for i in range(1, 101)]
+    page = partial_page_schema(
+        PaginatedJobPostingsResponseDTO,
+        JobPostingResponseDTO,
+        fields or tuple(JobPostingResponseDTO.model_fields),
+    )
+    return page.model_construct(
+        total=1000,
+        offset=0,
+        limit=100,
+        data=to_posting_dtos(rows, [3, 17, 42], fields),
+    )
+
+
+@micro_benchmark(
+    "posting_page_response", "공고 100건 페이지 응답: PrevalidatedJSONResponse 로 바로 인코딩"
+)
+def posting_page_response():
+    from app.core.responses import PrevalidatedJSONResponse
+
+    page = make_posting_page()
+
+    def run():
+        return PrevalidatedJSONResponse(page).body
+
+    yield run
+
+
+@micro_benchmark(
+    "posting_card_page_response", "공고 100건 페이지 응답: fields=card DTO 변환 + 인코딩"
+)
+def posting_card_page_response():
+    from app.core.responses import PrevalidatedJSONResponse
+    from app.domain.posting.repository import to_posting_dtos
+    from app.domain.posting.schemas import (
+        JOB_POSTING_FIELDS,
+        JobPostingResponseDTO,
+        PaginatedJobPostingsResponseDTO,
+    )
+    from app.utils.fieldsets import partial_page_schema
+
+    fields = JOB_POSTING_FIELDS.resolve("card")
+    rows = [make_posting_row(i, fields) for i in range(1, 101)]
+    page = partial_page_schema(
+        PaginatedJobPostingsResponseDTO, JobPostingResponseDTO, fields
+    )
+
+    def run():
+        data = to_posting_dtos([dict(row) for row in rows], [3, 17, 42], fields)
+        return PrevalidatedJSONResponse(
+            page.model_construct(total=1000, offset=0, limit=100, data=data)
+        ).body
+
+    yield run
+
+
+@micro_benchmark(
+    "posting_page_response_model",
+    "공고 100건 페이지 응답: response_model 재검증 + 표준 json 인코딩 (비교용)",
+)
+def posting_page_response_model():
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+
+    from app.domain.posting.schemas import PaginatedJobPostingsResponseDTO
+
+    page = make_posting_page()
+    field = create_model_field(
+        name="Response_get_list_postings", type_=PaginatedJobPostingsResponseDTO
+    )
+
+    async def run():
+        content = await serialize_response(field=field, response_content=page)
+        return JSONResponse(content).body
+
+    yield run
+
+
+@micro_benchmark(
+    "admin_user_union_page", "관리자 유저 목록: 10행 split_user_union_row + format_user_union"
+)
+def admin_user_union_page():
+    from app.domain.admin.repositories.user_repository import split_user_union_row
+    from app.domain.admin.services.user_services import format_user_union
+
+    rows = [make_user_union_row(i) for i in range(1, 11)]
+
+    def run():
+        return [format_user_union(split_user_union_row(row)) for row in rows]
+
+    yield run
+
+
+class PrebuiltResumeQuery:
+    """Resume.filter(...).first() 를 DB 없이 미리 만든 이력서로 대체"""
+
+    def __init__(self, resume):
+        self.resume = resume
+
+    def filter(self, **kwargs):
+        return self
+
+    async def first(self):
+        return self.resume
+
+
+@micro_benchmark(
+    "format_applicant_response", "지원자 목록: 20건 format_applicant_response (이력서 조회 제외)"
+)
+def format_applicant_page():
+    from app.domain.applicant.utils import format_applicant_response
+
+    applicants = [make_applicant(i) for i in range(1, 21)]
+    with patch(
+        "app.domain.applicant.utils.Resume", PrebuiltResumeQuery(make_resume(1))
+    ):
+
+        async def run():
+            return [await format_applicant_response(a) for a in applicants]
+
+        yield run
+
+
+async def compile_only_read(fn):
+    """run_read 대체: 쿼리를 SQL 까지 조립만 하고 빈 결과를 돌려준다"""
+    from tortoise import Tortoise
+    from tortoise.queryset import CountQuery
+
+    query = fn(Tortoise.get_connection("default"))
+    query.sql()
+    return 0 if isinstance(query, CountQuery) else []
+
+
+@micro_benchmark(
+    "postings_filter_parsing", "get_all_postings_service: 필터 검증/파싱 + 쿼리 조립(SQL 생성)"
+)
+def postings_filter_parsing():
+    from app.domain.posting.services import get_all_postings_service
+
+    with patch("app.domain.posting.repository.run_read", compile_only_read):
+
+        async def run():
+            return await get_all_postings_service(
+                search_keyword="경비",
+                location="서울,경기",
+                employment_type="공공,일반",
+                position="경비원,미화원,주차관리원",
+                career="신입,경력무관",
+                education="학력무관",
+                view_count=10,
+                employ_method="정규직,계약직",
+                offset=2,
+                limit=20,
+            )
+
+        yield run
+
+
+# ---------------------------------------------------------------- 측정
+
+
+async def _call(fn):
+    result = fn()
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def _timed(fn, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        await _call(fn)
+    return time.perf_counter() - start
+
+
+async def measure(fn, repeat: int = 5) -> MicroResult:
+    # 워밍업 + 한 묶음이 MIN_REPEAT_SECONDS 이상 걸리도록 반복 횟수 보정
+    number = 1
+    while (elapsed := await _timed(fn, number)) < MIN_REPEAT_SECONDS:
+        number *= 2 if elapsed == 0 else max(2, int(MIN_REPEAT_SECONDS / elapsed))
+    per_call = [await _timed(fn, number) / number for _ in range(repeat)]
+
+    tracemalloc.start()
+    try:
+        await _call(fn)
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = await _call(fn)
+        peak = tracemalloc.get_traced_memory()[1]
+        del result
+        current = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return MicroResult(
+        mean_us=round(min(per_call) * 1e6, 2),
+        median_us=round(statistics.median(per_call) * 1e6, 2),
+        peak_kib=round((peak - before) / 1024, 1),
+        retained_kib=round((current - before) / 1024, 1),
+    )
+
+
+def compare_with_baseline(
+    results: Dict[str, MicroResult],
+    baseline: Dict[str, dict],
+    time_tolerance: float,
+    alloc_tolerance: float,
+) -> List[str]:
+    """기준 대비 호출당 시간/최대 할당량 증가를 회귀로 보고한다"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result.mean_us > base["mean_us"] * (1 + time_tolerance):
+            regressions.append(f"{name}: 시간 {base['mean_us']}us -> {result.mean_us}us")
+        if result.peak_kib > base["peak_kib"] * (1 + alloc_tolerance):
+            regressions.append(
+                f"{name}: 할당 {base['peak_kib']}KiB -> {result.peak_kib}KiB"
+            )
+    return regressions
+
+
+async def run_all(names: List[str]) -> Dict[str, MicroResult]:
+    from tortoise import Tortoise
+
+    from app.core.config import TORTOISE_ORM
+
+    # 연결은 첫 쿼리 때 맺어지므로 초기화만 하면 DB 없이 쿼리 조립/모델 생성이 가능
+    await Tortoise.init(config=TORTOISE_ORM)
+    results = {}
+    try:
+        for name in names:
+            with BENCHMARKS[name].setup() as fn:
+                results[name] = await measure(fn)
+    finally:
+        await Tortoise.close_connections()
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="핫패스 마이크로 벤치마크")
+    parser.add_argument("--only", action="append", help="실행할 벤치마크 이름")
+    parser.add_argument("--list", action="store_true", help="벤치마크 목록 출력")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--time-tolerance", type=float, default=0.25)
+    parser.add_argument("--alloc-tolerance", type=float, default=0.10)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.list:
+        for bench in BENCHMARKS.values():
+            print(f"{bench.name:<28} {bench.description}")
+        return 0
+
+    apply_bench_env()
+    results = asyncio.run(run_all(args.only or list(BENCHMARKS)))
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+
+    print(
+        f"{'benchmark':<28} {'mean_us':>10} {'median_us':>10} {'peak_kib':>9} {'retained':>9} {'vs base':>8}"
+    )
+    for name, r in results.items():
+        base = baseline.get(name)
+        delta = f"{r.mean_us / base['mean_us'] - 1:+.0%}" if base else "-"
+        print(
+            f"{name:<28} {r.mean_us:>10.1f} {r.median_us:>10.1f} "
+            f"{r.peak_kib:>9.1f} {r.retained_kib:>9.1f} {delta:>8}"
+        )
+
+    if args.update_baseline:
+        baseline.update({name: asdict(r) for name, r in results.items()})
+        baseline["_meta"] = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        }
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(
+            json.dumps(baseline, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+        )
+        print(f"기준 결과 저장: {args.baseline}")
+        return 0
+
+    regressions = compare_with_baseline(
+        results, baseline, args.time_tolerance, args.alloc_tolerance
+    )
+    for regression in regressions:
+        print(f"[REGRESSION] {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
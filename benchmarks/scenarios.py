@@ -0,0 +1,198 @@
+"""
+부하 테스트 시나리오. 각 시나리오는 가상 사용자 한 명의 한 번의 방문(반복 단위)이며,
+요청마다 라우트 템플릿 이름으로 지연 시간을 기록한다.
+"""
+
+import json
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from websockets.asyncio.client import connect
+
+from benchmarks.seed import BENCH_PASSWORD, SeedData
+
+SEARCH_KEYWORDS = ["경비", "미화", "요양", "조리", "운전", "사무", "주차", "택배"]
+SEARCH_LOCATIONS = ["서울", "부산", "대구", "인천", "경기"]
+CAREERS = ["신입", "경력직", "경력무관"]
+
+
+@dataclass
+class EndpointStats:
+    latencies: List[float] = field(default_factory=list)  # ms
+    errors: int = 0
+
+
+class Recorder:
+    def __init__(self):
+        self.stats: Dict[str, EndpointStats] = defaultdict(EndpointStats)
+        self.active = False  # 워밍업 동안은 기록하지 않음
+
+    def record(self, name: str, elapsed: float, ok: bool):
+        if not self.active:
+            return
+        stats = self.stats[name]
+        stats.latencies.append(elapsed * 1000)
+        if not ok:
+            stats.errors += 1
+
+
+class BenchClient:
+    def __init__(self, http: httpx.AsyncClient, ws_url: str, recorder: Recorder):
+        self.http = http
+        self.ws_url = ws_url
+        self.recorder = recorder
+        self._tokens: Dict[str, str] = {}
+
+    async def request(
+        self,
+        name: str,
+        method: str,
+        url: str,
+        expected: tuple = (200,),
+        token: Optional[str] = None,
+        **kwargs,
+    ) -> Optional[httpx.Response]:
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        start = time.perf_counter()
+        try:
+            response = await self.http.request(method, url, headers=headers, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(name, time.perf_counter() - start, ok=False)
+            return None
+        self.recorder.record(
+            name, time.perf_counter() - start, ok=response.status_code in expected
+        )
+        return response
+
+    async def login(self, email: str) -> Optional[str]:
+        response = await self.request(
+            "POST /api/user/login/",
+            "POST",
+            "/api/user/login/",
+            json={"email": email, "password": BENCH_PASSWORD},
+        )
+        if response is None or response.status_code != 200:
+            return None
+        return response.json()["access_token"]
+
+    async def token_for(self, email: str) -> Optional[str]:
+        """로그인 폭주 시나리오 외에는 계정별로 한 번만 로그인해서 토큰을 재사용"""
+        if email not in self._tokens:
+            token = await self.login(email)
+            if token is None:
+                return None
+            self._tokens[email] = token
+        return self._tokens[email]
+
+
+async def anonymous_browse(client: BenchClient, data: SeedData, rng: random.Random):
+    params = {"offset": rng.randint(0, 20), "limit": 10}
+    if rng.random() < 0.5:
+        params["search_keyword"] = rng.choice(SEARCH_KEYWORDS)
+    if rng.random() < 0.3:
+        params["location"] = rng.choice(SEARCH_LOCATIONS)
+    if rng.random() < 0.2:
+        params["career"] = rng.choice(CAREERS)
+    await client.request("GET /api/postings/", "GET", "/api/postings/", params=params)
+
+    for posting_id in rng.sample(data.posting_ids, k=rng.randint(1, 3)):
+        await client.request(
+            "GET /api/postings/{id}/", "GET", f"/api/postings/{posting_id}/"
+        )
+
+
+async def login_storm(client: BenchClient, data: SeedData, rng: random.Random):
+    await client.login(rng.choice(data.seeker_emails))
+
+
+async def corporate_review(client: BenchClient, data: SeedData, rng: random.Random):
+    email = rng.choice(data.corporate_emails)
+    token = await client.token_for(email)
+    if token is None:
+        return
+    await client.request(
+        "GET /api/applicants/corporate/",
+        "GET",
+        "/api/applicants/corporate/",
+        token=token,
+    )
+    posting_id = rng.choice(data.corporate_postings[email])
+    await client.request(
+        "GET /api/applicants/corporate/{job_posting_id}/",
+        "GET",
+        f"/api/applicants/corporate/{posting_id}/",
+        token=token,
+    )
+
+
+async def chatbot_session(client: BenchClient, data: SeedData, rng: random.Random):
+    selections = rng.choice(data.chatbot_paths)
+    session_start = time.perf_counter()
+    ok = True
+    try:
+        async with connect(client.ws_url + "/api/ws/") as ws:
+            for selection in selections:
+                start = time.perf_counter()
+                await ws.send(selection)
+                message = json.loads(await ws.recv())
+                step_ok = "code" not in message
+                ok = ok and step_ok
+                client.recorder.record(
+                    "WS /api/ws/ message", time.perf_counter() - start, ok=step_ok
+                )
+    except Exception:
+        ok = False
+    client.recorder.record(
+        "WS /api/ws/ session", time.perf_counter() - session_start, ok=ok
+    )
+
+
+async def admin_lists(client: BenchClient, data: SeedData, rng: random.Random):
+    token = await client.token_for(data.admin_email)
+    if token is None:
+        return
+    seeker = rng.random() < 0.5
+    await client.request(
+        "GET /api/admin/user/",
+        "GET",
+        "/api/admin/user/",
+        token=token,
+        params={"offset": rng.randint(0, 10), "seeker": seeker, "corp": not seeker},
+    )
+    await client.request(
+        "GET /api/admin/job-posting/",
+        "GET",
+        "/api/admin/job-posting/",
+        token=token,
+        params={"status": rng.choice(["모집중", "마감 임박", "모집 종료"])},
+    )
+    await client.request(
+        "GET /api/admin/chatbot/", "GET", "/api/admin/chatbot/", token=token
+    )
+    await client.request(
+        "GET /api/admin/dashboard/", "GET", "/api/admin/dashboard/", token=token
+    )
+
+
+@dataclass
+class Scenario:
+    name: str
+    weight: int
+    run: Callable[[BenchClient, SeedData, random.Random], Awaitable[None]]
+
+
+# 실제 트래픽 비율을 흉내 낸 기본 가중치
+SCENARIOS = {
+    s.name: s
+    for s in [
+        Scenario("browse", 60, anonymous_browse),
+        Scenario("login", 10, login_storm),
+        Scenario("corporate", 10, corporate_review),
+        Scenario("chatbot", 10, chatbot_session),
+        Scenario("admin", 10, admin_lists),
+    ]
+}
@@ -0,0 +1,107 @@
+"""
+부하 테스트용 시드 데이터.
+사용자/공고/이력서/지원자는 benchmarks.datagen 으로 만들고 웹소켓 챗봇 선택지 트리만 따로 넣는다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from tortoise import Tortoise
+
+from app.core.config import TORTOISE_ORM
+from app.domain.chatbot.model import ChatBot
+from app.domain.job_posting.models import Applicants, JobPosting
+from app.domain.user.models import BaseUser
+from benchmarks.datagen import BENCH_PASSWORD, EMAIL_DOMAIN, DatasetConfig, generate
+
+SEED_POSTINGS = 2000  # scale=1 기준 공고 수
+
+# 웹소켓 챗봇 선택지 트리: 경로 -> (답변, 하위 선택지)
+CHATBOT_TREE = {
+    "": ("무엇을 도와드릴까요?", ["구직", "구인", "기타"]),
+    "구직": ("구직 관련 메뉴입니다.", ["공고찾기", "이력서"]),
+    "구인": ("구인 관련 메뉴입니다.", ["공고등록", "지원자관리"]),
+    "기타": ("기타 문의입니다.", ["고객센터"]),
+}
+
+
+@dataclass
+class SeedData:
+    seeker_emails: List[str]
+    corporate_emails: List[str]
+    admin_email: str
+    posting_ids: List[int]
+    # 기업 이메일 -> 지원자가 있는 자기 공고 id
+    corporate_postings: Dict[str, List[int]] = field(default_factory=dict)
+    chatbot_paths: List[List[str]] = field(default_factory=list)
+
+
+async def init_db():
+    await Tortoise.init(config=TORTOISE_ORM)
+    await Tortoise.generate_schemas(safe=True)
+
+
+async def seed_chatbot():
+    await ChatBot.all().delete()
+    chatbots = []
+    for path, (answer, options) in CHATBOT_TREE.items():
+        step = path.count("/") + 1 if path else 0
+        chatbots.append(
+            ChatBot(
+                step=step,
+                selection_path=path,
+                answer=answer,
+                options=",".join(options),
+            )
+        )
+        for option in options:
+            leaf = f"{path}/{option}" if path else option
+            if leaf not in CHATBOT_TREE:
+                chatbots.append(
+                    ChatBot(
+                        step=step + 1,
+                        selection_path=leaf,
+                        answer=f"{option} 안내 페이지로 이동합니다.",
+                        is_terminate=True,
+                        url="/",
+                    )
+                )
+    await ChatBot.bulk_create(chatbots)
+
+
+async def seed(scale: float = 1.0, seed_value: int = 42):
+    config = DatasetConfig.for_postings(
+        max(int(SEED_POSTINGS * scale), 1), seed=seed_value
+    )
+    await generate(config)
+    await seed_chatbot()
+
+
+async def load_seed_data() -> SeedData:
+    """시드된 DB 에서 시나리오가 사용할 계정/공고 목록을 읽는다 (--skip-seed 시에도 사용)"""
+    users = await BaseUser.filter(email__endswith=f"@{EMAIL_DOMAIN}").values_list(
+        "email", "user_type"
+    )
+    rows = await Applicants.all().values_list(
+        "job_posting_id", "job_posting__user__user__email"
+    )
+    corporate_postings: Dict[str, List[int]] = {}
+    for posting_id, email in rows:
+        corporate_postings.setdefault(email, [])
+        if posting_id not in corporate_postings[email]:
+            corporate_postings[email].append(posting_id)
+
+    chatbot_paths = [
+        ["", *path.split("/")]
+        for path in await ChatBot.filter(is_terminate=True).values_list(
+            "selection_path", flat=True
+        )
+    ]
+    return SeedData(
+        seeker_emails=[email for email, t in users if t == "normal"],
+        corporate_emails=list(corporate_postings),
+        admin_email=next(email for email, t in users if t == "admin"),
+        posting_ids=await JobPosting.all().values_list("id", flat=True),
+        corporate_postings=corporate_postings,
+        chatbot_paths=chatbot_paths,
+    )